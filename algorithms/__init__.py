@@ -5,5 +5,12 @@ DFS, BFS 등 탐색 알고리즘 구현
 
 from .dfs import DFS
 from .bfs import BFS
+from .trace import SearchTrace, SearchTimeline, StepRecord, StepAction, StepSnapshot
+from .csr import CSRGraph, IdArrayView
+from .bitset import VisitedBitset
+from .level_sync import level_synchronous_bfs
+from .parallel_bfs import parallel_level_synchronous_bfs
 
-__all__ = ['DFS', 'BFS'] 
\ No newline at end of file
+__all__ = ['DFS', 'BFS', 'SearchTrace', 'SearchTimeline', 'StepRecord', 'StepAction',
+           'StepSnapshot', 'CSRGraph', 'IdArrayView', 'VisitedBitset', 'level_synchronous_bfs',
+           'parallel_level_synchronous_bfs'] 
\ No newline at end of file
@@ -3,8 +3,17 @@ BFS (너비 우선 탐색) 알고리즘 구현
 """
 
 import networkx as nx
+import numpy as np
 from collections import deque
-from typing import List, Set, Dict, Optional, Generator, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Generator, Tuple, Iterable, Union, AbstractSet
+
+from .bitset import VisitedBitset
+from .csr import CSRGraph, IdArrayView
+from .level_sync import level_synchronous_bfs
+from .parallel_bfs import parallel_level_synchronous_bfs
+from .neighbor_index import NeighborIndex
+from .trace import SearchTrace, StepRecord, StepAction, build_step, intern_node, as_sources, as_targets
 
 
 class BFS:
@@ -15,46 +24,108 @@ class BFS:
         BFS 초기화
         
         Args:
-            graph: NetworkX 그래프
+            graph: NetworkX 그래프 또는 CSRGraph 스냅샷
         """
         self.graph = graph
+        # CSR 스냅샷은 이미 행이 정렬되어 있으므로 그대로 인덱스로 사용
+        if isinstance(graph, CSRGraph):
+            self.neighbor_index = graph
+        else:
+            self.neighbor_index = NeighborIndex.for_graph(graph)
         self.reset()
     
     def reset(self):
         """알고리즘 상태 초기화"""
-        self.visited: Set[str] = set()
+        # CSR 스냅샷에서는 비트셋, 그 외에는 set (is_node_visited 등은 그대로 동작)
+        self.visited: AbstractSet[str] = self._new_visited()
         self.visit_order: List[str] = []
         self.queue: deque = deque()
         self.parent: Dict[str, Optional[str]] = {}
         self.level: Dict[str, int] = {}
+        # 각 노드를 처음 발견한 (가장 가까운) 시작 노드
+        self.source: Dict[str, str] = {}
         self.steps: List[Dict] = []
+        self.trace: Optional[SearchTrace] = None
+        # 목표 노드들과 각 목표를 발견한 단계 번호
+        self.targets: List[str] = []
+        self.target_steps: Dict[str, int] = {}
+        # 양방향 탐색에서 목표 노드 쪽 상태
+        self.backward_queue: deque = deque()
+        self.backward_parent: Dict[str, Optional[str]] = {}
+        self.backward_level: Dict[str, int] = {}
+        self.meeting_edge: Optional[Tuple[str, str]] = None
+        # 조회용 인덱스 (visit_rank, level_buckets 참고)
+        self._visit_rank: Dict[str, int] = {}
+        self._level_buckets: Dict[int, List[str]] = {}
+        self._bucketed_levels = 0
         self.current_step = 0
         self.is_complete = False
     
-    def search(self, start_node: str, target_node: Optional[str] = None) -> Generator[Dict, None, None]:
+    def _new_visited(self) -> AbstractSet[str]:
+        """빈 방문 집합 생성 (CSR 스냅샷이면 노드당 1비트인 비트셋)"""
+        if isinstance(self.graph, CSRGraph):
+            return VisitedBitset(self.graph)
+        return set()
+    
+    def search(self, start_node: Union[str, Iterable[str]],
+               target_node: Union[str, Iterable[str], None] = None) -> Generator[Dict, None, None]:
         """
         BFS 탐색 실행 (제너레이터로 단계별 실행)
         
+        각 단계마다 전체 상태를 복사한 딕셔너리를 생성하는 호환용 뷰입니다.
+        큰 그래프에서는 search_deltas()를 사용하세요.
+        
         Args:
-            start_node: 시작 노드
-            target_node: 목표 노드 (None이면 전체 탐색)
+            start_node: 시작 노드 또는 시작 노드 컬렉션 (다중 시작점)
+            target_node: 목표 노드 또는 목표 노드 컬렉션 (None이면 전체 탐색, 모두 찾으면 종료)
             
         Yields:
             각 단계의 상태 정보
         """
+        for delta in self.search_deltas(start_node, target_node):
+            if delta.action is StepAction.ERROR:
+                yield build_step('BFS', delta, self.visited, self.visit_order, [])
+                return
+            
+            step_info = build_step('BFS', delta, self.visited, self.visit_order,
+                                   self.queue, self.level)
+            self.steps.append(step_info)
+            yield step_info
+    
+    def search_deltas(self, start_node: Union[str, Iterable[str]],
+                      target_node: Union[str, Iterable[str], None] = None,
+                      trace: Optional[SearchTrace] = None) -> Generator[StepRecord, None, None]:
+        """
+        BFS 탐색 실행 (단계별 변경 내용만 생성)
+        
+        단계 기록은 self.trace에 저장되며, 전체 상태는 self.trace[i]로 재구성할 수 있습니다.
+        메시지는 기록에 저장하지 않고 표시할 때 StepRecord.message로 생성합니다.
+        
+        Args:
+            start_node: 시작 노드 또는 시작 노드 컬렉션 (다중 시작점)
+            target_node: 목표 노드 또는 목표 노드 컬렉션 (None이면 전체 탐색, 모두 찾으면 종료)
+            trace: 단계를 기록할 빈 기록 (예: GUI의 SearchTimeline, 같은 델타를 따로 보관하지
+                   않도록 self.trace로 그대로 사용하며 None이면 새 SearchTrace 생성)
+            
+        Yields:
+            각 단계의 StepRecord (시작 노드가 없으면 StepAction.ERROR 기록 하나)
+        """
         self.reset()
         
-        if start_node not in self.graph:
-            yield {
-                'error': f"시작 노드 '{start_node}'가 그래프에 존재하지 않습니다."
-            }
+        sources = as_sources(start_node, self.graph)
+        missing = self._find_missing(sources)
+        if missing is not None:
+            yield StepRecord(0, StepAction.ERROR, missing)
             return
         
-        # 큐에 시작 노드 추가
-        self.queue.append(start_node)
-        self.visited.add(start_node)
-        self.parent[start_node] = None
-        self.level[start_node] = 0
+        if trace is None:
+            trace = SearchTrace('BFS', sources, visited_factory=self._new_visited)
+        self.trace = trace
+        self.targets = as_targets(target_node, self.graph)
+        remaining = set(self.targets)
+        
+        # 큐에 시작 노드(들) 추가
+        self._seed(sources)
         
         step_count = 0
         
@@ -65,78 +136,407 @@ class BFS:
             current_node = self.queue.popleft()
             self.visit_order.append(current_node)
             
-            # 현재 단계 정보 저장
-            step_info = {
-                'step': step_count,
-                'action': 'visit',
-                'current_node': current_node,
-                'visited': self.visited.copy(),
-                'visit_order': self.visit_order.copy(),
-                'queue': list(self.queue),
-                'level': self.level.copy(),
-                'message': f"노드 '{current_node}' 방문 (레벨: {self.level[current_node]})",
-                'found_target': False
-            }
+            found_target = current_node in remaining
+            if found_target:
+                remaining.discard(current_node)
+                self.target_steps[current_node] = step_count
+            delta = StepRecord(step_count, StepAction.VISIT, intern_node(current_node),
+                               popped=1, found_target=found_target,
+                               level=self.level[current_node])
+            self.trace.append(delta)
+            yield delta
             
-            # 목표 노드를 찾은 경우
-            if target_node and current_node == target_node:
-                step_info['found_target'] = True
-                step_info['message'] = f"목표 노드 '{target_node}' 발견! (레벨: {self.level[current_node]})"
-                self.steps.append(step_info)
-                yield step_info
+            # 목표 노드를 모두 찾은 경우
+            if found_target and not remaining:
                 self.is_complete = True
                 return
             
-            self.steps.append(step_info)
-            yield step_info
-            
-            # 인접한 노드들을 큐에 추가
-            neighbors = list(self.graph.neighbors(current_node))
-            neighbors.sort()  # 알파벳 순서로 정렬
-            
+            # 인접한 노드들을 큐에 추가 (알파벳 순서, 정렬 결과는 인덱스에 캐시됨)
             added_neighbors = []
-            for neighbor in neighbors:
+            for neighbor in self.neighbor_index.ascending(current_node):
                 if neighbor not in self.visited:
                     self.visited.add(neighbor)
                     self.parent[neighbor] = current_node
                     self.level[neighbor] = self.level[current_node] + 1
+                    self.source[neighbor] = self.source[current_node]
                     self.queue.append(neighbor)
                     added_neighbors.append(neighbor)
             
             # 큐 업데이트 단계
             if added_neighbors:
                 step_count += 1
-                queue_info = {
-                    'step': step_count,
-                    'action': 'queue_update',
-                    'current_node': current_node,
-                    'visited': self.visited.copy(),
-                    'visit_order': self.visit_order.copy(),
-                    'queue': list(self.queue),
-                    'level': self.level.copy(),
-                    'message': f"큐에 인접 노드들 추가: {added_neighbors}",
-                    'found_target': False,
-                    'added_neighbors': added_neighbors
-                }
-                self.steps.append(queue_info)
-                yield queue_info
+                delta = StepRecord(step_count, StepAction.QUEUE_UPDATE, intern_node(current_node),
+                                   tuple(map(intern_node, added_neighbors)))
+                self.trace.append(delta)
+                yield delta
         
         # 탐색 완료
-        final_step = {
-            'step': step_count + 1,
-            'action': 'complete',
-            'current_node': None,
-            'visited': self.visited.copy(),
-            'visit_order': self.visit_order.copy(),
-            'queue': [],
-            'level': self.level.copy(),
-            'message': '탐색 완료!',
-            'found_target': target_node in self.visited if target_node else True
+        delta = StepRecord(step_count + 1, StepAction.COMPLETE, found_target=not remaining)
+        self.trace.append(delta)
+        self.is_complete = True
+        yield delta
+    
+    def bidirectional_search(self, start_node: str, target_node: str) -> Generator[Dict, None, None]:
+        """
+        양방향 BFS 탐색 실행 (호환용 딕셔너리 뷰)
+        
+        Args:
+            start_node: 시작 노드
+            target_node: 목표 노드
+            
+        Yields:
+            각 단계의 상태 정보 (queue와 함께 backward_queue, backward_level 포함)
+        """
+        for delta in self.bidirectional_search_deltas(start_node, target_node):
+            if delta.action is StepAction.ERROR:
+                yield build_step('BFS', delta, self.visited, self.visit_order, [])
+                return
+            
+            step_info = build_step('BiBFS', delta, self.visited, self.visit_order,
+                                   self.queue, self.level, self.backward_queue, self.backward_level)
+            self.steps.append(step_info)
+            yield step_info
+    
+    def bidirectional_search_deltas(self, start_node: str, target_node: str,
+                                    trace: Optional[SearchTrace] = None) -> Generator[StepRecord, None, None]:
+        """
+        양방향 BFS 탐색 실행 (단계별 변경 내용만 생성)
+        
+        시작 노드와 목표 노드에서 동시에 BFS를 진행하며, 매번 큐가 더 작은 쪽의
+        한 레벨 전체를 확장합니다. 한 레벨을 확장하는 동안 반대쪽 탐색이 발견한 노드를
+        만나면 그 레벨이 끝난 뒤 가장 짧은 연결을 골라 종료합니다.
+        깊이 d인 목표까지 확장하는 노드 수가 대략 O(b^d)에서 O(b^(d/2))로 줄어듭니다.
+        
+        종료 후 역방향 경로가 self.parent/self.level에 이어 붙여지므로
+        get_path_to_node(target_node)와 get_shortest_distance(target_node)로
+        최단 경로와 거리를 얻을 수 있습니다.
+        단계 기록은 'BiBFS' 종류의 SearchTrace로 self.trace에 저장됩니다.
+        
+        Args:
+            start_node: 시작 노드
+            target_node: 목표 노드
+            trace: 단계를 기록할 빈 기록 (search_deltas() 참고, None이면 새 SearchTrace 생성)
+            
+        Yields:
+            각 단계의 StepRecord (역방향 탐색 단계는 backward=True, 시작 노드나 목표 노드가 없으면
+            StepAction.ERROR 기록 하나이며 목표 노드가 없는 경우 backward=True)
+        """
+        self.reset()
+        
+        if start_node not in self.graph:
+            yield StepRecord(0, StepAction.ERROR, start_node)
+            return
+        
+        if target_node not in self.graph:
+            # 역방향 탐색을 시작할 수 없음 (BiBFS 기록은 목표 노드에서 역방향 탐색을 시작하므로)
+            yield StepRecord(0, StepAction.ERROR, target_node, backward=True)
+            return
+        
+        if trace is None:
+            trace = SearchTrace('BiBFS', [start_node], target_node, visited_factory=self._new_visited)
+        self.trace = trace
+        
+        self._seed([start_node])
+        
+        if start_node == target_node:
+            self.visit_order.append(self.queue.popleft())
+            delta = StepRecord(1, StepAction.VISIT, intern_node(start_node),
+                               popped=1, found_target=True, level=0)
+            self.trace.append(delta)
+            self.is_complete = True
+            yield delta
+            return
+        
+        self.backward_queue.append(target_node)
+        self.visited.add(target_node)
+        self.backward_parent[target_node] = None
+        self.backward_level[target_node] = 0
+        
+        step_count = 0
+        best = None  # (경로 길이, 시작 쪽 노드, 목표 쪽 노드)
+        
+        while self.queue and self.backward_queue and best is None:
+            # 큐가 더 작은 쪽의 한 레벨 전체를 확장
+            backward = len(self.backward_queue) < len(self.queue)
+            if backward:
+                queue, parent, level = self.backward_queue, self.backward_parent, self.backward_level
+                other_level = self.level
+            else:
+                queue, parent, level = self.queue, self.parent, self.level
+                other_level = self.backward_level
+            
+            for _ in range(len(queue)):
+                step_count += 1
+                current_node = queue.popleft()
+                self.visit_order.append(current_node)
+                
+                delta = StepRecord(step_count, StepAction.VISIT, intern_node(current_node),
+                                   popped=1, level=level[current_node], backward=backward)
+                self.trace.append(delta)
+                yield delta
+                
+                added_neighbors = []
+                next_level = level[current_node] + 1
+                for neighbor in self.neighbor_index.ascending(current_node):
+                    if neighbor in level:
+                        continue
+                    if neighbor in other_level:
+                        # 반대쪽 탐색과 만남 - 레벨이 끝날 때까지 가장 짧은 연결을 기록
+                        length = next_level + other_level[neighbor]
+                        if best is None or length < best[0]:
+                            if backward:
+                                best = (length, neighbor, current_node)
+                            else:
+                                best = (length, current_node, neighbor)
+                        continue
+                    self.visited.add(neighbor)
+                    parent[neighbor] = current_node
+                    level[neighbor] = next_level
+                    queue.append(neighbor)
+                    added_neighbors.append(neighbor)
+                
+                if added_neighbors:
+                    step_count += 1
+                    delta = StepRecord(step_count, StepAction.QUEUE_UPDATE, intern_node(current_node),
+                                       tuple(map(intern_node, added_neighbors)), backward=backward)
+                    self.trace.append(delta)
+                    yield delta
+        
+        if best is not None:
+            _, forward_node, backward_node = best
+            self.meeting_edge = (forward_node, backward_node)
+            
+            # 목표 쪽 경로를 시작 쪽 BFS 트리에 이어 붙임 (재생할 수 있도록 경로를 기록에 포함)
+            spliced = []
+            previous = forward_node
+            current = backward_node
+            while current is not None:
+                self.parent[current] = previous
+                self.level[current] = self.level[previous] + 1
+                spliced.append(intern_node(current))
+                previous, current = current, self.backward_parent[current]
+            
+            delta = StepRecord(step_count + 1, StepAction.COMPLETE, intern_node(forward_node),
+                               tuple(spliced), found_target=True)
+        else:
+            delta = StepRecord(step_count + 1, StepAction.COMPLETE, found_target=False)
+        
+        self.trace.append(delta)
+        self.is_complete = True
+        yield delta
+    
+    def run(self, start_node: Union[str, Iterable[str]],
+            target_node: Union[str, Iterable[str], None] = None, vectorized: bool = False,
+            processes: int = 1, lazy: bool = False) -> Dict:
+        """
+        단계 기록 없이 BFS 탐색 실행 (결과만 필요한 경우의 빠른 경로)
+        
+        search()와 같은 알파벳 순서로 인접 노드를 방문하므로 방문 순서가 동일합니다.
+        시작 노드 컬렉션을 주면 모든 시작 노드를 레벨 0으로 큐에 넣고 한 번에 탐색하므로
+        level은 가장 가까운 시작 노드까지의 거리, source는 그 시작 노드가 됩니다.
+        (거리가 같으면 먼저 주어진 시작 노드 쪽이 차지)
+        
+        Args:
+            start_node: 시작 노드 또는 시작 노드 컬렉션 (다중 시작점)
+            target_node: 목표 노드 또는 목표 노드 컬렉션 (None이면 전체 탐색, 모두 찾으면 종료)
+            vectorized: True이면 레벨 단위 numpy 엔진(level_sync)으로 실행
+                        (NetworkX 그래프는 CSR 스냅샷으로 변환하여 실행하며, 지문이 있는 그래프는
+                        NeighborIndex에 보관된 스냅샷을 수정 전까지 재사용, 결과는 동일)
+            processes: 2 이상이면 프런티어를 작업 프로세스에 나누는 병렬 엔진(parallel_bfs)으로
+                       실행 (vectorized를 포함하며 결과는 직렬 실행과 동일)
+            lazy: True이면 parent, level, source를 노드마다 딕셔너리 항목으로 만들지 않고
+                  엔진의 ID 배열 위의 읽기 전용 매핑 뷰(IdArrayView)로 반환
+                  (vectorized를 포함하며 조회 결과와 순회 순서는 딕셔너리와 동일)
+            
+        Returns:
+            visit_order, parent, level, source, found_target(목표를 모두 찾았는지),
+            targets(get_target_results())를 담은 결과 딕셔너리
+        """
+        self.reset()
+        
+        sources = as_sources(start_node, self.graph)
+        missing = self._find_missing(sources)
+        if missing is not None:
+            return {
+                'error': f"시작 노드 '{missing}'가 그래프에 존재하지 않습니다."
+            }
+        
+        self.targets = as_targets(target_node, self.graph)
+        
+        if vectorized or lazy or processes > 1:
+            return self._run_vectorized(sources, processes, lazy)
+        
+        if isinstance(self.graph, CSRGraph):
+            return self._run_csr(sources)
+        
+        sorted_neighbors = self.neighbor_index.ascending
+        visited = self.visited
+        visit_order = self.visit_order
+        parent = self.parent
+        level = self.level
+        source = self.source
+        queue = self.queue
+        
+        self._seed(sources)
+        remaining = set(self.targets)
+        
+        while queue:
+            current_node = queue.popleft()
+            visit_order.append(current_node)
+            
+            if current_node in remaining:
+                remaining.discard(current_node)
+                if not remaining:
+                    break
+            
+            next_level = level[current_node] + 1
+            current_source = source[current_node]
+            for neighbor in sorted_neighbors(current_node):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    parent[neighbor] = current_node
+                    level[neighbor] = next_level
+                    source[neighbor] = current_source
+                    queue.append(neighbor)
+        
+        self.is_complete = True
+        
+        return {
+            'visit_order': visit_order,
+            'parent': parent,
+            'level': level,
+            'source': source,
+            'found_target': not remaining,
+            'targets': self.get_target_results()
+        }
+    
+    def _find_missing(self, sources: List[str]) -> Optional[str]:
+        """그래프에 없는 첫 시작 노드 반환 (모두 있으면 None)"""
+        for node in sources:
+            if node not in self.graph:
+                return node
+        return None
+    
+    def _seed(self, sources: List[str]):
+        """시작 노드들을 레벨 0으로 큐에 추가"""
+        for node in sources:
+            self.queue.append(node)
+            self.visited.add(node)
+            self.parent[node] = None
+            self.level[node] = 0
+            self.source[node] = node
+    
+    def _run_csr(self, sources: List[str]) -> Dict:
+        """CSR 스냅샷의 정수 배열을 따라가는 run() 구현"""
+        csr = self.graph
+        indptr = memoryview(csr.indptr)
+        indices = memoryview(csr.indices)
+        labels = csr.labels
+        
+        start_ids = [csr.index[node] for node in sources]
+        # 그래프에 없는 목표는 -1로 남아 전체 탐색 후 found_target이 False가 됨
+        remaining = {csr.index.get(node, -1) for node in self.targets}
+        
+        seen = bytearray(len(labels))
+        parent_ids = dict.fromkeys(start_ids, -1)
+        level_ids = dict.fromkeys(start_ids, 0)
+        source_ids = {start: start for start in start_ids}
+        
+        # BFS에서는 큐에 들어간 순서가 곧 방문 순서
+        order = list(start_ids)
+        for start in start_ids:
+            seen[start] = 1
+        head = 0
+        
+        while head < len(order):
+            current = order[head]
+            head += 1
+            
+            if current in remaining:
+                remaining.discard(current)
+                if not remaining:
+                    break
+            
+            next_level = level_ids[current] + 1
+            current_source = source_ids[current]
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    parent_ids[neighbor] = current
+                    level_ids[neighbor] = next_level
+                    source_ids[neighbor] = current_source
+                    order.append(neighbor)
+        
+        # 결과를 노드 이름으로 변환
+        self.visit_order.extend(labels[i] for i in order[:head])
+        self.queue.extend(labels[i] for i in order[head:])
+        self.visited.update_ids(parent_ids)
+        for node_id, parent_id in parent_ids.items():
+            node = labels[node_id]
+            self.parent[node] = labels[parent_id] if parent_id >= 0 else None
+            self.level[node] = level_ids[node_id]
+            self.source[node] = labels[source_ids[node_id]]
+        
+        self.is_complete = True
+        
+        return {
+            'visit_order': self.visit_order,
+            'parent': self.parent,
+            'level': self.level,
+            'source': self.source,
+            'found_target': not remaining,
+            'targets': self.get_target_results()
         }
+    
+    def _run_vectorized(self, sources: List[str], processes: int = 1, lazy: bool = False) -> Dict:
+        """레벨 동기식 numpy 엔진(processes가 2 이상이면 병렬 엔진)으로 실행하는 run() 구현"""
+        # NetworkX 그래프는 NeighborIndex의 스냅샷을 사용 (지문이 있는 그래프만 수정 전까지 재사용)
+        csr = self.graph if isinstance(self.graph, CSRGraph) else self.neighbor_index.csr()
+        labels = csr.labels
+        
+        start_ids = [csr.index[node] for node in sources]
+        target_ids = [csr.index.get(node, -1) for node in self.targets]
+        if processes > 1:
+            result = parallel_level_synchronous_bfs(csr, start_ids, target_ids, processes)
+        else:
+            result = level_synchronous_bfs(csr, start_ids, target_ids)
+        
+        # 결과를 노드 이름으로 변환 (발견한 순서대로 넣어 큐 기반 실행과 딕셔너리 순서도 같게 함)
+        discovered = np.concatenate([result['order'], result['queue']])
+        nodes = [labels[i] for i in discovered.tolist()]
+        visit_count = len(result['order'])
+        self.visit_order.extend(nodes[:visit_count])
+        self.queue.extend(nodes[visit_count:])
+        
+        if lazy:
+            # 노드별 결과는 엔진의 ID 배열을 그대로 감싸고, 방문 집합도 스냅샷 기준 비트셋으로 교체
+            reached = result['level'] >= 0
+            self.visited = VisitedBitset(csr)
+            self.visited.update_ids(discovered)
+            self.parent = IdArrayView(csr, discovered, result['parent'], reached, labeled=True)
+            self.level = IdArrayView(csr, discovered, result['level'], reached)
+            self.source = IdArrayView(csr, discovered, result['source'], reached, labeled=True)
+        else:
+            if isinstance(self.visited, VisitedBitset):
+                self.visited.update_ids(discovered)
+            else:
+                self.visited.update(nodes)
+            
+            self.parent.update(zip(nodes, [labels[i] if i >= 0 else None
+                                           for i in result['parent'][discovered].tolist()]))
+            self.level.update(zip(nodes, result['level'][discovered].tolist()))
+            self.source.update(zip(nodes, [labels[i] for i in result['source'][discovered].tolist()]))
         
-        self.steps.append(final_step)
         self.is_complete = True
-        yield final_step
+        
+        return {
+            'visit_order': self.visit_order,
+            'parent': self.parent,
+            'level': self.level,
+            'source': self.source,
+            'found_target': result['found_target'],
+            'targets': self.get_target_results()
+        }
     
     def get_path_to_node(self, target_node: str) -> Optional[List[str]]:
         """
@@ -160,6 +560,100 @@ class BFS:
         
         return path[::-1]  # 역순으로 반환하여 시작->목표 순서로 만듦
     
+    def get_paths_batch(self, pairs: Iterable[Tuple[str, str]], max_workers: int = 1) -> Dict:
+        """
+        여러 (시작, 목표) 쌍의 최단 경로를 한 번에 계산
+        
+        쌍을 시작 노드별로 묶어 시작 노드마다 BFS 트리를 한 번만 만들고,
+        그 시작 노드의 목표가 모두 발견되면 바로 멈춥니다.
+        (BFS에서는 발견될 때의 부모가 최종 부모이므로 경로는 get_path_to_node()와 같음)
+        max_workers가 2 이상이면 시작 노드 묶음들을 프로세스 풀에 나누어 실행합니다.
+        이 객체의 탐색 상태(visited, parent 등)는 바꾸지 않습니다.
+        
+        Args:
+            pairs: (시작 노드, 목표 노드) 쌍들
+            max_workers: 사용할 프로세스 수 (1이면 현재 프로세스에서 실행)
+            
+        Returns:
+            입력 순서에 맞춘 paths(경로 또는 None)와 distances(거리 또는 None)를 담은 딕셔너리
+        """
+        pairs = list(pairs)
+        
+        # 시작 노드 -> 목표 노드들 (그래프에 없는 노드는 경로 없음)
+        groups: Dict[str, List[str]] = {}
+        for start_node, target_node in pairs:
+            if start_node in self.graph and target_node in self.graph:
+                groups.setdefault(start_node, []).append(target_node)
+        
+        tasks = [(start_node, list(dict.fromkeys(targets))) for start_node, targets in groups.items()]
+        
+        if max_workers > 1 and len(tasks) > 1:
+            chunksize = max(1, len(tasks) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker,
+                                     initargs=(self.graph,)) as executor:
+                results = list(executor.map(_batch_worker, tasks, chunksize=chunksize))
+        else:
+            results = [self._paths_from(start_node, targets) for start_node, targets in tasks]
+        
+        found: Dict[Tuple[str, str], List[str]] = {}
+        for (start_node, _), paths in zip(tasks, results):
+            for target_node, path in paths.items():
+                found[(start_node, target_node)] = path
+        
+        result_paths = [found.get((start_node, target_node)) for start_node, target_node in pairs]
+        return {
+            'paths': result_paths,
+            'distances': [len(path) - 1 if path is not None else None for path in result_paths]
+        }
+    
+    def _paths_from(self, start_node: str, targets: List[str]) -> Dict[str, List[str]]:
+        """시작 노드에서 목표 노드들이 모두 발견될 때까지 BFS 트리를 만들고 경로 반환"""
+        sorted_neighbors = self.neighbor_index.ascending
+        remaining = set(targets)
+        remaining.discard(start_node)
+        parent: Dict[str, Optional[str]] = {start_node: None}
+        queue = deque([start_node])
+        
+        while queue and remaining:
+            current_node = queue.popleft()
+            for neighbor in sorted_neighbors(current_node):
+                if neighbor not in parent:
+                    parent[neighbor] = current_node
+                    queue.append(neighbor)
+                    remaining.discard(neighbor)
+                    if not remaining:
+                        break
+        
+        paths = {}
+        for target_node in targets:
+            if target_node not in parent:
+                continue
+            path = []
+            current = target_node
+            while current is not None:
+                path.append(current)
+                current = parent[current]
+            paths[target_node] = path[::-1]
+        return paths
+    
+    def get_target_results(self) -> Dict[str, Dict]:
+        """
+        목표 노드별 탐색 결과 반환
+        
+        Returns:
+            목표 노드 -> step(발견한 단계 번호, run()에서는 None), visit_time(방문 순번), path(경로)
+            (찾지 못한 목표는 모두 None)
+        """
+        results = {}
+        for target in self.targets:
+            visit_time = self.get_visit_time(target)
+            results[target] = {
+                'step': self.target_steps.get(target),
+                'visit_time': visit_time,
+                'path': self.get_path_to_node(target) if visit_time is not None else None
+            }
+        return results
+    
     def get_shortest_distance(self, target_node: str) -> Optional[int]:
         """
         특정 노드까지의 최단 거리 반환
@@ -174,6 +668,54 @@ class BFS:
             return self.level[target_node]
         return None
     
+    def get_nearest_source(self, node: str) -> Optional[str]:
+        """
+        다중 시작점 탐색에서 노드에 가장 가까운 시작 노드 반환
+        
+        Args:
+            node: 노드
+            
+        Returns:
+            가장 가까운 시작 노드 (도달하지 못했으면 None)
+        """
+        return self.source.get(node)
+    
+    @property
+    def level_buckets(self) -> Dict[int, List[str]]:
+        """
+        레벨 -> 해당 레벨의 노드 목록 인덱스
+        
+        노드의 레벨은 정해진 뒤 바뀌지 않으므로 level에 노드가 추가되었을 때만 다시 만듭니다.
+        (탐색이 끝난 뒤에는 한 번만 만들어짐)
+        """
+        if self._bucketed_levels != len(self.level):
+            buckets: Dict[int, List[str]] = {}
+            for node, node_level in self.level.items():
+                buckets.setdefault(node_level, []).append(node)
+            self._level_buckets = buckets
+            self._bucketed_levels = len(self.level)
+        return self._level_buckets
+    
+    @property
+    def level_counts(self) -> Dict[int, int]:
+        """레벨 -> 해당 레벨의 노드 수 (레벨 0부터 최대 레벨까지)"""
+        buckets = self.level_buckets
+        max_level = max(buckets) if buckets else 0
+        return {level: len(buckets.get(level, ())) for level in range(max_level + 1)}
+    
+    @property
+    def visit_rank(self) -> Dict[str, int]:
+        """
+        노드 -> 방문 순번(1부터) 인덱스
+        
+        visit_order에 새로 추가된 부분만 반영하므로 조회할 때마다 O(1)(분할 상환)입니다.
+        """
+        rank = self._visit_rank
+        visit_order = self.visit_order
+        for position in range(len(rank), len(visit_order)):
+            rank[visit_order[position]] = position + 1
+        return rank
+    
     def get_nodes_at_level(self, level: int) -> List[str]:
         """
         특정 레벨의 모든 노드들 반환
@@ -184,25 +726,23 @@ class BFS:
         Returns:
             해당 레벨의 노드 리스트
         """
-        return [node for node, node_level in self.level.items() if node_level == level]
+        return list(self.level_buckets.get(level, ()))
     
     def get_statistics(self) -> Dict:
         """탐색 통계 정보 반환"""
         total_nodes = len(self.graph.nodes())
         visited_count = len(self.visited)
-        max_level = max(self.level.values()) if self.level else 0
         
-        # 레벨별 노드 수 계산
-        level_counts = {}
-        for level in range(max_level + 1):
-            level_counts[level] = len(self.get_nodes_at_level(level))
+        # 레벨별 노드 수 (인덱스에서 레벨 수에 비례하는 시간으로 계산)
+        level_counts = self.level_counts
+        max_level = len(level_counts) - 1
         
         return {
             'total_nodes': total_nodes,
             'visited_nodes': visited_count,
             'unvisited_nodes': total_nodes - visited_count,
             'visit_order': self.visit_order.copy(),
-            'total_steps': len(self.steps),
+            'total_steps': len(self.trace) if self.trace else 0,
             'algorithm': 'BFS',
             'max_level': max_level,
             'level_counts': level_counts,
@@ -210,13 +750,17 @@ class BFS:
         }
     
     def get_step(self, step_number: int) -> Optional[Dict]:
-        """특정 단계의 정보 반환"""
+        """특정 단계의 정보 반환 (델타만 기록된 경우 재구성)"""
         if 0 <= step_number < len(self.steps):
             return self.steps[step_number]
+        if self.trace and 0 <= step_number < len(self.trace):
+            return self.trace[step_number].to_dict()
         return None
     
     def get_all_steps(self) -> List[Dict]:
         """모든 단계의 정보 반환"""
+        if not self.steps and self.trace:
+            return [snapshot.to_dict() for snapshot in self.trace]
         return self.steps.copy()
     
     def is_node_visited(self, node: str) -> bool:
@@ -225,10 +769,7 @@ class BFS:
     
     def get_visit_time(self, node: str) -> Optional[int]:
         """노드가 몇 번째로 방문되었는지 반환"""
-        try:
-            return self.visit_order.index(node) + 1
-        except ValueError:
-            return None
+        return self.visit_rank.get(node)
     
     def get_node_level(self, node: str) -> Optional[int]:
         """노드의 레벨 반환"""
@@ -244,4 +785,20 @@ class BFS:
         for node, parent in self.parent.items():
             if parent is not None:
                 tree_edges.append((parent, node))
-        return tree_edges 
\ No newline at end of file
+        return tree_edges 
+
+
+# 프로세스 풀 작업자용 (작업자마다 그래프를 한 번만 전달받음)
+_batch_bfs: Optional[BFS] = None
+
+
+def _init_batch_worker(graph: nx.Graph):
+    """작업자 프로세스 초기화"""
+    global _batch_bfs
+    _batch_bfs = BFS(graph)
+
+
+def _batch_worker(task: Tuple[str, List[str]]) -> Dict[str, List[str]]:
+    """시작 노드 하나의 목표 노드들에 대한 경로 계산"""
+    start_node, targets = task
+    return _batch_bfs._paths_from(start_node, targets)
@@ -0,0 +1,113 @@
+"""
+비트셋 기반 방문 집합
+
+CSR 스냅샷의 정수 노드 ID마다 1비트를 사용하는 집합입니다.
+문자열 set은 항목당 수십 바이트가 들지만, 비트셋은 노드 수 / 8 바이트로 고정되어
+수백만 노드 탐색에서도 방문 여부 확인과 단계별 복사가 가볍습니다.
+"""
+
+import sys
+import numpy as np
+from collections.abc import MutableSet
+from typing import Iterable, Iterator
+
+from .csr import CSRGraph
+
+
+class VisitedBitset(MutableSet):
+    """노드 이름으로 사용하는 set 호환 비트셋 (노드 ID는 CSRGraph 기준)"""
+
+    __slots__ = ('graph', 'bits', '_count')
+
+    def __init__(self, graph: CSRGraph, nodes: Iterable[str] = ()):
+        """
+        VisitedBitset 초기화
+
+        Args:
+            graph: 노드 ID를 제공하는 CSR 스냅샷
+            nodes: 처음에 넣을 노드들
+        """
+        self.graph = graph
+        self.bits = bytearray((len(graph.labels) + 7) // 8)
+        self._count = 0
+        for node in nodes:
+            self.add(node)
+
+    def __contains__(self, node) -> bool:
+        node_id = self.graph.index.get(node)
+        if node_id is None:
+            return False
+        return bool(self.bits[node_id >> 3] & (1 << (node_id & 7)))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        """노드 ID 순서(= 노드 이름 정렬 순서)로 반환"""
+        labels = self.graph.labels
+        flags = np.unpackbits(np.frombuffer(self.bits, dtype=np.uint8), bitorder='little')
+        for node_id in np.flatnonzero(flags).tolist():
+            yield labels[node_id]
+
+    def __repr__(self) -> str:
+        return f"VisitedBitset({set(self)!r})"
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.bits)
+
+    def _from_iterable(self, nodes: Iterable[str]) -> set:
+        """집합 연산(&, | 등)의 결과는 일반 set으로 반환"""
+        return set(nodes)
+
+    def add(self, node: str):
+        """노드 추가"""
+        self.add_id(self.graph.index[node])
+
+    def discard(self, node: str):
+        """노드 제거 (없으면 무시)"""
+        node_id = self.graph.index.get(node)
+        if node_id is None:
+            return
+        mask = 1 << (node_id & 7)
+        if self.bits[node_id >> 3] & mask:
+            self.bits[node_id >> 3] &= ~mask
+            self._count -= 1
+
+    def add_id(self, node_id: int):
+        """노드 ID로 추가"""
+        mask = 1 << (node_id & 7)
+        if not self.bits[node_id >> 3] & mask:
+            self.bits[node_id >> 3] |= mask
+            self._count += 1
+
+    def update_ids(self, node_ids: Iterable[int]):
+        """여러 노드 ID를 한 번에 추가 (비트 배열 전체를 numpy로 갱신)"""
+        if not isinstance(node_ids, np.ndarray):
+            node_ids = np.fromiter(node_ids, dtype=np.int64)
+        flags = np.unpackbits(np.frombuffer(self.bits, dtype=np.uint8), bitorder='little')
+        flags[node_ids] = 1
+        self.bits = bytearray(np.packbits(flags, bitorder='little').tobytes())
+        self._count = int(np.count_nonzero(flags))
+
+    def update(self, nodes: Iterable[str]):
+        """여러 노드를 한 번에 추가 (set.update 호환)"""
+        for node in nodes:
+            self.add(node)
+
+    def copy(self) -> 'VisitedBitset':
+        """비트 배열만 복사한 사본 반환"""
+        clone = VisitedBitset.__new__(VisitedBitset)
+        clone.graph = self.graph
+        clone.bits = self.bits[:]
+        clone._count = self._count
+        return clone
+
+    def clear(self):
+        """모든 노드 제거"""
+        self.bits = bytearray(len(self.bits))
+        self._count = 0
+
+    @property
+    def nbytes(self) -> int:
+        """비트 배열이 차지하는 메모리 (바이트)"""
+        return len(self.bits)
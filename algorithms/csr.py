@@ -0,0 +1,172 @@
+"""
+CSR (Compressed Sparse Row) 인접 구조 스냅샷
+
+NetworkX 그래프를 정수 인덱스 기반의 numpy 배열(indptr/indices)로 한 번 변환해 두고
+탐색 알고리즘이 문자열 키 딕셔너리 대신 배열을 따라가도록 합니다.
+"""
+
+import networkx as nx
+import numpy as np
+from collections.abc import Mapping
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+class CSRGraph:
+    """정수 인덱스 기반의 읽기 전용 인접 구조 스냅샷"""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, labels: List[str]):
+        """
+        CSRGraph 초기화
+
+        Args:
+            indptr: 노드 i의 인접 노드가 indices[indptr[i]:indptr[i + 1]]에 위치
+            indices: 인접 노드 ID 배열 (각 행은 오름차순 정렬)
+            labels: 노드 ID -> 노드 이름 표
+        """
+        self.indptr = indptr
+        self.indices = indices
+        self.labels = list(labels)
+        self.index: Dict[str, int] = {label: i for i, label in enumerate(self.labels)}
+
+        # 스냅샷은 변경 불가
+        self.indptr.setflags(write=False)
+        self.indices.setflags(write=False)
+
+    @classmethod
+    def from_graph(cls, graph: nx.Graph) -> 'CSRGraph':
+        """
+        NetworkX 그래프에서 CSR 스냅샷 생성
+
+        노드 ID는 노드 이름의 정렬 순서로 부여되므로, 각 행을 ID 순으로 정렬하면
+        BFS/DFS가 사용하는 알파벳 순서와 같아집니다. 서로 비교할 수 없는 노드 이름이 섞여 있으면
+        (예: 정수와 문자열) 그래프의 노드 순서를 그대로 사용합니다. (통계 계산에는 순서가 필요 없음)
+
+        Args:
+            graph: NetworkX 그래프
+
+        Returns:
+            CSRGraph 스냅샷
+        """
+        try:
+            labels = sorted(graph.nodes())
+        except TypeError:
+            labels = list(graph)
+        index = dict(zip(labels, range(len(labels))))
+        num_nodes = len(labels)
+        neighbors_of = graph.adj.__getitem__
+
+        # 인접 딕셔너리를 한 번만 훑음 (무방향 간선은 양쪽 행에, 자기 루프는 한 번만 나옴)
+        # 간선마다 실행되는 부분이므로 제너레이터 대신 map/chain으로 C 수준에서 반복
+        counts = np.fromiter(map(len, map(neighbors_of, labels)), dtype=np.int64, count=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        cols = np.fromiter(map(index.__getitem__, chain.from_iterable(map(neighbors_of, labels))),
+                           dtype=np.int64, count=int(indptr[-1]))
+
+        # 행은 이미 모여 있으므로 (행, 열) 합성 키 정렬로 각 행을 ID 순으로 정렬
+        rows = np.repeat(np.arange(num_nodes, dtype=np.int64), counts)
+        keys = np.sort(rows * max(num_nodes, 1) + cols)
+        index_dtype = np.int32 if num_nodes < np.iinfo(np.int32).max else np.int64
+        indices = (keys - rows * max(num_nodes, 1)).astype(index_dtype)
+
+        return cls(indptr, indices, labels)
+
+    def number_of_nodes(self) -> int:
+        """노드 수 반환"""
+        return len(self.labels)
+
+    def number_of_edges(self) -> int:
+        """간선 수 반환 (자기 루프는 한 번만 계산)"""
+        rows = np.repeat(np.arange(len(self.labels)), np.diff(self.indptr))
+        return int(np.count_nonzero(rows <= self.indices))
+
+    def nodes(self) -> List[str]:
+        """노드 이름 목록 반환"""
+        return self.labels
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.index
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def node_id(self, node: str) -> Optional[int]:
+        """노드 이름 -> 노드 ID"""
+        return self.index.get(node)
+
+    def neighbor_ids(self, node_id: int) -> np.ndarray:
+        """노드 ID의 인접 노드 ID 배열 반환 (오름차순)"""
+        return self.indices[self.indptr[node_id]:self.indptr[node_id + 1]]
+
+    def neighbors(self, node: str) -> List[str]:
+        """노드 이름의 인접 노드 이름 목록 반환 (NetworkX 호환)"""
+        labels = self.labels
+        return [labels[i] for i in self.neighbor_ids(self.index[node]).tolist()]
+
+    def ascending(self, node: str) -> List[str]:
+        """정렬된 인접 노드 반환 (NeighborIndex와 같은 인터페이스)"""
+        return self.neighbors(node)
+
+    def degree(self, node: str) -> int:
+        """노드의 차수 반환"""
+        node_id = self.index[node]
+        return int(self.indptr[node_id + 1] - self.indptr[node_id])
+
+    @property
+    def nbytes(self) -> int:
+        """인접 배열이 차지하는 메모리 (바이트)"""
+        return self.indptr.nbytes + self.indices.nbytes
+
+
+class IdArrayView(Mapping):
+    """
+    노드 ID로 색인된 결과 배열을 노드 이름으로 조회하는 읽기 전용 매핑 뷰
+
+    run()의 CSR 경로는 parent, discovery 같은 노드별 결과를 ID 배열에 기록합니다.
+    노드마다 딕셔너리 항목을 만드는 대신 이 뷰로 감싸 두고, 조회할 때만 노드 이름으로 변환합니다.
+    """
+
+    __slots__ = ('_index', '_labels', '_order', '_values', '_reached', '_labeled')
+
+    def __init__(self, graph: CSRGraph, order: Sequence[int], values: Sequence[int],
+                 reached: Sequence[Any], labeled: bool = False):
+        """
+        IdArrayView 초기화
+
+        Args:
+            graph: 노드 ID를 제공하는 CSR 스냅샷
+            order: 키로 사용할 노드 ID들 (순회 순서)
+            values: 노드 ID -> 값 배열
+            reached: 노드 ID -> 값이 있는지 여부 배열 (참이면 키에 포함)
+            labeled: True이면 값이 노드 ID이므로 노드 이름으로 변환 (음수는 None)
+        """
+        self._index = graph.index
+        self._labels = graph.labels
+        # numpy 배열은 원소마다 numpy 스칼라를 만들지 않도록 한 번에 리스트로 변환
+        self._order = order.tolist() if isinstance(order, np.ndarray) else order
+        self._values = values.tolist() if isinstance(values, np.ndarray) else values
+        self._reached = reached.tolist() if isinstance(reached, np.ndarray) else reached
+        self._labeled = labeled
+
+    def __getitem__(self, node: str):
+        node_id = self._index.get(node)
+        if node_id is None or not self._reached[node_id]:
+            raise KeyError(node)
+        value = self._values[node_id]
+        if self._labeled:
+            return self._labels[value] if value >= 0 else None
+        return value
+
+    def __contains__(self, node) -> bool:
+        node_id = self._index.get(node)
+        return node_id is not None and bool(self._reached[node_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self._labels.__getitem__, self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __repr__(self) -> str:
+        return f"IdArrayView({dict(self)!r})"
@@ -3,7 +3,13 @@ DFS (깊이 우선 탐색) 알고리즘 구현
 """
 
 import networkx as nx
-from typing import List, Set, Dict, Optional, Generator, Tuple
+from collections import OrderedDict
+from typing import List, Dict, Optional, Generator, Tuple, Iterable, Union, AbstractSet
+
+from .bitset import VisitedBitset
+from .csr import CSRGraph, IdArrayView
+from .neighbor_index import NeighborIndex
+from .trace import SearchTrace, StepRecord, StepAction, build_step, intern_node, as_targets
 
 
 class DFS:
@@ -14,51 +20,141 @@ class DFS:
         DFS 초기화
         
         Args:
-            graph: NetworkX 그래프
+            graph: NetworkX 그래프 또는 CSRGraph 스냅샷
         """
         self.graph = graph
+        # CSR 스냅샷은 이미 행이 정렬되어 있으므로 그대로 인덱스로 사용
+        if isinstance(graph, CSRGraph):
+            self.neighbor_index = graph
+        else:
+            self.neighbor_index = NeighborIndex.for_graph(graph)
         self.reset()
     
     def reset(self):
         """알고리즘 상태 초기화"""
-        self.visited: Set[str] = set()
+        # CSR 스냅샷에서는 비트셋, 그 외에는 set (is_node_visited 등은 그대로 동작)
+        self.visited: AbstractSet[str] = self._new_visited()
         self.visit_order: List[str] = []
         self.current_path: List[str] = []
-        self.stack: List[str] = []
+        # 스택 (중복 없는 스택 모드에서는 노드 -> 그 항목을 넣은 노드의 OrderedDict)
+        self.stack: Union[List[str], 'OrderedDict[str, Optional[str]]'] = []
+        # DFS 트리 (부모, 발견 시각, 완료 시각 - 발견과 완료가 같은 시계를 공유)
+        # (CSR 스냅샷의 run()은 같은 인터페이스의 읽기 전용 IdArrayView로 교체)
+        self.parent: Dict[str, Optional[str]] = {}
+        self.discovery: Dict[str, int] = {}
+        self.finish: Dict[str, int] = {}
         self.steps: List[Dict] = []
+        self.trace: Optional[SearchTrace] = None
+        # 목표 노드들과 각 목표를 발견한 단계 번호
+        self.targets: List[str] = []
+        self.target_steps: Dict[str, int] = {}
+        # 조회용 인덱스 (visit_rank 참고)
+        self._visit_rank: Dict[str, int] = {}
         self.current_step = 0
         self.is_complete = False
     
-    def search(self, start_node: str, target_node: Optional[str] = None) -> Generator[Dict, None, None]:
+    def _new_visited(self) -> AbstractSet[str]:
+        """빈 방문 집합 생성 (CSR 스냅샷이면 노드당 1비트인 비트셋)"""
+        if isinstance(self.graph, CSRGraph):
+            return VisitedBitset(self.graph)
+        return set()
+    
+    def search(self, start_node: str, target_node: Union[str, Iterable[str], None] = None,
+               distinct_stack: bool = False) -> Generator[Dict, None, None]:
         """
         DFS 탐색 실행 (제너레이터로 단계별 실행)
         
+        각 단계마다 전체 상태를 복사한 딕셔너리를 생성하는 호환용 뷰입니다.
+        큰 그래프에서는 search_deltas()를 사용하세요.
+        
         Args:
             start_node: 시작 노드
-            target_node: 목표 노드 (None이면 전체 탐색)
+            target_node: 목표 노드 또는 목표 노드 컬렉션 (None이면 전체 탐색, 모두 찾으면 종료)
+            distinct_stack: 스택에 같은 노드를 한 번만 두는 모드 (search_deltas() 참고)
             
         Yields:
             각 단계의 상태 정보
         """
+        for delta in self.search_deltas(start_node, target_node, distinct_stack):
+            if delta.action is StepAction.ERROR:
+                yield build_step('DFS', delta, self.visited, self.visit_order, [])
+                return
+            
+            step_info = build_step('DFS', delta, self.visited, self.visit_order, self.stack)
+            self.steps.append(step_info)
+            yield step_info
+    
+    def search_deltas(self, start_node: str, target_node: Union[str, Iterable[str], None] = None,
+                      distinct_stack: bool = False,
+                      trace: Optional[SearchTrace] = None) -> Generator[StepRecord, None, None]:
+        """
+        DFS 탐색 실행 (단계별 변경 내용만 생성)
+        
+        단계 기록은 self.trace에 저장되며, 전체 상태는 self.trace[i]로 재구성할 수 있습니다.
+        메시지는 기록에 저장하지 않고 표시할 때 StepRecord.message로 생성합니다.
+        스택 항목마다 넣은 노드를 함께 기록하여 parent/discovery/finish를 run()과 같게 채웁니다.
+        
+        기본 모드는 교재의 방식대로 방문하지 않은 인접 노드를 모두 넣고 꺼낼 때 중복을 건너뛰므로
+        밀집 그래프에서는 스택이 O(E)까지 커집니다. distinct_stack=True이면 이미 스택에 있는 노드를
+        다시 넣을 때 기존 항목을 맨 위로 옮기므로 스택 크기가 O(V)로 제한됩니다.
+        중복 항목은 어차피 건너뛰어지므로 방문 순서와 DFS 트리는 두 모드에서 같습니다.
+        
+        Args:
+            start_node: 시작 노드
+            target_node: 목표 노드 또는 목표 노드 컬렉션 (None이면 전체 탐색, 모두 찾으면 종료)
+            distinct_stack: 스택에 같은 노드를 한 번만 두는 모드
+            trace: 단계를 기록할 빈 기록 (예: GUI의 SearchTimeline, 같은 델타를 따로 보관하지
+                   않도록 self.trace로 그대로 사용하며 None이면 새 SearchTrace 생성)
+            
+        Yields:
+            각 단계의 StepRecord (시작 노드가 없으면 StepAction.ERROR 기록 하나)
+        """
         self.reset()
         
         if start_node not in self.graph:
-            yield {
-                'error': f"시작 노드 '{start_node}'가 그래프에 존재하지 않습니다."
-            }
+            yield StepRecord(0, StepAction.ERROR, start_node)
             return
         
-        # 스택에 시작 노드 추가
-        self.stack.append(start_node)
+        if trace is None:
+            trace = SearchTrace('DFS', start_node, distinct_stack=distinct_stack,
+                                visited_factory=self._new_visited)
+        self.trace = trace
+        self.targets = as_targets(target_node, self.graph)
+        remaining = set(self.targets)
+        
+        # 스택에 시작 노드 추가 (stack_parents[i]는 stack[i]를 넣은 노드)
+        if distinct_stack:
+            self.stack = OrderedDict([(start_node, None)])
+        else:
+            self.stack.append(start_node)
+            stack_parents: List[Optional[str]] = [None]
+        
+        # 방문 중인 노드들과 각 노드가 넣은 항목 중 스택에 남아 있는 수
+        frames: List[str] = []
+        pending: Dict[str, int] = {}
+        clock = 0
         
         step_count = 0
+        popped = 0
         while self.stack:
             step_count += 1
             
+            # 넣은 항목이 모두 꺼내진 노드는 탐색 완료
+            while frames and not pending[frames[-1]]:
+                clock += 1
+                self.finish[frames.pop()] = clock
+            
             # 현재 노드를 스택에서 꺼냄
-            current_node = self.stack.pop()
+            if distinct_stack:
+                current_node, parent_node = self.stack.popitem()
+            else:
+                current_node = self.stack.pop()
+                parent_node = stack_parents.pop()
+            popped += 1
+            if parent_node is not None:
+                pending[parent_node] -= 1
             
-            # 이미 방문한 노드는 건너뛰기
+            # 이미 방문한 노드는 건너뛰기 (중복 없는 스택에서는 일어나지 않음)
             if current_node in self.visited:
                 continue
             
@@ -66,77 +162,229 @@ class DFS:
             self.visited.add(current_node)
             self.visit_order.append(current_node)
             self.current_path.append(current_node)
+            self.parent[current_node] = parent_node
+            clock += 1
+            self.discovery[current_node] = clock
             
-            # 현재 단계 정보 저장
-            step_info = {
-                'step': step_count,
-                'action': 'visit',
-                'current_node': current_node,
-                'visited': self.visited.copy(),
-                'visit_order': self.visit_order.copy(),
-                'stack': self.stack.copy(),
-                'current_path': self.current_path.copy(),
-                'message': f"노드 '{current_node}' 방문",
-                'found_target': False
-            }
+            found_target = current_node in remaining
+            if found_target:
+                remaining.discard(current_node)
+                self.target_steps[current_node] = step_count
+            delta = StepRecord(step_count, StepAction.VISIT, intern_node(current_node),
+                               popped=popped, found_target=found_target)
+            popped = 0
+            self.trace.append(delta)
+            yield delta
             
-            # 목표 노드를 찾은 경우
-            if target_node and current_node == target_node:
-                step_info['found_target'] = True
-                step_info['message'] = f"목표 노드 '{target_node}' 발견!"
-                self.steps.append(step_info)
-                yield step_info
+            # 목표 노드를 모두 찾은 경우
+            if found_target and not remaining:
                 self.is_complete = True
                 return
             
-            self.steps.append(step_info)
-            yield step_info
-            
             # 인접한 노드들을 스택에 추가 (역순으로 추가하여 알파벳 순서로 방문)
-            neighbors = list(self.graph.neighbors(current_node))
-            neighbors.sort(reverse=True)  # 역순 정렬
-            
-            for neighbor in neighbors:
+            frames.append(current_node)
+            pending[current_node] = 0
+            pushed = []
+            for neighbor in reversed(self.neighbor_index.ascending(current_node)):
                 if neighbor not in self.visited:
-                    self.stack.append(neighbor)
+                    if distinct_stack:
+                        # 이미 스택에 있으면 기존 항목을 빼서 맨 위로 옮김
+                        previous = self.stack.pop(neighbor, None)
+                        if previous is not None:
+                            pending[previous] -= 1
+                        self.stack[neighbor] = current_node
+                    else:
+                        self.stack.append(neighbor)
+                        stack_parents.append(current_node)
+                    pending[current_node] += 1
+                    pushed.append(neighbor)
             
             # 스택 상태 업데이트
             if self.stack:
                 step_count += 1
-                stack_info = {
-                    'step': step_count,
-                    'action': 'stack_update',
-                    'current_node': current_node,
-                    'visited': self.visited.copy(),
-                    'visit_order': self.visit_order.copy(),
-                    'stack': self.stack.copy(),
-                    'current_path': self.current_path.copy(),
-                    'message': f"스택에 인접 노드들 추가: {neighbors[::-1]}",
-                    'found_target': False
-                }
-                self.steps.append(stack_info)
-                yield stack_info
+                delta = StepRecord(step_count, StepAction.STACK_UPDATE, intern_node(current_node),
+                                   tuple(map(intern_node, pushed)))
+                self.trace.append(delta)
+                yield delta
+        
+        while frames:
+            clock += 1
+            self.finish[frames.pop()] = clock
         
         # 탐색 완료
-        final_step = {
-            'step': step_count + 1,
-            'action': 'complete',
-            'current_node': None,
-            'visited': self.visited.copy(),
-            'visit_order': self.visit_order.copy(),
-            'stack': [],
-            'current_path': self.current_path.copy(),
-            'message': '탐색 완료!',
-            'found_target': target_node in self.visited if target_node else True
+        delta = StepRecord(step_count + 1, StepAction.COMPLETE, found_target=not remaining)
+        self.trace.append(delta)
+        self.is_complete = True
+        yield delta
+    
+    def run(self, start_node: str, target_node: Union[str, Iterable[str], None] = None) -> Dict:
+        """
+        단계 기록 없이 DFS 탐색 실행 (결과만 필요한 경우의 빠른 경로)
+        
+        search()와 같은 알파벳 순서로 인접 노드를 방문하므로 방문 순서가 동일합니다.
+        스택에는 (노드, 남은 인접 노드 반복자)를 넣으므로 간선 수와 관계없이 O(V) 메모리로
+        parent, discovery, finish를 기록합니다.
+        (목표를 모두 찾아 중간에 멈추면 스택에 남은 노드는 finish가 없음)
+        CSR 스냅샷에서는 노드 ID 배열에 기록하고 parent, discovery, finish를 딕셔너리 대신
+        조회할 때 노드 이름으로 변환하는 읽기 전용 매핑 뷰(IdArrayView)로 반환합니다.
+        
+        Args:
+            start_node: 시작 노드
+            target_node: 목표 노드 또는 목표 노드 컬렉션 (None이면 전체 탐색, 모두 찾으면 종료)
+            
+        Returns:
+            visit_order, parent, discovery, finish, found_target(목표를 모두 찾았는지),
+            targets(get_target_results())를 담은 결과 딕셔너리
+        """
+        self.reset()
+        
+        if start_node not in self.graph:
+            return {
+                'error': f"시작 노드 '{start_node}'가 그래프에 존재하지 않습니다."
+            }
+        
+        self.targets = as_targets(target_node, self.graph)
+        
+        if isinstance(self.graph, CSRGraph):
+            return self._run_csr(start_node)
+        
+        sorted_neighbors = self.neighbor_index.ascending
+        visited = self.visited
+        visit_order = self.visit_order
+        parent = self.parent
+        discovery = self.discovery
+        finish = self.finish
+        remaining = set(self.targets)
+        
+        visited.add(start_node)
+        visit_order.append(start_node)
+        parent[start_node] = None
+        clock = 1
+        discovery[start_node] = clock
+        remaining.discard(start_node)
+        
+        # 시작 노드가 유일한 목표이면 바로 종료
+        stack = [] if self.targets and not remaining else [(start_node, iter(sorted_neighbors(start_node)))]
+        
+        while stack:
+            current_node, neighbors = stack[-1]
+            
+            # 아직 방문하지 않은 다음 인접 노드로 내려감
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    break
+            else:
+                stack.pop()
+                clock += 1
+                finish[current_node] = clock
+                continue
+            
+            visited.add(neighbor)
+            visit_order.append(neighbor)
+            parent[neighbor] = current_node
+            clock += 1
+            discovery[neighbor] = clock
+            
+            if neighbor in remaining:
+                remaining.discard(neighbor)
+                if not remaining:
+                    break
+            
+            stack.append((neighbor, iter(sorted_neighbors(neighbor))))
+        
+        self.stack = [node for node, _ in stack]
+        self.current_path = visit_order.copy()
+        self.is_complete = True
+        
+        return {
+            'visit_order': visit_order,
+            'parent': parent,
+            'discovery': discovery,
+            'finish': finish,
+            'found_target': not remaining,
+            'targets': self.get_target_results()
         }
+    
+    def _run_csr(self, start_node: str) -> Dict:
+        """CSR 스냅샷의 정수 배열을 따라가는 run() 구현"""
+        csr = self.graph
+        indptr = csr.indptr.tolist()
+        indices = csr.indices.tolist()
+        labels = csr.labels
+        
+        # 그래프에 없는 목표는 -1로 남아 전체 탐색 후 found_target이 False가 됨
+        remaining = {csr.index.get(node, -1) for node in self.targets}
         
-        self.steps.append(final_step)
+        start = csr.index[start_node]
+        num_nodes = len(labels)
+        # 노드 ID로 색인한 배열에 기록 (발견 시각 0 = 아직 방문하지 않음, 부모 -1 = 시작 노드)
+        # 스택에는 노드 ID만 넣고 다음에 읽을 인접 위치는 next_edge에 두어
+        # 노드마다 반복자 객체를 만들지 않음 (깊은 스택에서 GC 부담이 큼)
+        next_edge = indptr[:-1]
+        parent_ids = [-1] * num_nodes
+        discovery_ids = [0] * num_nodes
+        finish_ids = [0] * num_nodes
+        finish_order = []
+        order = [start]
+        clock = 1
+        discovery_ids[start] = clock
+        remaining.discard(start)
+        
+        # 행이 오름차순이므로 앞에서부터 읽으면 알파벳 순서로 방문
+        # (시작 노드가 유일한 목표이면 바로 종료)
+        stack = [] if self.targets and not remaining else [start]
+        
+        while stack:
+            current = stack[-1]
+            position = next_edge[current]
+            end = indptr[current + 1]
+            
+            # 이미 방문한 인접 노드는 건너뜀
+            while position < end and discovery_ids[indices[position]]:
+                position += 1
+            if position == end:
+                stack.pop()
+                clock += 1
+                finish_ids[current] = clock
+                finish_order.append(current)
+                continue
+            
+            neighbor = indices[position]
+            next_edge[current] = position + 1
+            order.append(neighbor)
+            parent_ids[neighbor] = current
+            clock += 1
+            discovery_ids[neighbor] = clock
+            
+            if neighbor in remaining:
+                remaining.discard(neighbor)
+                if not remaining:
+                    break
+            
+            stack.append(neighbor)
+        
+        # 방문 순서만 노드 이름으로 변환하고 parent/discovery/finish는 ID 배열 위의 뷰로 노출
+        self.visit_order.extend(map(labels.__getitem__, order))
+        self.visited.update_ids(order)
+        self.stack.extend(map(labels.__getitem__, stack))
+        self.parent = IdArrayView(csr, order, parent_ids, discovery_ids, labeled=True)
+        self.discovery = IdArrayView(csr, order, discovery_ids, discovery_ids)
+        self.finish = IdArrayView(csr, finish_order, finish_ids, finish_ids)
+        self.current_path = self.visit_order.copy()
         self.is_complete = True
-        yield final_step
+        
+        return {
+            'visit_order': self.visit_order,
+            'parent': self.parent,
+            'discovery': self.discovery,
+            'finish': self.finish,
+            'found_target': not remaining,
+            'targets': self.get_target_results()
+        }
     
     def get_path_to_node(self, target_node: str) -> Optional[List[str]]:
         """
-        특정 노드까지의 경로 반환 (실제로는 DFS에서 정확한 경로를 구하기 어려움)
+        DFS 트리에서 시작 노드부터 특정 노드까지의 경로 반환 (경로 길이에 비례하는 시간)
         
         Args:
             target_node: 목표 노드
@@ -144,16 +392,90 @@ class DFS:
         Returns:
             경로 리스트 또는 None
         """
-        if target_node not in self.visited:
+        if target_node not in self.parent:
             return None
         
-        # DFS에서는 방문 순서가 곧 경로가 아니므로,
-        # 간단히 방문 순서에서 목표 노드까지만 반환
-        try:
-            target_index = self.visit_order.index(target_node)
-            return self.visit_order[:target_index + 1]
-        except ValueError:
-            return None
+        path = []
+        current = target_node
+        
+        while current is not None:
+            path.append(current)
+            current = self.parent[current]
+        
+        return path[::-1]  # 역순으로 반환하여 시작->목표 순서로 만듦
+    
+    def get_parent(self, node: str) -> Optional[str]:
+        """노드의 부모 노드 반환"""
+        return self.parent.get(node)
+    
+    def get_discovery_time(self, node: str) -> Optional[int]:
+        """노드를 발견한 시각 반환"""
+        return self.discovery.get(node)
+    
+    def get_finish_time(self, node: str) -> Optional[int]:
+        """노드의 탐색이 끝난 시각 반환 (아직 끝나지 않았으면 None)"""
+        return self.finish.get(node)
+    
+    def is_ancestor(self, ancestor: str, node: str) -> bool:
+        """
+        DFS 트리에서 ancestor가 node의 조상인지 확인 (자기 자신 포함, O(1))
+        
+        발견-완료 구간이 중첩되는 성질을 사용합니다.
+        탐색이 중간에 멈춰 ancestor가 아직 완료되지 않았다면, 그 뒤에 발견된 노드는 모두 자손입니다.
+        
+        Args:
+            ancestor: 조상 후보 노드
+            node: 노드
+            
+        Returns:
+            조상 여부
+        """
+        if ancestor not in self.discovery or node not in self.discovery:
+            return False
+        if self.discovery[ancestor] > self.discovery[node]:
+            return False
+        if ancestor not in self.finish:
+            return True
+        return node in self.finish and self.finish[node] <= self.finish[ancestor]
+    
+    def get_tree_edges(self) -> List[Tuple[str, str]]:
+        """DFS 트리의 간선들 반환"""
+        tree_edges = []
+        for node, parent in self.parent.items():
+            if parent is not None:
+                tree_edges.append((parent, node))
+        return tree_edges
+    
+    def get_target_results(self) -> Dict[str, Dict]:
+        """
+        목표 노드별 탐색 결과 반환
+        
+        Returns:
+            목표 노드 -> step(발견한 단계 번호, run()에서는 None), visit_time(방문 순번), path(경로)
+            (찾지 못한 목표는 모두 None)
+        """
+        results = {}
+        for target in self.targets:
+            visit_time = self.get_visit_time(target)
+            results[target] = {
+                'step': self.target_steps.get(target),
+                'visit_time': visit_time,
+                'path': self.get_path_to_node(target) if visit_time is not None else None
+            }
+        return results
+    
+    @property
+    def visit_rank(self) -> Dict[str, int]:
+        """
+        노드 -> 방문 순번(1부터) 인덱스
+        
+        visit_order에 새로 추가된 부분만 반영하므로 조회할 때마다 O(1)(분할 상환)입니다.
+        """
+        rank = self._visit_rank
+        visit_order = self.visit_order
+        for position in range(len(rank), len(visit_order)):
+            rank[visit_order[position]] = position + 1
+        return rank
     
     def get_statistics(self) -> Dict:
         """탐색 통계 정보 반환"""
@@ -165,19 +487,23 @@ class DFS:
             'visited_nodes': visited_count,
             'unvisited_nodes': total_nodes - visited_count,
             'visit_order': self.visit_order.copy(),
-            'total_steps': len(self.steps),
+            'total_steps': len(self.trace) if self.trace else 0,
             'algorithm': 'DFS',
             'completion_rate': (visited_count / total_nodes * 100) if total_nodes > 0 else 0
         }
     
     def get_step(self, step_number: int) -> Optional[Dict]:
-        """특정 단계의 정보 반환"""
+        """특정 단계의 정보 반환 (델타만 기록된 경우 재구성)"""
         if 0 <= step_number < len(self.steps):
             return self.steps[step_number]
+        if self.trace and 0 <= step_number < len(self.trace):
+            return self.trace[step_number].to_dict()
         return None
     
     def get_all_steps(self) -> List[Dict]:
         """모든 단계의 정보 반환"""
+        if not self.steps and self.trace:
+            return [snapshot.to_dict() for snapshot in self.trace]
         return self.steps.copy()
     
     def is_node_visited(self, node: str) -> bool:
@@ -186,7 +512,4 @@ class DFS:
     
     def get_visit_time(self, node: str) -> Optional[int]:
         """노드가 몇 번째로 방문되었는지 반환"""
-        try:
-            return self.visit_order.index(node) + 1
-        except ValueError:
-            return None 
\ No newline at end of file
+        return self.visit_rank.get(node) 
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+레벨 동기식 벡터화 BFS
+
+큐에서 노드를 하나씩 꺼내는 대신 한 레벨(프런티어) 전체의 인접 노드를 numpy 배열 연산으로
+한 번에 모읍니다. 단계별 시각화가 필요 없는 대규모 분석용 엔진으로,
+BFS.run(vectorized=True)에서 사용합니다.
+
+부모는 프런티어에서 먼저 나온 노드가 차지하도록 인접 노드의 첫 등장 위치를 골라내므로
+큐 기반 BFS와 같은 level, parent, 방문 순서를 만듭니다.
+"""
+
+import numpy as np
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .csr import CSRGraph
+
+# 프런티어, 레벨 배열 -> (새로 발견한 인접 노드, 그 노드를 가져온 프런티어 노드)
+ExpandFunc = Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+
+def gather_neighbors(indptr: np.ndarray, indices: np.ndarray, frontier: np.ndarray):
+    """
+    프런티어 노드들의 인접 노드를 프런티어 순서대로 이어 붙여 반환
+
+    Args:
+        indptr: CSR 행 시작 위치 배열
+        indices: CSR 인접 노드 ID 배열
+        frontier: 노드 ID 배열
+
+    Returns:
+        (인접 노드 ID 배열, 각 인접 노드를 가져온 프런티어 노드 ID 배열)
+    """
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    # 각 행의 시작 위치를 행 길이만큼 반복한 뒤 행 안에서의 위치를 더함
+    row_offsets = np.cumsum(counts) - counts
+    positions = np.repeat(starts - row_offsets, counts) + np.arange(total)
+    return indices[positions].astype(np.int64), np.repeat(frontier, counts)
+
+
+def expand_frontier(indptr: np.ndarray, indices: np.ndarray, frontier: np.ndarray,
+                    level: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """프런티어의 인접 노드 중 아직 레벨이 없는 것만 프런티어 순서대로 반환"""
+    neighbors, owners = gather_neighbors(indptr, indices, frontier)
+    fresh = level[neighbors] < 0
+    return neighbors[fresh], owners[fresh]
+
+
+def level_synchronous_bfs(csr: CSRGraph, start_ids: Iterable[int], target_ids: Iterable[int] = (),
+                          expand: Optional[ExpandFunc] = None,
+                          level: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    레벨 단위로 BFS 실행
+
+    Args:
+        csr: CSR 스냅샷
+        start_ids: 시작 노드 ID들 (모두 레벨 0)
+        target_ids: 목표 노드 ID들 (모두 방문하면 종료, 그래프에 없는 목표는 -1)
+        expand: 프런티어 확장 함수 (None이면 현재 프로세스에서 expand_frontier 실행,
+                병렬 엔진은 작업 프로세스에 나누어 실행하는 함수를 넘김)
+        level: 레벨을 기록할 int64 배열 (병렬 엔진의 공유 메모리용, None이면 새로 만듦)
+
+    Returns:
+        order(방문 순서), queue(종료 시 큐에 남은 노드), level/parent/source(노드 ID로 색인,
+        도달하지 못한 노드는 -1), level_counts(레벨별 발견한 노드 수), found_target을 담은 딕셔너리
+    """
+    num_nodes = csr.number_of_nodes()
+    if level is None:
+        level = np.empty(num_nodes, dtype=np.int64)
+    level.fill(-1)
+    if expand is None:
+        def expand(frontier, level):
+            return expand_frontier(csr.indptr, csr.indices, frontier, level)
+    parent = np.full(num_nodes, -1, dtype=np.int64)
+    source = np.full(num_nodes, -1, dtype=np.int64)
+
+    # 노드 -> 이번 레벨에서 그 노드가 처음 나온 위치 (레벨마다 사용한 칸만 되돌림)
+    unclaimed = np.iinfo(np.int64).max
+    claim = np.full(num_nodes, unclaimed, dtype=np.int64)
+
+    frontier = np.fromiter(dict.fromkeys(start_ids), dtype=np.int64)
+    level[frontier] = 0
+    source[frontier] = frontier
+
+    remaining = set(target_ids)
+    visited_parts = []
+    queue = np.empty(0, dtype=np.int64)
+    depth = 0
+
+    while frontier.size:
+        # 이번 레벨에서 마지막 목표를 꺼내면 그 목표까지만 방문하고 그 앞의 노드만 확장
+        found = {target for target in remaining if target >= 0 and level[target] == depth}
+        remaining -= found
+        if found and not remaining:
+            last = int(np.flatnonzero(np.isin(frontier, list(found)))[-1])
+            visited_parts.append(frontier[:last + 1])
+            expand_ids, rest = frontier[:last], frontier[last + 1:]
+        else:
+            visited_parts.append(frontier)
+            expand_ids, rest = frontier, None
+
+        neighbors, owners = expand(expand_ids, level)
+
+        # 같은 노드가 여러 번 나오면 프런티어에서 먼저 나온 노드가 부모
+        # (위치의 최솟값만 남기므로 정렬 없이 첫 등장 위치를 순서대로 얻음)
+        positions = np.arange(neighbors.size)
+        np.minimum.at(claim, neighbors, positions)
+        first = np.flatnonzero(claim[neighbors] == positions)
+        claim[neighbors] = unclaimed
+        discovered = neighbors[first]
+        level[discovered] = depth + 1
+        parent[discovered] = owners[first]
+        source[discovered] = source[owners[first]]
+
+        if rest is not None:
+            queue = np.concatenate([rest, discovered])
+            break
+
+        frontier = discovered
+        depth += 1
+
+    reached = level[level >= 0]
+    return {
+        'order': np.concatenate(visited_parts) if visited_parts else np.empty(0, dtype=np.int64),
+        'queue': queue,
+        'level': level,
+        'parent': parent,
+        'source': source,
+        'level_counts': np.bincount(reached) if reached.size else np.zeros(1, dtype=np.int64),
+        'found_target': not remaining
+    }
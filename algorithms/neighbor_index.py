@@ -0,0 +1,115 @@
+"""
+정렬된 인접 노드 인덱스
+
+BFS/DFS는 노드를 확장할 때마다 인접 노드를 알파벳 순서로 정렬합니다.
+같은 그래프에서 탐색을 반복해도 정렬은 노드당 한 번만 하도록 결과를 캐시하고,
+GraphUtils로 그래프를 수정하면 영향을 받은 노드만 무효화합니다.
+벡터화 BFS가 쓰는 CSR 스냅샷도 같은 방식으로 보관하며, 그래프가 수정되면 버립니다.
+
+캐시는 수정이 GraphUtils를 거치는 그래프(지문이 있는 그래프, track() 참고)에서만 사용합니다.
+그 밖의 NetworkX 그래프는 언제든 직접 수정될 수 있으므로 매번 그래프에서 바로 읽습니다.
+"""
+
+import weakref
+import networkx as nx
+from typing import Dict, Optional, Tuple
+
+from .csr import CSRGraph
+
+
+class NeighborIndex:
+    """그래프별 정렬된 인접 리스트 캐시"""
+
+    # 그래프 -> 인덱스 (그래프가 사라지면 인덱스도 함께 정리됨)
+    _instances: 'weakref.WeakKeyDictionary[nx.Graph, NeighborIndex]' = weakref.WeakKeyDictionary()
+
+    def __init__(self, graph: nx.Graph):
+        """
+        NeighborIndex 초기화 (보통 for_graph()로 얻어서 사용)
+
+        Args:
+            graph: NetworkX 그래프
+        """
+        # 캐시가 그래프를 붙잡지 않도록 약한 참조로 보관
+        self._graph = weakref.ref(graph)
+        self._ascending: Dict[str, Tuple[str, ...]] = {}
+        self._csr: Optional[CSRGraph] = None
+
+        # GraphUtils가 수정을 알려 주는 그래프인지 (아니면 캐시하지 않음)
+        self.tracked = False
+
+    @classmethod
+    def for_graph(cls, graph: nx.Graph) -> 'NeighborIndex':
+        """그래프에 연결된 인덱스 반환 (없으면 생성)"""
+        index = cls._instances.get(graph)
+        if index is None:
+            index = cls(graph)
+            cls._instances[graph] = index
+        return index
+
+    @classmethod
+    def track(cls, graph: nx.Graph):
+        """
+        그래프의 수정을 GraphUtils가 알려 준다고 표시하고 캐시를 비움
+
+        그래프 지문을 만들거나 다시 계산할 때 호출됩니다. 그 전에 직접 수정된 내용이
+        캐시에 남지 않도록 기존 캐시는 버립니다.
+        """
+        index = cls.for_graph(graph)
+        index.tracked = True
+        index.clear()
+
+    @classmethod
+    def invalidate_nodes(cls, graph: nx.Graph, *nodes: str):
+        """그래프 수정 후 영향을 받은 노드들의 캐시 무효화"""
+        index = cls._instances.get(graph)
+        if index is not None:
+            index.invalidate(*nodes)
+
+    def ascending(self, node: str) -> Tuple[str, ...]:
+        """
+        알파벳 오름차순으로 정렬된 인접 노드 반환
+
+        Args:
+            node: 노드
+
+        Returns:
+            정렬된 인접 노드 튜플 (DFS는 reversed()로 내림차순 사용)
+        """
+        adjacency = self._graph().adj[node]
+        if not self.tracked:
+            return tuple(sorted(adjacency))
+
+        neighbors = self._ascending.get(node)
+
+        # 지문이 있는 그래프를 GraphUtils 밖에서 수정한 경우에 대한 최소한의 안전장치
+        if neighbors is None or len(neighbors) != len(adjacency):
+            neighbors = tuple(sorted(adjacency))
+            self._ascending[node] = neighbors
+
+        return neighbors
+
+    def csr(self) -> CSRGraph:
+        """
+        그래프의 CSR 스냅샷 반환 (추적 중인 그래프가 수정되지 않았으면 이전 스냅샷 재사용)
+
+        Returns:
+            CSRGraph 스냅샷
+        """
+        graph = self._graph()
+        if not self.tracked:
+            return CSRGraph.from_graph(graph)
+        if self._csr is None or self._csr.number_of_nodes() != graph.number_of_nodes():
+            self._csr = CSRGraph.from_graph(graph)
+        return self._csr
+
+    def invalidate(self, *nodes: str):
+        """특정 노드들의 캐시 제거 (CSR 스냅샷은 전체가 바뀌므로 버림)"""
+        for node in nodes:
+            self._ascending.pop(node, None)
+        self._csr = None
+
+    def clear(self):
+        """전체 캐시 제거"""
+        self._ascending.clear()
+        self._csr = None
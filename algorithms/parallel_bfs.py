@@ -0,0 +1,154 @@
+"""
+프로세스 병렬 레벨 동기식 BFS
+
+CSR 배열(indptr/indices)과 레벨 배열을 multiprocessing.shared_memory에 올려 두고,
+매 레벨마다 프런티어를 연속된 조각으로 나누어 작업 프로세스가 인접 노드를 모읍니다.
+작업 프로세스는 공유 메모리를 읽기만 하고, 레벨/부모 기록은 주 프로세스가 합니다.
+
+조각 결과를 프런티어 순서대로 이어 붙인 뒤 level_sync와 같은 첫 등장 위치 규칙으로
+병합하므로, 프로세스 수와 관계없이 직렬 엔진과 같은 level, parent, 방문 순서를 만듭니다.
+"""
+
+import os
+import numpy as np
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .csr import CSRGraph
+from .level_sync import expand_frontier, level_synchronous_bfs
+
+# 이보다 작은 프런티어는 프로세스 간 전송 비용이 더 크므로 주 프로세스에서 확장
+MIN_PARALLEL_FRONTIER = 4096
+
+_UNCLAIMED = np.iinfo(np.int64).max
+
+# 작업 프로세스의 공유 배열 (초기화 함수에서 연결)
+_worker_state: Dict[str, object] = {}
+
+
+class SharedArrays:
+    """numpy 배열을 공유 메모리 블록으로 복사해 두고 작업 프로세스가 이름으로 연결하게 하는 묶음"""
+
+    def __init__(self):
+        self._blocks: List[SharedMemory] = []
+        self.specs: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+
+    def share(self, key: str, array: np.ndarray) -> np.ndarray:
+        """
+        배열을 공유 메모리에 복사
+
+        Args:
+            key: 작업 프로세스에서 사용할 이름
+            array: 복사할 배열
+
+        Returns:
+            공유 메모리를 가리키는 배열 (주 프로세스에서 쓰기 가능)
+        """
+        block = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        shared[...] = array
+        self.specs[key] = (block.name, array.shape, array.dtype.str)
+        return shared
+
+    def close(self):
+        """공유 메모리 블록 해제"""
+        for block in self._blocks:
+            block.unlink()
+            try:
+                block.close()
+            except BufferError:
+                pass  # 예외로 배열 참조가 남은 경우 - 이름은 이미 제거했으므로 참조가 사라질 때 해제됨
+        self._blocks.clear()
+        self.specs.clear()
+
+    def __enter__(self) -> 'SharedArrays':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _init_worker(specs: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+    """작업 프로세스 초기화 - 공유 메모리 블록에 연결"""
+    blocks = []
+    for key, (name, shape, dtype) in specs.items():
+        block = SharedMemory(name=name)
+        blocks.append(block)
+        _worker_state[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    _worker_state['blocks'] = blocks  # 프로세스가 끝날 때까지 연결 유지
+
+
+def _expand_chunk(frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    프런티어 조각 확장 (작업 프로세스에서 실행)
+
+    조각 안에서 처음 나온 인접 노드만 돌려보내 전송량을 줄입니다.
+    전체 첫 등장 위치는 항상 어떤 조각의 첫 등장 위치이므로 병합 결과는 바뀌지 않습니다.
+    """
+    neighbors, owners = expand_frontier(_worker_state['indptr'], _worker_state['indices'],
+                                        frontier, _worker_state['level'])
+    claim = _worker_state.get('claim')
+    if claim is None:
+        claim = _worker_state['claim'] = np.full(len(_worker_state['level']), _UNCLAIMED, dtype=np.int64)
+
+    positions = np.arange(neighbors.size)
+    np.minimum.at(claim, neighbors, positions)
+    first = np.flatnonzero(claim[neighbors] == positions)
+    claim[neighbors] = _UNCLAIMED
+    return neighbors[first], owners[first]
+
+
+def parallel_level_synchronous_bfs(csr: CSRGraph, start_ids: Iterable[int],
+                                   target_ids: Iterable[int] = (),
+                                   processes: Optional[int] = None,
+                                   min_parallel_frontier: int = MIN_PARALLEL_FRONTIER) -> Dict[str, np.ndarray]:
+    """
+    작업 프로세스로 프런티어를 나누어 레벨 단위 BFS 실행
+
+    Args:
+        csr: CSR 스냅샷
+        start_ids: 시작 노드 ID들 (모두 레벨 0)
+        target_ids: 목표 노드 ID들 (모두 방문하면 종료, 그래프에 없는 목표는 -1)
+        processes: 작업 프로세스 수 (None이면 CPU 코어 수)
+        min_parallel_frontier: 이보다 작은 프런티어는 주 프로세스에서 확장
+
+    Returns:
+        level_synchronous_bfs()와 같은 결과 딕셔너리
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes <= 1:
+        return level_synchronous_bfs(csr, start_ids, target_ids)
+
+    with SharedArrays() as shared:
+        # 공유 배열을 가리키는 참조는 _run_shared() 안에서만 사용하고 블록 해제 전에 사라짐
+        return _run_shared(shared, csr, start_ids, target_ids, processes, min_parallel_frontier)
+
+
+def _run_shared(shared: SharedArrays, csr: CSRGraph, start_ids: Iterable[int],
+                target_ids: Iterable[int], processes: int,
+                min_parallel_frontier: int) -> Dict[str, np.ndarray]:
+    """공유 메모리에 CSR을 올리고 작업 프로세스 풀로 실행"""
+    indptr = shared.share('indptr', csr.indptr)
+    indices = shared.share('indices', csr.indices)
+    level = shared.share('level', np.full(csr.number_of_nodes(), -1, dtype=np.int64))
+
+    with get_context().Pool(processes, initializer=_init_worker,
+                            initargs=(shared.specs,)) as pool:
+
+        def expand(frontier: np.ndarray, level: np.ndarray):
+            if frontier.size < min_parallel_frontier:
+                return expand_frontier(indptr, indices, frontier, level)
+
+            # 연속된 조각으로 나누고 결과를 조각 순서대로 이어 붙여 프런티어 순서 유지
+            chunks = np.array_split(frontier, processes)
+            parts = pool.map(_expand_chunk, chunks)
+            return (np.concatenate([neighbors for neighbors, _ in parts]),
+                    np.concatenate([owners for _, owners in parts]))
+
+        result = level_synchronous_bfs(csr, start_ids, target_ids, expand=expand, level=level)
+
+    # 결과의 level은 공유 메모리를 가리키므로 일반 배열로 복사
+    result['level'] = result['level'].copy()
+    return result
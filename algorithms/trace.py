@@ -0,0 +1,596 @@
+"""
+탐색 단계 델타 기록 (Delta-encoded step trace)
+
+각 단계마다 전체 상태(visited, visit_order, queue/stack, level)를 복사하는 대신
+그 단계에서 바뀐 내용만 StepRecord로 기록하고, 필요할 때 전체 상태를 다시 구성합니다.
+SearchTimeline은 주기적인 키프레임을 함께 보관하여 임의의 단계로 빠르게 이동합니다.
+"""
+
+import sys
+from collections import deque
+from itertools import islice
+from enum import Enum
+from typing import List, Dict, Optional, Iterator, Iterable, Union, NamedTuple, Tuple, Callable, AbstractSet
+
+
+class StepAction(Enum):
+    """탐색 단계의 동작 종류"""
+    VISIT = 'visit'
+    QUEUE_UPDATE = 'queue_update'
+    STACK_UPDATE = 'stack_update'
+    COMPLETE = 'complete'
+    ERROR = 'error'
+
+
+def intern_node(node: str) -> str:
+    """문자열 노드 ID를 intern하여 단계 기록끼리 같은 객체를 공유하도록 함"""
+    return sys.intern(node) if type(node) is str else node
+
+
+def _is_node(value, graph) -> bool:
+    """값이 그래프의 노드인지 (리스트처럼 해시할 수 없는 컬렉션은 False)"""
+    if graph is None:
+        return False
+    try:
+        return value in graph
+    except TypeError:
+        return False
+
+
+def as_sources(start_node: Union[str, Iterable[str]], graph=None) -> List[str]:
+    """
+    시작 노드 인자를 시작 노드 목록으로 변환 (다중 시작점 BFS용)
+
+    문자열 하나는 시작 노드 하나로, 컬렉션은 중복을 제거한 순서 그대로의 목록으로 취급합니다.
+    graph를 주면 그래프의 노드인 인자는 튜플 노드 ID처럼 반복 가능하더라도 노드 하나로 취급합니다.
+    """
+    if (isinstance(start_node, str) or not isinstance(start_node, Iterable)
+            or _is_node(start_node, graph)):
+        return [start_node]
+    return list(dict.fromkeys(start_node))
+
+
+def as_targets(target_node: Union[str, Iterable[str], None], graph=None) -> List[str]:
+    """
+    목표 노드 인자를 목표 노드 목록으로 변환 (None이면 빈 목록, graph는 as_sources()와 같음)
+
+    0이나 빈 문자열처럼 거짓으로 평가되는 노드 ID도 목표로 취급하고 None만 제외합니다.
+    """
+    if target_node is None:
+        return []
+    return [node for node in as_sources(target_node, graph) if node is not None]
+
+
+class StepRecord(NamedTuple):
+    """
+    한 단계에서 바뀐 내용만 담은 기록
+
+    Attributes:
+        step: 단계 번호
+        action: 동작 종류
+        node: 현재 노드 (ERROR인 경우 존재하지 않는 시작 노드 또는 backward=True이면 목표 노드,
+              양방향 BFS의 COMPLETE인 경우 두 탐색이 만난 간선의 시작 쪽 노드)
+        added: 큐/스택에 추가된 노드들 (추가한 순서, 양방향 BFS의 COMPLETE인 경우
+               간선의 목표 쪽 노드부터 목표 노드까지 시작 쪽 레벨에 이어 붙인 경로)
+        popped: 방문 전에 스택에서 꺼낸 항목 수 (건너뛴 항목 포함)
+        found_target: 목표 노드 발견 여부
+        level: 방문한 노드의 레벨 (BFS만, 그 외 -1)
+        backward: 양방향 BFS에서 목표 노드 쪽 탐색의 단계인지 여부
+    """
+    step: int
+    action: StepAction
+    node: Optional[str] = None
+    added: Tuple[str, ...] = ()
+    popped: int = 0
+    found_target: bool = False
+    level: int = -1
+    backward: bool = False
+
+    @property
+    def message(self) -> str:
+        """화면에 표시할 메시지 (표시할 때만 생성)"""
+        action = self.action
+        prefix = '역방향 ' if self.backward else ''
+        if action is StepAction.VISIT:
+            if self.found_target:
+                message = f"목표 노드 '{self.node}' 발견!"
+            else:
+                message = f"{prefix}노드 '{self.node}' 방문"
+            if self.level >= 0:
+                message += f" (레벨: {self.level})"
+            return message
+        if action is StepAction.QUEUE_UPDATE:
+            return f"{prefix}큐에 인접 노드들 추가: {list(self.added)}"
+        if action is StepAction.STACK_UPDATE:
+            return f"스택에 인접 노드들 추가: {list(self.added[::-1])}"
+        if action is StepAction.ERROR and self.backward:
+            return f"목표 노드 '{self.node}'가 그래프에 존재하지 않습니다."
+        if action is StepAction.ERROR:
+            return f"시작 노드 '{self.node}'가 그래프에 존재하지 않습니다."
+        if self.node is not None:
+            return f"양쪽 탐색이 간선 ({self.node}, {self.added[0]})에서 만남 - 탐색 완료!"
+        return '탐색 완료!'
+
+
+def build_step(algorithm: str, record: StepRecord, visited: AbstractSet[str], visit_order: List[str],
+               frontier: Union[List[str], deque], level: Optional[Dict[str, int]] = None,
+               backward_frontier: Optional[deque] = None,
+               backward_level: Optional[Dict[str, int]] = None) -> Dict:
+    """
+    단계 기록과 현재 상태로 기존 형식의 단계 딕셔너리 생성 (호환용 뷰)
+
+    Args:
+        algorithm: 'BFS', 'BiBFS' 또는 'DFS'
+        record: 단계 기록
+        visited: 방문한 노드 집합
+        visit_order: 방문 순서
+        frontier: BFS의 큐 또는 DFS의 스택
+        level: BFS 레벨 정보 (DFS는 None)
+        backward_frontier: 양방향 BFS의 목표 노드 쪽 큐
+        backward_level: 양방향 BFS의 목표 노드로부터의 거리
+
+    Returns:
+        전체 상태가 복사된 단계 정보
+    """
+    action = record.action
+    if action is StepAction.ERROR:
+        return {'error': record.message}
+
+    is_complete = action is StepAction.COMPLETE
+    step_info = {
+        'step': record.step,
+        'action': action.value,
+        'current_node': record.node,
+        'visited': visited.copy(),
+        'visit_order': visit_order.copy(),
+    }
+
+    if algorithm != 'DFS':
+        step_info['queue'] = [] if is_complete else list(frontier)
+        step_info['level'] = level.copy()
+        if algorithm == 'BiBFS':
+            step_info['direction'] = 'backward' if record.backward else 'forward'
+            step_info['backward_queue'] = [] if is_complete else list(backward_frontier)
+            step_info['backward_level'] = backward_level.copy()
+    else:
+        step_info['stack'] = [] if is_complete else list(frontier)
+        step_info['current_path'] = visit_order.copy()
+
+    step_info['message'] = record.message
+    step_info['found_target'] = record.found_target
+
+    if action is StepAction.QUEUE_UPDATE:
+        step_info['added_neighbors'] = list(record.added)
+
+    return step_info
+
+
+class StepSnapshot:
+    """특정 단계의 전체 상태 (타임라인에서 재구성한 읽기용 뷰)"""
+
+    __slots__ = ('algorithm', 'record', 'visited', 'visit_order', 'frontier', 'level',
+                 'backward_frontier', 'backward_level')
+
+    def __init__(self, algorithm: str, record: StepRecord, visited: AbstractSet[str],
+                 visit_order: List[str], frontier: Tuple[str, ...],
+                 level: Optional[Dict[str, int]] = None,
+                 backward_frontier: Optional[Tuple[str, ...]] = None,
+                 backward_level: Optional[Dict[str, int]] = None):
+        self.algorithm = algorithm
+        self.record = record
+        self.visited = visited
+        self.visit_order = visit_order
+        self.frontier = frontier
+        self.level = level
+        self.backward_frontier = backward_frontier
+        self.backward_level = backward_level
+
+    @property
+    def step(self) -> int:
+        return self.record.step
+
+    @property
+    def action(self) -> StepAction:
+        return self.record.action
+
+    @property
+    def current_node(self) -> Optional[str]:
+        return self.record.node
+
+    @property
+    def found_target(self) -> bool:
+        return self.record.found_target
+
+    @property
+    def message(self) -> str:
+        return self.record.message
+
+    def to_dict(self) -> Dict:
+        """기존 형식의 단계 딕셔너리로 변환"""
+        return build_step(self.algorithm, self.record, self.visited, self.visit_order,
+                          self.frontier, self.level, self.backward_frontier, self.backward_level)
+
+
+class TraceState:
+    """델타를 순서대로 적용하여 재구성한 탐색 상태"""
+
+    def __init__(self, algorithm: str, start_node: Union[str, Iterable[str]],
+                 target_node: Optional[str] = None, distinct_stack: bool = False,
+                 visited_factory: Optional[Callable[[], AbstractSet[str]]] = None):
+        """
+        초기 상태 생성 (탐색 시작 직전 상태)
+
+        Args:
+            algorithm: 'BFS', 'BiBFS' 또는 'DFS'
+            start_node: 시작 노드 (BFS는 시작 노드 컬렉션도 가능)
+            target_node: 목표 노드 (양방향 BFS에서만 사용)
+            distinct_stack: DFS의 중복 없는 스택 모드 (스택을 순서 있는 dict로 보관)
+            visited_factory: 빈 방문 집합 생성 함수 (예: 비트셋, None이면 set)
+        """
+        self.algorithm = algorithm
+        self.distinct_stack = distinct_stack
+        self.visited: AbstractSet[str] = visited_factory() if visited_factory else set()
+        self.visit_order: List[str] = []
+        self.level: Dict[str, int] = {}
+        self.backward_frontier: Optional[deque] = None
+        self.backward_level: Dict[str, int] = {}
+
+        if algorithm == 'DFS' and distinct_stack:
+            self.frontier: Union[List[str], deque, Dict[str, None]] = {start_node: None}
+        elif algorithm == 'DFS':
+            self.frontier = [start_node]
+        else:
+            self.frontier = deque(as_sources(start_node))
+            self.visited.update(self.frontier)
+            self.level = dict.fromkeys(self.frontier, 0)
+
+        if algorithm == 'BiBFS':
+            self.backward_frontier = deque()
+            # 시작 노드와 목표 노드가 같으면 역방향 탐색은 시작하지 않음
+            if target_node not in self.level:
+                self.backward_frontier.append(target_node)
+                self.visited.add(target_node)
+                self.backward_level[target_node] = 0
+
+    def copy(self) -> 'TraceState':
+        """독립적인 상태 복사본 반환"""
+        state = TraceState.__new__(TraceState)
+        state.algorithm = self.algorithm
+        state.distinct_stack = self.distinct_stack
+        state.visited = self.visited.copy()
+        state.visit_order = self.visit_order.copy()
+        state.level = self.level.copy()
+        state.frontier = self.frontier.copy()
+        state.backward_level = self.backward_level.copy()
+        state.backward_frontier = None
+        if self.backward_frontier is not None:
+            state.backward_frontier = self.backward_frontier.copy()
+        return state
+
+    def apply(self, record: StepRecord):
+        """단계 기록 하나를 상태에 적용"""
+        action = record.action
+
+        if action is StepAction.VISIT:
+            node = record.node
+            if self.algorithm == 'DFS' and self.distinct_stack:
+                self.frontier.popitem()
+                self.visited.add(node)
+            elif self.algorithm == 'DFS':
+                for _ in range(record.popped):
+                    self.frontier.pop()
+                self.visited.add(node)
+            elif record.backward:
+                self.backward_frontier.popleft()
+            else:
+                self.frontier.popleft()
+            self.visit_order.append(node)
+        elif action is StepAction.QUEUE_UPDATE:
+            if record.backward:
+                frontier, level = self.backward_frontier, self.backward_level
+            else:
+                frontier, level = self.frontier, self.level
+            next_level = level[record.node] + 1
+            for neighbor in record.added:
+                self.visited.add(neighbor)
+                level[neighbor] = next_level
+                frontier.append(neighbor)
+        elif action is StepAction.COMPLETE and record.node is not None:
+            # 양방향 BFS: 만난 간선 너머의 역방향 경로를 시작 쪽 레벨에 이어 붙임
+            next_level = self.level[record.node] + 1
+            for offset, node in enumerate(record.added):
+                self.level[node] = next_level + offset
+        elif action is StepAction.STACK_UPDATE and self.distinct_stack:
+            # 이미 스택에 있던 노드는 맨 위로 이동
+            for neighbor in record.added:
+                self.frontier.pop(neighbor, None)
+                self.frontier[neighbor] = None
+        elif action is StepAction.STACK_UPDATE:
+            self.frontier.extend(record.added)
+
+    def snapshot(self, record: StepRecord) -> StepSnapshot:
+        """현재 상태의 복사본으로 단계 스냅샷 생성"""
+        is_complete = record.action is StepAction.COMPLETE
+        frontier = () if is_complete else tuple(self.frontier)
+        snapshot = StepSnapshot(self.algorithm, record, self.visited.copy(), self.visit_order.copy(),
+                                frontier, self.level.copy() if self.algorithm != 'DFS' else None)
+        if self.backward_frontier is not None:
+            snapshot.backward_frontier = () if is_complete else tuple(self.backward_frontier)
+            snapshot.backward_level = self.backward_level.copy()
+        return snapshot
+
+
+class SearchTrace:
+    """단계 기록(델타) 목록 - 전체 상태는 요청할 때 재구성"""
+
+    def __init__(self, algorithm: str, start_node: Union[str, Iterable[str]],
+                 target_node: Optional[str] = None, distinct_stack: bool = False,
+                 visited_factory: Optional[Callable[[], AbstractSet[str]]] = None):
+        """
+        SearchTrace 초기화
+
+        Args:
+            algorithm: 'BFS', 'BiBFS' 또는 'DFS'
+            start_node: 시작 노드 (BFS는 시작 노드 컬렉션도 가능)
+            target_node: 목표 노드 (양방향 BFS에서만 필요)
+            distinct_stack: DFS의 중복 없는 스택 모드로 기록된 단계인지 여부
+            visited_factory: 재구성한 상태의 빈 방문 집합 생성 함수 (None이면 set)
+        """
+        self.algorithm = algorithm
+        self.start_node = start_node
+        self.target_node = target_node
+        self.distinct_stack = distinct_stack
+        self.visited_factory = visited_factory
+        self.deltas: List[StepRecord] = []
+
+    def append(self, delta: StepRecord):
+        """단계 기록 추가"""
+        self.deltas.append(delta)
+
+    def __len__(self) -> int:
+        return len(self.deltas)
+
+    def state_at(self, index: int) -> TraceState:
+        """
+        index 번째 단계까지 적용된 상태 반환
+
+        Args:
+            index: 단계 인덱스 (0부터 시작)
+
+        Returns:
+            재구성된 상태
+        """
+        state = TraceState(self.algorithm, self.start_node, self.target_node, self.distinct_stack,
+                           self.visited_factory)
+        for delta in self.deltas[:index + 1]:
+            state.apply(delta)
+        return state
+
+    def __getitem__(self, index: int) -> StepSnapshot:
+        """index 번째 단계의 전체 상태 반환"""
+        if index < 0:
+            index += len(self.deltas)
+        if not 0 <= index < len(self.deltas):
+            raise IndexError('단계 인덱스가 범위를 벗어났습니다.')
+        return self.state_at(index).snapshot(self.deltas[index])
+
+    def __iter__(self) -> Iterator[StepSnapshot]:
+        """처음부터 순서대로 전체 상태 생성"""
+        state = TraceState(self.algorithm, self.start_node, self.target_node, self.distinct_stack,
+                           self.visited_factory)
+        for delta in self.deltas:
+            state.apply(delta)
+            yield state.snapshot(delta)
+
+
+class Keyframe(NamedTuple):
+    """
+    키프레임 (특정 위치까지의 상태를 재구성하는 데 필요한 정보)
+
+    방문 순서와 레벨은 추가만 되므로 타임라인이 공유하는 목록의 길이만 보관하고,
+    앞뒤로 바뀌는 큐/스택만 복사합니다.
+
+    Attributes:
+        visit_count: 방문 순서 길이
+        level_count: 레벨 기록 길이
+        backward_level_count: 역방향 레벨 기록 길이
+        frontier: 큐/스택 복사본
+        backward_frontier: 양방향 BFS의 역방향 큐 복사본 (그 외 None)
+    """
+    visit_count: int
+    level_count: int
+    backward_level_count: int
+    frontier: Union[List[str], deque, Dict[str, None]]
+    backward_frontier: Optional[deque] = None
+
+    @property
+    def nbytes(self) -> int:
+        """키프레임이 차지하는 메모리 (바이트, 노드 문자열 제외)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.frontier)
+        if self.backward_frontier is not None:
+            size += sys.getsizeof(self.backward_frontier)
+        return size
+
+
+def _extend_level_log(level: Dict[str, int], nodes: List[str], values: List[int]):
+    """레벨 사전에 새로 추가된 항목을 기록 목록 끝에 이어 붙임 (기존 항목은 바뀌지 않음)"""
+    added = len(level) - len(nodes)
+    if added > 0:
+        items = list(islice(reversed(level.items()), added))
+        for node, value in reversed(items):
+            nodes.append(node)
+            values.append(value)
+
+
+class SearchTimeline(SearchTrace):
+    """
+    키프레임 + 델타 타임라인 (임의 단계 탐색용)
+
+    keyframe_interval 단계마다 키프레임을 저장하고, 특정 단계는
+    가장 가까운 이전 키프레임에서 최대 keyframe_interval개의 델타만 적용해 재구성합니다.
+    방문 순서와 레벨은 추가만 되므로 타임라인 전체가 한 벌만 보관하고 키프레임에는 그 길이와
+    큐/스택 복사본만 둡니다. 키프레임 메모리가 max_keyframe_bytes를 넘으면 하나 걸러 하나씩 버리고
+    간격을 두 배로 늘려 단계 수와 관계없이 키프레임 메모리를 일정하게 유지합니다.
+
+    탐색 알고리즘이 작업 스레드에서 search_deltas(trace=...)로 직접 기록하는 동안에도
+    다른 한 스레드가 이미 기록된 단계를 조회할 수 있습니다. (append와 조회는 각각 한 스레드만)
+    """
+
+    def __init__(self, algorithm: str, start_node: str, target_node: Optional[str] = None,
+                 distinct_stack: bool = False, keyframe_interval: int = 256,
+                 max_keyframe_bytes: int = 8 * 1024 * 1024,
+                 visited_factory: Optional[Callable[[], AbstractSet[str]]] = None):
+        """
+        SearchTimeline 초기화
+
+        Args:
+            algorithm: 'BFS', 'BiBFS' 또는 'DFS'
+            start_node: 시작 노드
+            target_node: 목표 노드 (양방향 BFS에서만 필요)
+            distinct_stack: DFS의 중복 없는 스택 모드로 기록된 단계인지 여부
+            keyframe_interval: 키프레임 간격 (단계 수)
+            max_keyframe_bytes: 키프레임이 사용할 최대 메모리 (추정치, 바이트)
+            visited_factory: 재구성한 상태의 빈 방문 집합 생성 함수 (None이면 set)
+        """
+        super().__init__(algorithm, start_node, target_node, distinct_stack, visited_factory)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.max_keyframe_bytes = max_keyframe_bytes
+        self.keyframe_bytes = 0
+
+        # 델타 위치 -> 그 위치 이전까지의 델타가 적용된 상태의 키프레임
+        self.keyframes: Dict[int, Keyframe] = {}
+
+        # 마지막 델타까지 적용된 상태
+        self._head = TraceState(algorithm, start_node, target_node, distinct_stack, visited_factory)
+
+        # 레벨이 추가된 순서대로의 (노드, 레벨) 기록 (키프레임이 길이로 공유)
+        self._level_nodes: List[str] = []
+        self._level_values: List[int] = []
+        self._backward_level_nodes: List[str] = []
+        self._backward_level_values: List[int] = []
+        self._log_levels()
+
+        # 순차 재생을 위한 커서 (마지막으로 재구성한 단계)
+        self._cursor_index = -1
+        self._cursor_state: Optional[TraceState] = None
+
+    def _log_levels(self):
+        """마지막 상태의 레벨에 새로 추가된 항목 기록"""
+        head = self._head
+        _extend_level_log(head.level, self._level_nodes, self._level_values)
+        _extend_level_log(head.backward_level, self._backward_level_nodes, self._backward_level_values)
+
+    def append(self, delta: StepRecord):
+        """단계 기록 추가 (필요하면 키프레임 저장)"""
+        self.deltas.append(delta)
+        head = self._head
+        head.apply(delta)
+        self._log_levels()
+
+        position = len(self.deltas)
+        if position % self.keyframe_interval == 0:
+            backward_frontier = head.backward_frontier
+            keyframe = Keyframe(len(head.visit_order), len(self._level_nodes), len(self._backward_level_nodes),
+                                head.frontier.copy(),
+                                backward_frontier.copy() if backward_frontier is not None else None)
+            self.keyframes[position] = keyframe
+            self.keyframe_bytes += keyframe.nbytes
+            if self.keyframe_bytes > self.max_keyframe_bytes:
+                self._thin_keyframes()
+
+    def _thin_keyframes(self):
+        """키프레임을 절반으로 줄이고 간격을 두 배로 늘림"""
+        self.keyframe_interval *= 2
+        self.keyframes = {
+            position: keyframe for position, keyframe in self.keyframes.items()
+            if position % self.keyframe_interval == 0
+        }
+        self.keyframe_bytes = sum(keyframe.nbytes for keyframe in self.keyframes.values())
+
+    def _restore(self, keyframe: Keyframe) -> TraceState:
+        """키프레임과 공유 기록 목록으로 상태 재구성"""
+        head = self._head
+        state = TraceState.__new__(TraceState)
+        state.algorithm = self.algorithm
+        state.distinct_stack = self.distinct_stack
+        state.visit_order = head.visit_order[:keyframe.visit_count]
+        state.level = dict(zip(self._level_nodes[:keyframe.level_count],
+                               self._level_values[:keyframe.level_count]))
+        state.backward_level = dict(zip(self._backward_level_nodes[:keyframe.backward_level_count],
+                                        self._backward_level_values[:keyframe.backward_level_count]))
+        state.frontier = keyframe.frontier.copy()
+        state.backward_frontier = None
+        if keyframe.backward_frontier is not None:
+            state.backward_frontier = keyframe.backward_frontier.copy()
+
+        # BFS는 레벨이 있는 노드, DFS는 방문 순서의 노드가 방문한 노드
+        state.visited = self.visited_factory() if self.visited_factory else set()
+        state.visited.update(state.visit_order)
+        state.visited.update(state.level)
+        state.visited.update(state.backward_level)
+        return state
+
+    def _seek(self, index: int) -> TraceState:
+        """index 번째 단계까지 적용된 내부 커서 상태 반환 (수정 금지)"""
+        # 다른 스레드가 append() 중에 키프레임을 솎아 내도 같은 사전을 보도록 한 번만 읽음
+        # (저장된 키프레임 상태는 이후 수정되지 않음)
+        interval = self.keyframe_interval
+        keyframes = self.keyframes
+        cursor_state = self._cursor_state
+
+        if cursor_state is not None and self._cursor_index <= index < self._cursor_index + interval:
+            # 커서에서 앞으로 진행
+            start = self._cursor_index + 1
+            state = cursor_state
+        else:
+            start = (index + 1) // interval * interval
+            while start > 0 and start not in keyframes:
+                start -= interval
+            if start > 0:
+                state = self._restore(keyframes[start])
+            else:
+                state = TraceState(self.algorithm, self.start_node, self.target_node,
+                                   self.distinct_stack, self.visited_factory)
+
+        for delta in self.deltas[start:index + 1]:
+            state.apply(delta)
+
+        self._cursor_index = index
+        self._cursor_state = state
+        return state
+
+    def estimate_size(self) -> int:
+        """단계 기록, 키프레임, 재생 커서와 노드 문자열이 차지하는 메모리 추정 (바이트)"""
+        size = sys.getsizeof(self.deltas)
+        for record in self.deltas:
+            size += sys.getsizeof(record) + sys.getsizeof(record.added)
+
+        size += sum(sys.getsizeof(log) for log in
+                    (self._level_nodes, self._level_values,
+                     self._backward_level_nodes, self._backward_level_values))
+        size += sum(keyframe.nbytes for keyframe in list(self.keyframes.values()))
+
+        states = [self._head]
+        if self._cursor_state is not None:
+            states.append(self._cursor_state)
+        for state in states:
+            size += sum(sys.getsizeof(container) for container in
+                        (state.visited, state.visit_order, state.level, state.frontier,
+                         state.backward_level, state.backward_frontier)
+                        if container is not None)
+
+        # 노드 문자열은 기록과 상태가 공유하므로 마지막 상태의 방문 집합 기준으로 한 번만 셈
+        size += sum(sys.getsizeof(node) for node in self._head.visited)
+        return size
+
+    def state_at(self, index: int) -> TraceState:
+        """index 번째 단계까지 적용된 상태 반환 (키프레임 기반)"""
+        return self._seek(index).copy()
+
+    def __getitem__(self, index: int) -> StepSnapshot:
+        """index 번째 단계의 전체 상태 반환"""
+        if index < 0:
+            index += len(self.deltas)
+        if not 0 <= index < len(self.deltas):
+            raise IndexError('단계 인덱스가 범위를 벗어났습니다.')
+        return self._seek(index).snapshot(self.deltas[index])
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+탐색 알고리즘 벤치마크
+
+단계별 제너레이터 경로(search, search_deltas)와 결과 전용 경로(run),
+CSR 스냅샷 기반 run, 레벨 동기식 벡터화 BFS, 프로세스 병렬 BFS의 실행 시간을 비교합니다.
+
+실행 방법:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --nodes 50000 --edges 200000
+    python benchmarks/bench_search.py --nodes 250000 --edges 1000000 --skip-full
+    python benchmarks/bench_search.py --nodes 1000000 --edges 4000000 --skip-full --processes 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import networkx as nx
+import numpy as np
+
+# 프로젝트 루트를 모듈 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import BFS, DFS, CSRGraph, level_synchronous_bfs, parallel_level_synchronous_bfs
+
+
+def build_graph(num_nodes: int, num_edges: int, seed: int) -> nx.Graph:
+    """문자열 노드 ID를 가진 무작위 그래프 생성"""
+    G = nx.gnm_random_graph(num_nodes, num_edges, seed=seed)
+    return nx.relabel_nodes(G, {i: f"n{i}" for i in G.nodes()})
+
+
+def measure(func, repeat: int) -> float:
+    """repeat번 실행 중 가장 짧은 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_paths(graph: nx.Graph, csr: CSRGraph, start_node: str, repeat: int,
+                skip_full: bool = False):
+    """알고리즘별 실행 경로 비교"""
+    for algorithm_class in (BFS, DFS):
+        name = algorithm_class.__name__
+        algorithm = algorithm_class(graph)
+        csr_algorithm = algorithm_class(csr)
+
+        cases = [
+            ('search()', lambda: sum(1 for _ in algorithm.search(start_node))),
+            ('search_deltas()', lambda: sum(1 for _ in algorithm.search_deltas(start_node))),
+            ('run()', lambda: algorithm.run(start_node)),
+            ('run() [CSR]', lambda: csr_algorithm.run(start_node)),
+        ]
+        if skip_full:
+            cases = cases[1:]
+
+        baseline = None
+        for label, func in cases:
+            elapsed = measure(func, repeat)
+            baseline = baseline or elapsed
+            print(f"  {name:<4} {label:<18} {elapsed * 1000:10.2f} ms  "
+                  f"(x{baseline / elapsed:.1f})")
+
+
+def bench_levels(csr: CSRGraph, start_node: str, repeat: int):
+    """큐 기반 BFS와 레벨 동기식 벡터화 BFS 비교 (모두 CSR 스냅샷 사용)"""
+    algorithm = BFS(csr)
+    start_id = csr.index[start_node]
+
+    cases = [
+        ('run() [CSR]', lambda: algorithm.run(start_node)),
+        ('run(vectorized)', lambda: algorithm.run(start_node, vectorized=True)),
+        ('run(lazy)', lambda: algorithm.run(start_node, lazy=True)),
+        ('level_sync 배열만', lambda: level_synchronous_bfs(csr, [start_id])),
+    ]
+
+    baseline = None
+    for label, func in cases:
+        elapsed = measure(func, repeat)
+        baseline = baseline or elapsed
+        print(f"  BFS  {label:<18} {elapsed * 1000:10.2f} ms  "
+              f"(x{baseline / elapsed:.1f})")
+
+
+def bench_parallel(csr: CSRGraph, start_node: str, repeat: int, max_processes: int):
+    """프로세스 수별 병렬 BFS 실행 시간과 직렬 엔진 대비 속도 향상 (결과 일치 여부도 확인)"""
+    start_id = csr.index[start_node]
+    expected = level_synchronous_bfs(csr, [start_id])
+
+    counts = sorted({1, max_processes} | {2 ** i for i in range(1, max_processes.bit_length())
+                                          if 2 ** i <= max_processes})
+
+    baseline = measure(lambda: level_synchronous_bfs(csr, [start_id]), repeat)
+    print(f"  직렬 엔진           {baseline * 1000:10.2f} ms")
+    for processes in counts[1:]:
+        result = parallel_level_synchronous_bfs(csr, [start_id], processes=processes)
+        same = all(np.array_equal(result[key], expected[key])
+                   for key in ('order', 'level', 'parent', 'source'))
+        elapsed = measure(lambda: parallel_level_synchronous_bfs(csr, [start_id], processes=processes),
+                          repeat)
+        print(f"  프로세스 {processes:<3}        {elapsed * 1000:10.2f} ms  "
+              f"(x{baseline / elapsed:.2f}, 결과 {'일치' if same else '불일치'})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='탐색 알고리즘 벤치마크')
+    parser.add_argument('--nodes', type=int, default=2000, help='노드 수')
+    parser.add_argument('--edges', type=int, default=8000, help='간선 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--skip-full', action='store_true',
+                        help='전체 상태를 복사하는 search() 측정 생략 (큰 그래프용)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help='병렬 BFS의 최대 작업 프로세스 수 (기본: CPU 코어 수)')
+    args = parser.parse_args()
+
+    graph = build_graph(args.nodes, args.edges, args.seed)
+    start_node = random.Random(args.seed).choice(list(graph.nodes()))
+
+    print(f"그래프: 노드 {args.nodes}개, 간선 {args.edges}개, 시작 노드 '{start_node}'")
+
+    started = time.perf_counter()
+    csr = CSRGraph.from_graph(graph)
+    print(f"CSR 스냅샷 생성: {(time.perf_counter() - started) * 1000:.2f} ms, "
+          f"배열 크기 {csr.nbytes / 1024:.1f} KiB")
+
+    bench_paths(graph, csr, start_node, args.repeat, args.skip_full)
+
+    print("레벨 동기식 BFS:")
+    bench_levels(csr, start_node, args.repeat)
+
+    print(f"병렬 BFS (CPU 코어 {os.cpu_count()}개):")
+    if args.processes > 1:
+        bench_parallel(csr, start_node, args.repeat, args.processes)
+    else:
+        print("  작업 프로세스가 1개이므로 생략 (--processes로 지정)")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import networkx as nx
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Set
 
+from algorithms.trace import StepSnapshot
+
 
 class GraphCanvas:
     """그래프 시각화를 위한 matplotlib 캔버스 클래스"""
@@ -100,26 +102,22 @@ class GraphCanvas:
         self.highlighted_nodes.clear()
         self.visit_order.clear()  # 방문 순서 리스트도 초기화
     
-    def update_visualization(self, step_info: Dict):
+    def update_visualization(self, step: StepSnapshot):
         """
         알고리즘 단계에 따라 시각화 업데이트
         
         Args:
-            step_info: 알고리즘 단계 정보
+            step: 타임라인에서 재구성한 단계 스냅샷
         """
         if not self.graph:
             return
         
-        # 상태 업데이트
-        if 'visited' in step_info:
-            self.visited_nodes = step_info['visited']
-        
-        if 'current_node' in step_info:
-            self.current_node = step_info['current_node']
+        # 상태 업데이트 (스냅샷이 소유한 복사본이므로 그대로 사용)
+        self.visited_nodes = step.visited
+        self.current_node = step.current_node
         
         # 방문 순서 업데이트 (중요!)
-        if 'visit_order' in step_info:
-            self.visit_order = step_info['visit_order'].copy()
+        self.visit_order = step.visit_order
         
         # 그래프 다시 그리기
         self.draw_graph()
@@ -5,21 +5,28 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import networkx as nx
-from typing import Optional, Dict, List
-import threading
+from typing import Optional, Dict, Tuple
 import time
 import os
 
 from .graph_canvas import GraphCanvas
 from .data_structure_widget import DataStructureWidget
+from .search_worker import SearchWorker
 from utils.graph_utils import GraphUtils
+from utils.result_cache import SearchResultCache
 from algorithms.dfs import DFS
 from algorithms.bfs import BFS
+from algorithms.trace import SearchTimeline, StepSnapshot, StepAction
 
 
 class MainWindow:
     """메인 윈도우 클래스"""
     
+    # 표시 중인 단계보다 미리 받아둘 최대 단계 수
+    STEP_LOOKAHEAD = 32
+    # 작업 스레드 결과 확인 주기 (밀리초)
+    WORKER_POLL_MS = 50
+    
     def __init__(self):
         """메인 윈도우 초기화"""
         self.root = tk.Tk()
@@ -30,7 +37,12 @@ class MainWindow:
         # 그래프 및 알고리즘 관련
         self.current_graph: Optional[nx.Graph] = None
         self.current_algorithm = None
-        self.algorithm_steps: List[Dict] = []
+        self.search_statistics: Optional[Dict] = None  # 완료된 탐색의 통계 (캐시에서 복원 가능)
+        self.algorithm_steps: Optional[SearchTimeline] = None  # 키프레임 + 델타 타임라인
+        self.search_worker: Optional[SearchWorker] = None  # 탐색을 실행 중인 작업 스레드
+        self.received_steps = 0  # 작업 스레드에서 받은 (표시할 수 있는) 단계 수
+        self.result_cache = SearchResultCache()  # 완료된 탐색 결과 (그래프 지문 기준)
+        self.search_cache_key: Optional[Tuple] = None
         self.current_step = 0
         self.is_playing = False
         self.animation_speed = 1.0  # 초 단위
@@ -104,7 +116,14 @@ class MainWindow:
         ttk.Radiobutton(row2, text="DFS", variable=self.algorithm_var, 
                        value="DFS").pack(side=tk.LEFT, padx=(0, 10))
         ttk.Radiobutton(row2, text="BFS", variable=self.algorithm_var, 
-                       value="BFS").pack(side=tk.LEFT, padx=(0, 20))
+                       value="BFS").pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Radiobutton(row2, text="양방향 BFS", variable=self.algorithm_var, 
+                       value="BiBFS").pack(side=tk.LEFT, padx=(0, 10))
+        
+        # DFS 스택에 같은 노드를 한 번만 두는 모드 (큰 밀집 그래프용)
+        self.distinct_stack_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(row2, text="중복 없는 스택", 
+                        variable=self.distinct_stack_var).pack(side=tk.LEFT, padx=(0, 20))
         
         ttk.Label(row2, text="시작 노드:").pack(side=tk.LEFT, padx=(0, 5))
         self.start_node_var = tk.StringVar()
@@ -257,11 +276,15 @@ class MainWindow:
         """그래프 파일 로드"""
         filename = filedialog.askopenfilename(
             title="그래프 파일 선택",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json"), ("Binary graph files", "*.gbin"), ("All files", "*.*")]
         )
         
         if filename:
-            graph = GraphUtils.load_graph(filename)
+            def report(bytes_read: int, total_bytes: int):
+                self.update_status(f"그래프 로드 중... {bytes_read * 100 // max(total_bytes, 1)}%")
+                self.root.update_idletasks()
+            
+            graph = GraphUtils.load_graph(filename, progress=report)
             if graph:
                 self.current_graph = graph
                 self.graph_canvas.set_graph(self.current_graph)
@@ -280,7 +303,7 @@ class MainWindow:
         filename = filedialog.asksaveasfilename(
             title="그래프 저장",
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json"), ("Binary graph files", "*.gbin"), ("All files", "*.*")]
         )
         
         if filename:
@@ -302,25 +325,53 @@ class MainWindow:
         
         target_node = self.target_node_var.get() or None
         
-        # 알고리즘 초기화
         algorithm_type = self.algorithm_var.get()
-        if algorithm_type == "DFS":
-            self.current_algorithm = DFS(self.current_graph)
-        else:  # BFS
-            self.current_algorithm = BFS(self.current_graph)
-        
-        # 알고리즘 실행 및 단계 저장
-        self.algorithm_steps = []
-        try:
-            for step in self.current_algorithm.search(start_node, target_node):
-                if 'error' in step:
-                    messagebox.showerror("오류", step['error'])
-                    return
-                self.algorithm_steps.append(step)
-        except Exception as e:
-            messagebox.showerror("오류", f"알고리즘 실행 중 오류가 발생했습니다: {e}")
+        if algorithm_type == "BiBFS" and not target_node:
+            messagebox.showwarning("경고", "양방향 BFS는 목표 노드를 선택해야 합니다.")
             return
         
+        distinct_stack = algorithm_type == "DFS" and self.distinct_stack_var.get()
+        
+        self.cancel_search()
+        
+        # 같은 그래프에서 같은 조건으로 실행한 적이 있으면 기록된 결과를 그대로 사용
+        cache_algorithm = f"{algorithm_type}:distinct" if distinct_stack else algorithm_type
+        self.search_cache_key = self.result_cache.make_key(
+            self.current_graph, cache_algorithm, start_node, target_node)
+        cached = self.result_cache.get(self.search_cache_key)
+        
+        if cached:
+            self.current_algorithm = None
+            self.search_statistics, self.algorithm_steps = cached
+            self.received_steps = len(self.algorithm_steps)
+        else:
+            self.search_statistics = None
+            
+            # 알고리즘 초기화
+            if algorithm_type == "DFS":
+                self.current_algorithm = DFS(self.current_graph)
+            else:  # BFS, 양방향 BFS
+                self.current_algorithm = BFS(self.current_graph)
+            
+            # 알고리즘이 타임라인에 직접 기록하므로 델타를 따로 한 벌 더 보관하지 않음
+            self.algorithm_steps = SearchTimeline(algorithm_type, start_node, target_node, distinct_stack)
+            self.received_steps = 0
+            timeline = self.algorithm_steps
+            
+            if algorithm_type == "BiBFS":
+                step_source = self.current_algorithm.bidirectional_search_deltas(start_node, target_node,
+                                                                                  trace=timeline)
+            elif distinct_stack:
+                step_source = self.current_algorithm.search_deltas(start_node, target_node, distinct_stack=True,
+                                                                   trace=timeline)
+            else:
+                step_source = self.current_algorithm.search_deltas(start_node, target_node, trace=timeline)
+            
+            # 탐색은 작업 스레드에서 실행하고, 단계는 애니메이션이 필요로 할 때 큐에서 받아옴
+            self.search_worker = SearchWorker(step_source)
+            self.search_worker.start()
+            self.root.after(self.WORKER_POLL_MS, self.poll_search_worker)
+        
         self.current_step = 0
         self.is_playing = True
         self.update_status(f"{algorithm_type} 알고리즘이 시작되었습니다.")
@@ -328,12 +379,80 @@ class MainWindow:
         # 애니메이션 시작
         self.animate_algorithm()
     
+    def ensure_step(self, step_index: int) -> bool:
+        """
+        작업 스레드가 보낸 단계를 step_index까지 받음
+        
+        델타는 작업 스레드의 알고리즘이 타임라인에 직접 기록하므로, 여기서는 큐로 받은 만큼만
+        표시할 수 있는 단계 수(received_steps)를 늘립니다. (타임라인은 작업 스레드가 먼저 기록함)
+        한 번에 STEP_LOOKAHEAD 단계까지만 미리 받아 메모리 사용량을 일정하게 유지합니다.
+        (큐가 가득 차면 작업 스레드가 대기)
+        
+        Args:
+            step_index: 필요한 단계 인덱스
+            
+        Returns:
+            해당 단계를 표시할 수 있는지 여부
+        """
+        if self.algorithm_steps is None:
+            return False
+        
+        while self.search_worker is not None and \
+                self.received_steps <= step_index + self.STEP_LOOKAHEAD:
+            item = self.search_worker.get_nowait()
+            if item is None:
+                break  # 아직 도착하지 않음
+            
+            kind, payload = item
+            if kind == 'delta' and payload.action is not StepAction.ERROR:
+                self.received_steps += 1
+            elif kind == 'delta':
+                self.reset_algorithm()
+                messagebox.showerror("오류", payload.message)
+                return False
+            elif kind == 'error':
+                self.reset_algorithm()
+                messagebox.showerror("오류", f"알고리즘 실행 중 오류가 발생했습니다: {payload}")
+                return False
+            else:  # 'done'
+                self.search_worker = None
+                self.search_statistics = self.current_algorithm.get_statistics()
+                self.result_cache.put(self.search_cache_key, self.search_statistics,
+                                      self.algorithm_steps)
+                self.update_statistics()
+        
+        return step_index < self.received_steps
+    
+    def poll_search_worker(self):
+        """작업 스레드 결과를 주기적으로 확인 (Tk after 루프)"""
+        if self.search_worker is None:
+            return
+        
+        self.ensure_step(self.current_step)
+        
+        if self.search_worker is not None:
+            self.root.after(self.WORKER_POLL_MS, self.poll_search_worker)
+    
+    def cancel_search(self):
+        """진행 중인 탐색 취소"""
+        if self.search_worker is not None:
+            self.search_worker.cancel()
+            self.search_worker = None
+    
     def animate_algorithm(self):
         """알고리즘 애니메이션"""
-        if not self.is_playing or self.current_step >= len(self.algorithm_steps):
-            self.is_playing = False
-            if self.current_step >= len(self.algorithm_steps):
+        if not self.is_playing:
+            return
+        
+        if not self.ensure_step(self.current_step):
+            if self.search_worker is not None:
+                # 작업 스레드가 다음 단계를 아직 만들지 못함 - 잠시 후 다시 시도
+                self.root.after(self.WORKER_POLL_MS, self.animate_algorithm)
+                return
+            
+            if self.algorithm_steps:
                 self.update_status("알고리즘이 완료되었습니다.")
+            self.is_playing = False
             return
         
         # 현재 단계 표시
@@ -362,28 +481,27 @@ class MainWindow:
     
     def next_step(self):
         """다음 단계"""
-        if self.algorithm_steps and self.current_step < len(self.algorithm_steps):
+        if self.ensure_step(self.current_step):
             self.show_step(self.current_step)
             self.current_step += 1
     
     def show_step(self, step_index: int):
         """특정 단계 표시"""
-        if not self.algorithm_steps or step_index >= len(self.algorithm_steps):
+        if not self.ensure_step(step_index):
             return
         
+        # 이전 단계는 가장 가까운 키프레임에서 재구성
         step = self.algorithm_steps[step_index]
         
         # 그래프 업데이트
         self.graph_canvas.update_visualization(step)
         
         # 스택/큐 위젯 업데이트
-        algorithm_type = self.algorithm_var.get()
-        if algorithm_type == "DFS" and 'stack' in step:
+        if step.algorithm == "DFS":
             self.data_structure_widget.set_structure_type("stack")
-            self.data_structure_widget.update_data(step['stack'])
-        elif algorithm_type == "BFS" and 'queue' in step:
+        else:
             self.data_structure_widget.set_structure_type("queue")
-            self.data_structure_widget.update_data(step['queue'])
+        self.data_structure_widget.update_data(list(step.frontier))
         
         # 단계 정보 표시
         self.update_step_info(step)
@@ -394,32 +512,39 @@ class MainWindow:
         # 방문 순서 업데이트
         self.update_visit_order(step)
     
-    def update_step_info(self, step: Dict):
+    def update_step_info(self, step: StepSnapshot):
         """단계 정보 업데이트"""
         self.step_info.delete(1.0, tk.END)
         
-        info_text = f"단계 {step.get('step', 0)}: {step.get('action', '')}\n"
-        info_text += f"메시지: {step.get('message', '')}\n"
+        info_text = f"단계 {step.step}: {step.action.value}\n"
+        info_text += f"메시지: {step.message}\n"
         
-        if step.get('current_node'):
-            info_text += f"현재 노드: {step['current_node']}\n"
+        if step.current_node:
+            info_text += f"현재 노드: {step.current_node}\n"
         
-        if 'stack' in step:
-            info_text += f"스택: {step['stack']}\n"
-        elif 'queue' in step:
-            info_text += f"큐: {step['queue']}\n"
+        structure_name = "스택" if step.algorithm == "DFS" else "큐"
+        info_text += f"{structure_name}: {list(step.frontier)}\n"
         
-        if step.get('found_target'):
+        if step.backward_frontier is not None:
+            info_text += f"역방향 큐: {list(step.backward_frontier)}\n"
+        
+        if step.found_target:
             info_text += "🎉 목표 노드를 찾았습니다!\n"
         
         self.step_info.insert(1.0, info_text)
     
     def update_statistics(self):
         """통계 정보 업데이트"""
-        if not self.current_algorithm:
+        if self.search_worker is not None:
+            # 작업 스레드가 알고리즘 상태를 갱신하는 중이므로 완료 후에 통계 표시
+            self.stats_text.delete(1.0, tk.END)
+            self.stats_text.insert(1.0, f"알고리즘: {self.algorithm_var.get()}\n"
+                                        f"탐색 진행 중... (받은 단계: {self.received_steps})\n")
             return
         
-        stats = self.current_algorithm.get_statistics()
+        stats = self.search_statistics
+        if not stats:
+            return
         
         self.stats_text.delete(1.0, tk.END)
         
@@ -435,20 +560,20 @@ class MainWindow:
         
         self.stats_text.insert(1.0, stats_text)
     
-    def update_visit_order(self, step: Dict):
+    def update_visit_order(self, step: StepSnapshot):
         """방문 순서 업데이트"""
-        if 'visit_order' not in step:
-            return
-        
         self.visit_listbox.delete(0, tk.END)
         
-        for i, node in enumerate(step['visit_order']):
+        for i, node in enumerate(step.visit_order):
             self.visit_listbox.insert(tk.END, f"{i+1}. {node}")
     
     def reset_algorithm(self):
         """알고리즘 상태 초기화"""
+        self.cancel_search()
         self.current_algorithm = None
-        self.algorithm_steps = []
+        self.search_statistics = None
+        self.algorithm_steps = None
+        self.received_steps = 0
         self.current_step = 0
         self.is_playing = False
         
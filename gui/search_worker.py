@@ -0,0 +1,68 @@
+"""
+탐색 작업 스레드
+"""
+
+import queue
+import threading
+from typing import Any, Iterator, Optional, Tuple
+
+from algorithms.trace import StepRecord
+
+
+class SearchWorker:
+    """탐색 제너레이터를 별도 스레드에서 실행하고 결과를 스레드 안전한 큐로 전달하는 클래스"""
+
+    def __init__(self, step_source: Iterator[StepRecord], max_pending: int = 256):
+        """
+        작업 스레드 초기화
+
+        Args:
+            step_source: 탐색 델타 제너레이터 (예: BFS.search_deltas())
+            max_pending: 큐에 쌓아둘 최대 항목 수 (가득 차면 작업 스레드가 대기)
+        """
+        self.step_source = step_source
+        self.queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """작업 스레드 시작"""
+        self.thread.start()
+
+    def cancel(self):
+        """탐색 취소 (작업 스레드는 다음 단계에서 종료됨)"""
+        self.cancelled.set()
+
+    def get_nowait(self) -> Optional[Tuple[str, Any]]:
+        """
+        도착한 항목 하나를 꺼냄 (Tk 메인 루프에서 호출)
+
+        Returns:
+            ('delta', 델타), ('error', 메시지), ('done', None) 중 하나 또는 아직 없으면 None
+        """
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _put(self, item: Tuple[str, Any]) -> bool:
+        """큐에 항목 추가 (취소되면 포기)"""
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        """작업 스레드 본체"""
+        try:
+            for delta in self.step_source:
+                if not self._put(('delta', delta)):
+                    break
+        except Exception as e:
+            self._put(('error', str(e)))
+        finally:
+            self.step_source.close()
+            self._put(('done', None))
@@ -0,0 +1,30 @@
+"""
+테스트 공용 fixture
+"""
+
+import networkx as nx
+import pytest
+
+
+def make_random_graph(seed: int, num_nodes: int = 60, num_edges: int = 90,
+                      prefix: str = 'n', extra_component: bool = True) -> nx.Graph:
+    """
+    문자열 노드 ID를 가진 무작위 그래프 생성
+
+    Args:
+        seed: 난수 시드
+        num_nodes: 노드 수
+        num_edges: 간선 수
+        prefix: 노드 ID 앞에 붙일 문자열 (정수 n -> f'{prefix}{n}')
+        extra_component: 따로 떨어진 연결 요소 ('x', 'y') 추가 여부
+    """
+    graph = nx.relabel_nodes(nx.gnm_random_graph(num_nodes, num_edges, seed=seed), lambda n: f'{prefix}{n}')
+    if extra_component:
+        graph.add_edge('x', 'y')
+    return graph
+
+
+@pytest.fixture
+def random_graph():
+    """make_random_graph(seed, ...) 함수"""
+    return make_random_graph
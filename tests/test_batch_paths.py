@@ -0,0 +1,78 @@
+"""
+일괄 최단 경로 질의 테스트
+
+get_paths_batch()의 거리와 경로가 NetworkX 최단 거리와 같은지, 입력 순서가 유지되는지,
+현재 프로세스 실행과 프로세스 풀 실행의 결과가 같은지 확인합니다.
+"""
+
+import networkx as nx
+import pytest
+
+from algorithms.bfs import BFS
+
+
+def assert_valid_paths(graph, pairs, result):
+    assert len(result['paths']) == len(result['distances']) == len(pairs)
+    for (start, target), path, distance in zip(pairs, result['paths'], result['distances']):
+        if start not in graph or target not in graph or not nx.has_path(graph, start, target):
+            assert path is None and distance is None
+            continue
+        assert distance == nx.shortest_path_length(graph, start, target)
+        assert path[0] == start and path[-1] == target and len(path) == distance + 1
+        assert all(graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_matches_networkx(random_graph, max_workers):
+    graph = random_graph(7)
+    pairs = [
+        ('n0', 'n5'), ('n0', 'n17'), ('n0', 'n5'),  # 같은 시작 노드 (중복 포함)
+        ('n3', 'n40'), ('n3', 'n3'),                # 시작 노드 == 목표 노드
+        ('n0', 'missing'), ('missing', 'n0'),       # 그래프에 없는 노드
+        ('n1', 'x'), ('x', 'y'),                    # 서로 다른 연결 요소
+    ]
+    result = BFS(graph).get_paths_batch(pairs, max_workers=max_workers)
+
+    assert_valid_paths(graph, pairs, result)
+    assert result['paths'][4] == ['n3']
+    assert result['distances'][4] == 0
+    assert result['paths'][0] == result['paths'][2]
+
+
+def test_process_pool_matches_in_process(random_graph):
+    graph = random_graph(8)
+    nodes = sorted(graph.nodes())
+    pairs = [(start, target) for start in nodes[:6] for target in nodes[::7]]
+    bfs = BFS(graph)
+
+    assert bfs.get_paths_batch(pairs, max_workers=2) == bfs.get_paths_batch(pairs)
+
+
+def test_paths_match_single_search_and_keep_state(random_graph):
+    graph = random_graph(9)
+    bfs = BFS(graph)
+    bfs.run('n2')
+    visit_order = list(bfs.visit_order)
+
+    targets = ['n10', 'n20', 'n30']
+    result = bfs.get_paths_batch([('n2', target) for target in targets])
+
+    assert result['paths'] == [bfs.get_path_to_node(target) for target in targets]
+    assert bfs.visit_order == visit_order  # 객체의 탐색 상태는 바뀌지 않음
+
+
+def test_stops_once_all_targets_are_found(monkeypatch):
+    graph = nx.path_graph(['A', 'B', 'C', 'D', 'E', 'F'])
+    bfs = BFS(graph)
+    expanded = []
+    ascending = bfs.neighbor_index.ascending
+
+    def record(node):
+        expanded.append(node)
+        return ascending(node)
+
+    monkeypatch.setattr(bfs.neighbor_index, 'ascending', record)
+    result = bfs.get_paths_batch([('A', 'C'), ('A', 'B')])
+
+    assert result['paths'] == [['A', 'B', 'C'], ['A', 'B']]
+    assert expanded == ['A', 'B']  # 'C'를 찾은 뒤 더 이상 확장하지 않음
@@ -0,0 +1,82 @@
+"""
+증분 연결 요소 인덱스 테스트
+
+GraphUtils 수정을 따라가는지, 직접 수정한 NetworkX 그래프에서도 연결성 결과가 맞는지 확인합니다.
+"""
+
+import networkx as nx
+import pytest
+
+from utils.component_index import ComponentIndex
+from utils.graph_utils import GraphUtils
+
+
+def expected_components(graph):
+    return sorted((len(c) for c in nx.connected_components(graph)), reverse=True)
+
+
+def index_components(index):
+    return sorted(index.size.values(), reverse=True)
+
+
+def tracked_sample_graph():
+    graph = GraphUtils.create_sample_graph()
+    GraphUtils.get_fingerprint(graph)
+    return graph
+
+
+def test_untracked_graph_is_not_cached():
+    graph = nx.path_graph(4)
+    assert ComponentIndex.for_graph(graph).count == 1
+    assert ComponentIndex.get(graph) is None
+
+    graph.remove_edge(1, 2)
+    assert ComponentIndex.for_graph(graph).count == 2
+
+
+def test_follows_graph_utils_edits():
+    graph = tracked_sample_graph()
+    index = ComponentIndex.for_graph(graph)
+    assert ComponentIndex.get(graph) is index
+
+    edits = [
+        lambda: GraphUtils.add_node(graph, 'Z', (5, 5)),
+        lambda: GraphUtils.add_node(graph, 'Y', (6, 5)),
+        lambda: GraphUtils.add_edge(graph, 'Z', 'Y'),
+        lambda: GraphUtils.add_edge(graph, 'Z', 'A'),
+        lambda: GraphUtils.remove_edge(graph, 'Z', 'A'),
+        lambda: GraphUtils.remove_node(graph, 'Y'),
+        lambda: GraphUtils.remove_node(graph, 'Z'),
+    ]
+    for edit in edits:
+        assert edit()
+        index = ComponentIndex.for_graph(graph)
+        assert index_components(index) == expected_components(graph)
+        assert index.count == nx.number_connected_components(graph)
+
+
+def test_check_connectivity_after_direct_edge_removal():
+    graph = tracked_sample_graph()
+    assert GraphUtils.check_connectivity(graph, 'A', 'F')['path_exists']
+
+    for neighbor in list(graph.adj['F']):
+        graph.remove_edge('F', neighbor)
+
+    result = GraphUtils.check_connectivity(graph, 'A', 'F')
+    assert 'error' not in result
+    assert result['path_exists'] is False
+    assert result['connected'] is False
+    assert result['total_components'] == 2
+
+
+@pytest.mark.parametrize('tracked', [False, True])
+def test_check_connectivity_matches_networkx(tracked):
+    graph = nx.relabel_nodes(nx.gnm_random_graph(40, 35, seed=3), str)
+    if tracked:
+        GraphUtils.get_fingerprint(graph)
+    for u, v in [('0', '1'), ('2', '39'), ('5', '17')]:
+        result = GraphUtils.check_connectivity(graph, u, v)
+        assert result['path_exists'] == nx.has_path(graph, u, v)
+        if result['path_exists']:
+            assert result['distance'] == nx.shortest_path_length(graph, u, v)
+        assert result['total_components'] == nx.number_connected_components(graph)
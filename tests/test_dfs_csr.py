@@ -0,0 +1,73 @@
+"""
+CSR 스냅샷 DFS 테스트
+
+CSR 경로의 run()이 NetworkX 그래프에서의 run()과 같은 방문 순서, 부모, 발견/완료 시각을
+만드는지, 결과를 담는 IdArrayView가 딕셔너리처럼 동작하는지 확인합니다.
+"""
+
+import networkx as nx
+import pytest
+
+from algorithms.csr import CSRGraph, IdArrayView
+from algorithms.dfs import DFS
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_run_matches_networkx(random_graph, seed):
+    graph = random_graph(seed)
+    nx_dfs = DFS(graph)
+    expected = nx_dfs.run('n0')
+    dfs = DFS(CSRGraph.from_graph(graph))
+    result = dfs.run('n0')
+
+    assert result['visit_order'] == expected['visit_order']
+    for key in ('parent', 'discovery', 'finish'):
+        assert isinstance(result[key], IdArrayView)
+        assert result[key] == expected[key]
+        assert list(result[key]) == list(expected[key])
+    assert set(dfs.visited) == set(expected['visit_order'])
+    assert dfs.get_tree_edges() == nx_dfs.get_tree_edges()
+
+
+def test_early_stop_matches_networkx(random_graph):
+    graph = random_graph(5)
+    full = DFS(graph).run('n0')
+    target = full['visit_order'][20]
+
+    nx_dfs = DFS(graph)
+    expected = nx_dfs.run('n0', target)
+    csr_dfs = DFS(CSRGraph.from_graph(graph))
+    result = csr_dfs.run('n0', target)
+
+    assert result['found_target']
+    assert result['visit_order'] == expected['visit_order']
+    assert result['finish'] == expected['finish']
+    assert csr_dfs.stack == nx_dfs.stack
+    assert result['targets'] == expected['targets']
+
+
+def test_tree_queries_on_views():
+    graph = nx.Graph([('a', 'b'), ('b', 'c'), ('a', 'd'), ('x', 'y')])
+    dfs = DFS(CSRGraph.from_graph(graph))
+    dfs.run('a')
+
+    assert dfs.get_path_to_node('c') == ['a', 'b', 'c']
+    assert dfs.get_parent('a') is None
+    assert dfs.get_parent('x') is None
+    assert dfs.get_discovery_time('x') is None
+    assert dfs.is_ancestor('a', 'c') and not dfs.is_ancestor('d', 'c')
+    assert sorted(dfs.get_tree_edges()) == [('a', 'b'), ('a', 'd'), ('b', 'c')]
+
+
+def test_id_array_view_mapping():
+    csr = CSRGraph.from_graph(nx.Graph([('a', 'b'), ('b', 'c')]))
+    parent = IdArrayView(csr, [1, 0], [1, -1, -1], [1, 1, 0], labeled=True)
+
+    assert list(parent) == ['b', 'a']
+    assert len(parent) == 2
+    assert parent['a'] == 'b' and parent['b'] is None
+    assert 'c' not in parent and 'missing' not in parent
+    assert parent.get('c', 'none') == 'none'
+    with pytest.raises(KeyError):
+        parent['c']
+    assert dict(parent.items()) == {'b': None, 'a': 'b'}
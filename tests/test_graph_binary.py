@@ -0,0 +1,67 @@
+"""
+바이너리 그래프 형식(.gbin) 테스트
+
+JSON -> .gbin -> JSON 변환이 노드/간선 순서와 노드 data를 그대로 보존하는지 확인합니다.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from algorithms.csr import CSRGraph
+from utils.graph_binary import binary_to_json, is_binary_graph, json_to_binary, load_binary_csr, save_binary
+from utils.graph_stream import stream_load_graph
+from utils.graph_utils import GraphUtils
+
+SAMPLE_GRAPH = os.path.join(os.path.dirname(__file__), '..', 'examples', 'sample_graph.json')
+
+
+def test_sample_graph_round_trip(tmp_path):
+    binary = str(tmp_path / 'sample.gbin')
+    restored = str(tmp_path / 'restored.json')
+
+    json_to_binary(SAMPLE_GRAPH, binary)
+    binary_to_json(binary, restored)
+
+    assert is_binary_graph(binary)
+    assert not is_binary_graph(SAMPLE_GRAPH)
+    with open(SAMPLE_GRAPH, 'r', encoding='utf-8') as f:
+        original = json.load(f)
+    with open(restored, 'r', encoding='utf-8') as f:
+        assert json.load(f) == original
+
+
+def test_load_graph_detects_binary(tmp_path):
+    binary = str(tmp_path / 'sample.gbin')
+    json_to_binary(SAMPLE_GRAPH, binary)
+
+    expected = stream_load_graph(SAMPLE_GRAPH)
+    loaded = GraphUtils.load_graph(binary)
+    assert list(loaded.nodes(data=True)) == list(expected.nodes(data=True))
+    assert list(loaded.edges()) == list(expected.edges())
+
+
+def test_memory_mapped_csr_matches_graph(tmp_path):
+    binary = str(tmp_path / 'sample.gbin')
+    json_to_binary(SAMPLE_GRAPH, binary)
+
+    expected = CSRGraph.from_graph(stream_load_graph(SAMPLE_GRAPH))
+    csr = load_binary_csr(binary)
+    assert csr.labels == expected.labels
+    assert np.array_equal(csr.indptr, expected.indptr)
+    assert np.array_equal(csr.indices, expected.indices)
+
+
+def test_node_data_that_does_not_fit_arrays(tmp_path):
+    graph = stream_load_graph(SAMPLE_GRAPH)
+    graph.add_node('노드 "X"', pos=[0.5, 2], label='다른 이름', color='red')
+    graph.add_node('Y', label='Y', pos=[1.25, -3.5])
+    graph.add_node('Z')
+    graph.add_edge('A', '노드 "X"')
+
+    binary = str(tmp_path / 'extra.gbin')
+    save_binary(graph, binary)
+    loaded = GraphUtils.load_graph(binary)
+    assert list(loaded.nodes(data=True)) == list(graph.nodes(data=True))
+    assert list(loaded.edges()) == list(graph.edges())
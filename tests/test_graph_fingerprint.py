@@ -0,0 +1,69 @@
+"""
+그래프 지문 테스트
+
+증분 갱신한 지문이 처음부터 계산한 지문과 같은지, 지문은 처음 요청할 때만 계산되는지,
+GraphUtils 밖의 수정이 문서화된 범위에서 감지되는지 확인합니다.
+"""
+
+import os
+
+import networkx as nx
+
+from utils.graph_fingerprint import GraphFingerprint
+from utils.graph_utils import GraphUtils
+
+SAMPLE_GRAPH = os.path.join(os.path.dirname(__file__), '..', 'examples', 'sample_graph.json')
+
+
+def test_builders_and_loader_are_lazy():
+    graphs = [GraphUtils.create_empty_graph(), GraphUtils.create_sample_tree(),
+              GraphUtils.create_sample_graph(), GraphUtils.create_maze_graph(),
+              GraphUtils.load_graph(SAMPLE_GRAPH)]
+    for graph in graphs:
+        assert GraphFingerprint.get(graph) is None
+        GraphUtils.get_fingerprint(graph)
+        assert GraphFingerprint.get(graph) is not None
+
+
+def test_independent_of_construction_order():
+    edges = [('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')]
+    forward = nx.Graph(edges)
+    backward = nx.Graph([(v, u) for u, v in reversed(edges)])
+    assert GraphUtils.get_fingerprint(forward) == GraphUtils.get_fingerprint(backward)
+    assert GraphUtils.compute_fingerprint(forward) == GraphUtils.get_fingerprint(forward)
+
+
+def test_incremental_updates_match_full_hash():
+    graph = GraphUtils.create_sample_graph()
+    before = GraphUtils.get_fingerprint(graph)
+    version = GraphUtils.get_graph_version(graph)
+
+    assert GraphUtils.add_node(graph, 'Z', (3, 3))
+    assert GraphUtils.add_edge(graph, 'Z', 'A')
+    assert GraphUtils.remove_edge(graph, 'A', 'B')
+    assert GraphUtils.remove_node(graph, 'C')
+    assert GraphUtils.get_fingerprint(graph) == GraphUtils.compute_fingerprint(graph)
+    assert GraphUtils.get_graph_version(graph) > version
+
+    # 되돌리면 같은 지문
+    assert GraphUtils.remove_node(graph, 'Z')
+    assert GraphUtils.add_node(graph, 'C', (1, 1))
+    for node in ['A', 'E', 'F']:
+        assert GraphUtils.add_edge(graph, 'C', node)
+    assert GraphUtils.add_edge(graph, 'A', 'B')
+    assert GraphUtils.get_fingerprint(graph) == before
+
+
+def test_direct_edits_detected_within_contract():
+    graph = GraphUtils.create_sample_graph()
+    GraphUtils.get_fingerprint(graph)
+    version = GraphUtils.get_graph_version(graph)
+
+    # 노드 수가 바뀌면 for_graph()가 다시 계산
+    graph.add_edge('A', 'Q')
+    assert GraphUtils.get_fingerprint(graph) == GraphUtils.compute_fingerprint(graph)
+    assert GraphUtils.get_graph_version(graph) > version
+
+    # 간선만 바뀌면 verify()로 다시 계산
+    graph.add_edge('Q', 'F')
+    assert GraphFingerprint.verify(graph).digest == GraphUtils.compute_fingerprint(graph)
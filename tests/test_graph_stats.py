@@ -0,0 +1,80 @@
+"""
+벡터화 그래프 통계 테스트
+
+희소 인접 행렬로 계산한 통계가 NetworkX 계산과 같은지, 지문 버전 캐시가
+GraphUtils 수정에는 갱신되고 지문이 없는 그래프는 캐시되지 않는지 확인합니다.
+"""
+
+import networkx as nx
+import pytest
+
+from algorithms.csr import CSRGraph
+from utils.graph_stats import graph_stats
+from utils.graph_utils import GraphUtils
+
+
+def expected_stats(graph):
+    degrees = [degree for _, degree in graph.degree()]
+    sizes = sorted((len(c) for c in nx.connected_components(graph)), reverse=True)
+    return {
+        'nodes': graph.number_of_nodes(),
+        'edges': graph.number_of_edges(),
+        'components': len(sizes),
+        'max_degree': max(degrees, default=0),
+        'min_degree': min(degrees, default=0),
+        'isolated_nodes': sum(1 for degree in degrees if degree == 0),
+        'component_sizes': sizes,
+        'largest_component': sizes[0] if sizes else 0,
+        'degree_histogram': nx.degree_histogram(graph),
+        'density': nx.density(graph),
+    }
+
+
+def assert_stats_match(stats, graph):
+    expected = expected_stats(graph)
+    assert {key: stats[key] for key in expected if key != 'density'} == \
+        {key: value for key, value in expected.items() if key != 'density'}
+    assert stats['density'] == pytest.approx(expected['density'])
+
+
+GRAPHS = [
+    pytest.param(nx.Graph(), id='empty'),
+    pytest.param(nx.empty_graph(3), id='isolated'),
+    pytest.param(nx.relabel_nodes(nx.gnm_random_graph(60, 50, seed=2), str), id='random'),
+    pytest.param(nx.Graph([('a', 'a'), ('a', 'b'), ('c', 'd')]), id='self-loop'),
+    pytest.param(nx.Graph([(1, 'a'), (2, 3)]), id='mixed-ids'),
+]
+
+
+@pytest.mark.parametrize('graph', GRAPHS)
+def test_matches_networkx(graph):
+    assert_stats_match(graph_stats(graph), graph)
+    assert_stats_match(graph_stats(CSRGraph.from_graph(graph)), graph)
+
+
+def test_untracked_graph_sees_direct_edits():
+    graph = nx.path_graph(4)
+    assert graph_stats(graph)['components'] == 1
+    graph.remove_edge(1, 2)
+    assert graph_stats(graph)['components'] == 2
+
+
+def test_tracked_graph_cache_follows_graph_utils_edits():
+    graph = GraphUtils.create_sample_graph()
+    GraphUtils.get_fingerprint(graph)
+    first = graph_stats(graph)
+    first['component_sizes'].append(-1)  # 반환값을 수정해도 캐시에는 영향 없음
+    assert_stats_match(graph_stats(graph), graph)
+
+    assert GraphUtils.add_node(graph, 'Z', (5, 5))
+    assert_stats_match(graph_stats(graph), graph)
+    assert GraphUtils.add_edge(graph, 'Z', 'A')
+    assert_stats_match(graph_stats(graph), graph)
+    assert GraphUtils.remove_edge(graph, 'Z', 'A')
+    assert_stats_match(graph_stats(graph), graph)
+
+
+def test_mixed_node_ids_through_graph_utils():
+    stats = GraphUtils.get_graph_stats(nx.Graph([(1, 'a'), (2, 3)]))
+    assert {key: stats[key] for key in ('nodes', 'edges', 'components', 'max_degree')} == \
+        {'nodes': 4, 'edges': 2, 'components': 2, 'max_degree': 1}
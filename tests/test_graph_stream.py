@@ -0,0 +1,101 @@
+"""
+스트리밍 JSON 로더 테스트
+
+READ_SIZE를 아주 작게 줄여 토큰(문자열, 숫자, 멀티바이트 문자)이 읽기 버퍼 경계에서
+잘리는 경우에도 json.load 기반 로드와 같은 그래프가 만들어지는지 확인합니다.
+"""
+
+import json
+import os
+
+import networkx as nx
+import pytest
+
+from utils import graph_stream
+from utils.graph_stream import stream_load_graph
+from utils.graph_utils import GraphUtils
+
+SAMPLE_GRAPH = os.path.join(os.path.dirname(__file__), '..', 'examples', 'sample_graph.json')
+
+
+def load_with_json(filename: str) -> nx.Graph:
+    """json.load로 문서 전체를 읽어 만든 기준 그래프"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    G = nx.Graph()
+    G.add_nodes_from((node['id'], node['data']) for node in data['nodes'])
+    G.add_edges_from((edge['source'], edge['target']) for edge in data['edges'])
+    return G
+
+
+def assert_same_graph(actual: nx.Graph, expected: nx.Graph):
+    assert list(actual.nodes(data=True)) == list(expected.nodes(data=True))
+    assert list(actual.edges()) == list(expected.edges())
+
+
+@pytest.fixture
+def tricky_graph_file(tmp_path):
+    """버퍼 경계에서 잘리기 쉬운 값(지수 표기 숫자, 이스케이프, 한글/이모지)을 담은 파일"""
+    data = {
+        'nodes': [
+            {'id': '시작', 'data': {'pos': [1.5e3, -0.125], 'label': '시작'}},
+            {'id': 'B "따옴표" \\ 🎉', 'data': {'pos': [123456789, -42], 'weight': 1e-7}},
+            {'id': 'C', 'data': {'pos': [0.1, 2.5E+10], 'tags': ['a', {'nested': [1, 2, 3]}]}},
+            {'id': '끝', 'data': {}},
+        ],
+        'edges': [
+            {'source': '시작', 'target': 'B "따옴표" \\ 🎉'},
+            {'source': 'B "따옴표" \\ 🎉', 'target': 'C'},
+            {'source': 'C', 'target': '끝'},
+        ],
+        'metadata': {'ignored': [1, 2.75, None, True]},
+    }
+    path = tmp_path / 'tricky.json'
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('read_size', [1, 2, 3, 7, 64, 1 << 20])
+def test_sample_graph_matches_json_load(monkeypatch, read_size):
+    monkeypatch.setattr(graph_stream, 'READ_SIZE', read_size)
+    assert_same_graph(stream_load_graph(SAMPLE_GRAPH), load_with_json(SAMPLE_GRAPH))
+
+
+@pytest.mark.parametrize('read_size', [1, 2, 3, 5, 13])
+def test_tokens_split_across_buffers(monkeypatch, tricky_graph_file, read_size):
+    monkeypatch.setattr(graph_stream, 'READ_SIZE', read_size)
+    assert_same_graph(stream_load_graph(tricky_graph_file), load_with_json(tricky_graph_file))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 10000])
+def test_chunk_size_does_not_change_result(tricky_graph_file, chunk_size):
+    assert_same_graph(stream_load_graph(tricky_graph_file, chunk_size=chunk_size),
+                      load_with_json(tricky_graph_file))
+
+
+def test_progress_reports_whole_file(tricky_graph_file):
+    calls = []
+    stream_load_graph(tricky_graph_file, chunk_size=1, progress=lambda done, total: calls.append((done, total)))
+    assert calls
+    assert calls[-1] == (os.path.getsize(tricky_graph_file),) * 2
+
+
+@pytest.mark.parametrize('content', [
+    '',
+    '{"nodes": [{"id": "A", "data": {}}',
+    '{"nodes" [{"id": "A", "data": {}}]}',
+    '{"nodes": [{"id": "A", "data": {}} {"id": "B", "data": {}}]}',
+    '{"nodes": [{"id": "A", "data": {"pos": [1, 2}}]}',
+    '{"nodes": [{"data": {}}]}',
+    '{"edges": [{"source": "A"}]}',
+    '[1, 2, 3]',
+])
+def test_malformed_input_returns_none(tmp_path, monkeypatch, content):
+    monkeypatch.setattr(graph_stream, 'READ_SIZE', 3)
+    path = tmp_path / 'broken.json'
+    path.write_text(content, encoding='utf-8')
+    assert GraphUtils.load_graph(str(path)) is None
+
+
+def test_missing_file_returns_none(tmp_path):
+    assert GraphUtils.load_graph(str(tmp_path / 'missing.json')) is None
@@ -0,0 +1,68 @@
+"""
+다중 목표 조기 종료 테스트
+
+모든 목표를 찾으면 탐색이 멈추고, 목표별 발견 순번과 경로가 전체 탐색 결과와 같은지,
+0처럼 거짓으로 평가되는 노드 ID도 목표로 취급되는지 확인합니다.
+"""
+
+import networkx as nx
+import pytest
+
+from algorithms.bfs import BFS
+from algorithms.dfs import DFS
+
+ENGINES = [
+    pytest.param(lambda graph, start, targets: BFS(graph).run(start, targets), id='bfs'),
+    pytest.param(lambda graph, start, targets: BFS(graph).run(start, targets, vectorized=True),
+                 id='bfs-vectorized'),
+    pytest.param(lambda graph, start, targets: DFS(graph).run(start, targets), id='dfs'),
+]
+
+
+@pytest.mark.parametrize('run', ENGINES)
+def test_falsy_node_ids_are_targets(run):
+    graph = nx.path_graph(5)
+    result = run(graph, 4, [0])
+    assert result['found_target']
+    assert result['targets'][0]['path'] == [4, 3, 2, 1, 0]
+
+    result = run(graph, 4, 0)
+    assert list(result['targets']) == [0]
+
+
+@pytest.mark.parametrize('run', ENGINES)
+def test_stops_after_last_target(run):
+    graph = nx.relabel_nodes(nx.gnm_random_graph(50, 120, seed=4), str)
+    full = run(graph, '0', None)
+    targets = [full['visit_order'][5], full['visit_order'][12]]
+
+    result = run(graph, '0', targets)
+    assert result['found_target']
+    assert result['visit_order'] == full['visit_order'][:13]
+    for target in targets:
+        assert result['targets'][target]['visit_time'] == full['visit_order'].index(target) + 1
+        path = result['targets'][target]['path']
+        assert path[0] == '0' and path[-1] == target
+        assert all(graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize('run', ENGINES)
+def test_unreachable_target_sweeps_component(run):
+    graph = nx.Graph([('a', 'b'), ('b', 'c'), ('x', 'y')])
+    result = run(graph, 'a', ['c', 'x', 'missing'])
+    assert not result['found_target']
+    assert sorted(result['visit_order']) == ['a', 'b', 'c']
+    assert result['targets']['c']['path'] is not None
+    assert result['targets']['x'] == {'step': None, 'visit_time': None, 'path': None}
+    assert result['targets']['missing']['path'] is None
+
+
+@pytest.mark.parametrize('algorithm', [BFS, DFS])
+def test_step_search_records_target_steps(algorithm):
+    graph = nx.path_graph(5)
+    search = algorithm(graph)
+    steps = list(search.search(4, [0, 2]))
+    assert steps[-1]['found_target']
+    results = search.get_target_results()
+    assert results[0]['step'] is not None and results[2]['step'] is not None
+    assert results[2]['step'] < results[0]['step']
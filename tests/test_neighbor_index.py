@@ -0,0 +1,63 @@
+"""
+정렬된 인접 노드 인덱스 테스트
+
+GraphUtils를 거치지 않고 NetworkX 그래프를 직접 수정해도 탐색 결과가 바뀐 그래프를 따르는지,
+지문이 있는 그래프에서는 캐시를 쓰고 GraphUtils 수정으로 무효화되는지 확인합니다.
+"""
+
+import networkx as nx
+import pytest
+
+from algorithms.bfs import BFS
+from algorithms.dfs import DFS
+from algorithms.neighbor_index import NeighborIndex
+from utils.graph_utils import GraphUtils
+
+
+def run_all(graph, start):
+    return {
+        'bfs': BFS(graph).run(start)['visit_order'],
+        'bfs_vectorized': BFS(graph).run(start, vectorized=True)['visit_order'],
+        'dfs': DFS(graph).run(start)['visit_order'],
+    }
+
+
+def test_direct_networkx_edits_are_seen():
+    graph = nx.Graph([('a', 'b'), ('a', 'c'), ('c', 'x')])
+    graph.add_node('d')
+    assert run_all(graph, 'a')['bfs'] == ['a', 'b', 'c', 'x']
+
+    # 간선 수가 그대로인 수정
+    graph.remove_edge('a', 'c')
+    graph.add_edge('a', 'd')
+    assert run_all(graph, 'a') == {'bfs': ['a', 'b', 'd'], 'bfs_vectorized': ['a', 'b', 'd'],
+                                   'dfs': ['a', 'b', 'd']}
+
+
+def test_untracked_graph_is_not_cached():
+    graph = nx.Graph([('a', 'c'), ('a', 'b')])
+    index = NeighborIndex.for_graph(graph)
+    assert not index.tracked
+    assert index.ascending('a') == ('b', 'c')
+    assert index.csr() is not index.csr()
+
+
+@pytest.mark.parametrize('edit', ['add_edge', 'remove_edge', 'remove_node'])
+def test_tracked_graph_is_invalidated_by_graph_utils(edit):
+    graph = GraphUtils.create_sample_graph()
+    GraphUtils.get_fingerprint(graph)
+    index = NeighborIndex.for_graph(graph)
+    assert index.tracked
+    assert index.ascending('A') is index.ascending('A')
+    assert index.csr() is index.csr()
+
+    if edit == 'add_edge':
+        assert GraphUtils.add_edge(graph, 'A', 'F')
+    elif edit == 'remove_edge':
+        assert GraphUtils.remove_edge(graph, 'A', 'B')
+    else:
+        assert GraphUtils.remove_node(graph, 'B')
+
+    assert index.ascending('A') == tuple(sorted(graph.adj['A']))
+    fresh = nx.Graph(graph)
+    assert run_all(graph, 'A') == run_all(fresh, 'A')
@@ -0,0 +1,66 @@
+"""
+프로세스 병렬 레벨 동기식 BFS 테스트
+
+min_parallel_frontier를 1로 낮춰 모든 레벨을 작업 프로세스 풀에서 확장하게 하고,
+결과 배열이 직렬 엔진(level_synchronous_bfs)과 정확히 같은지 확인합니다.
+"""
+
+import numpy as np
+import pytest
+
+from algorithms.bfs import BFS
+from algorithms.csr import CSRGraph
+from algorithms.level_sync import level_synchronous_bfs
+from algorithms.parallel_bfs import parallel_level_synchronous_bfs
+
+RESULT_KEYS = ('order', 'queue', 'level', 'parent', 'source', 'level_counts')
+
+
+def assert_same_result(result, expected):
+    for key in RESULT_KEYS:
+        np.testing.assert_array_equal(result[key], expected[key], err_msg=key)
+    assert result['found_target'] == expected['found_target']
+
+
+@pytest.fixture
+def csr(random_graph):
+    return CSRGraph.from_graph(random_graph(11, 400, 900))
+
+
+@pytest.mark.parametrize('processes', [2, 3])
+@pytest.mark.parametrize('start', [['n0'], ['n0', 'n50', 'x']])
+def test_pool_matches_serial_engine(csr, processes, start):
+    start_ids = [csr.node_id(node) for node in start]
+    expected = level_synchronous_bfs(csr, start_ids)
+    result = parallel_level_synchronous_bfs(csr, start_ids, processes=processes, min_parallel_frontier=1)
+    assert_same_result(result, expected)
+
+
+def test_pool_matches_serial_engine_with_targets(csr):
+    start_ids = [csr.node_id('n0')]
+    order = level_synchronous_bfs(csr, start_ids)['order']
+    target_ids = [int(order[40]), int(order[200])]
+
+    expected = level_synchronous_bfs(csr, start_ids, target_ids)
+    assert expected['found_target'] and expected['queue'].size
+    result = parallel_level_synchronous_bfs(csr, start_ids, target_ids, processes=2, min_parallel_frontier=1)
+    assert_same_result(result, expected)
+
+    # 그래프에 없는 목표(-1)가 있으면 끝까지 탐색
+    expected = level_synchronous_bfs(csr, start_ids, target_ids + [-1])
+    result = parallel_level_synchronous_bfs(csr, start_ids, target_ids + [-1], processes=2,
+                                            min_parallel_frontier=1)
+    assert_same_result(result, expected)
+    assert not result['found_target']
+
+
+def test_run_with_processes_matches_queue_run(random_graph):
+    graph = random_graph(12, 200, 400)
+    bfs = BFS(graph)
+    expected = bfs.run('n0', ['n7', 'y'])
+    expected = {key: dict(expected[key]) if key in ('parent', 'level', 'source') else expected[key]
+                for key in ('visit_order', 'parent', 'level', 'source', 'found_target')}
+    result = bfs.run('n0', ['n7', 'y'], processes=2)
+
+    for key, value in expected.items():
+        assert result[key] == value, key
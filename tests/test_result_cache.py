@@ -0,0 +1,75 @@
+"""
+탐색 결과 캐시 테스트
+
+추정 크기 기준으로 오래된 결과부터 제거되는지, 캐시보다 큰 결과는 보관하지 않는지,
+그래프가 바뀌어 지문이 달라지면 이전 지문의 결과가 제거되는지 확인합니다.
+"""
+
+from algorithms.bfs import BFS
+from algorithms.trace import SearchTimeline
+from utils.graph_utils import GraphUtils
+from utils.result_cache import SearchResultCache
+
+
+def search_result(graph, start_node):
+    """GUI와 같이 타임라인에 기록한 완료된 탐색 결과"""
+    bfs = BFS(graph)
+    timeline = SearchTimeline('BFS', start_node)
+    for _ in bfs.search_deltas(start_node, trace=timeline):
+        pass
+    return bfs.get_statistics(), timeline
+
+
+def test_evicts_least_recently_used_by_size():
+    graph = GraphUtils.create_sample_graph()
+    results = {node: search_result(graph, node) for node in ('A', 'B', 'C')}
+    size = SearchResultCache.estimate_size(*results['A'])
+
+    # 결과 두 개 남짓만 들어가는 캐시
+    cache = SearchResultCache(max_bytes=size * 2 + size // 2)
+    keys = {node: cache.make_key(graph, 'BFS', node, None) for node in results}
+    cache.put(keys['A'], *results['A'])
+    cache.put(keys['B'], *results['B'])
+    assert cache.get(keys['A']) is not None  # A가 최근에 사용됨
+
+    cache.put(keys['C'], *results['C'])
+    assert cache.get(keys['B']) is None
+    assert cache.get(keys['A']) == results['A']
+    assert cache.get(keys['C']) == results['C']
+    assert len(cache) == 2
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.total_bytes == sum(SearchResultCache.estimate_size(*results[node]) for node in 'AC')
+
+
+def test_rejects_result_larger_than_cache():
+    graph = GraphUtils.create_sample_graph()
+    result = search_result(graph, 'A')
+    cache = SearchResultCache(max_bytes=SearchResultCache.estimate_size(*result) - 1)
+
+    cache.put(cache.make_key(graph, 'BFS', 'A', None), *result)
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_graph_edit_invalidates_previous_fingerprint():
+    graph = GraphUtils.create_sample_graph()
+    other = GraphUtils.create_sample_graph()
+    assert GraphUtils.add_node(other, 'Q', (0, 0))  # 내용이 같은 그래프는 지문도 같음
+    cache = SearchResultCache()
+
+    old_key = cache.make_key(graph, 'BFS', 'A', None)
+    cache.put(old_key, *search_result(graph, 'A'))
+    other_key = cache.make_key(other, 'DFS', 'A', None)
+    cache.put(other_key, *search_result(other, 'A'))
+    assert cache.make_key(graph, 'BFS', 'A', None) == old_key
+
+    assert GraphUtils.add_node(graph, 'Z', (5, 5))
+    assert GraphUtils.add_edge(graph, 'Z', 'A')
+    new_key = cache.make_key(graph, 'BFS', 'A', None)
+
+    assert new_key != old_key
+    assert cache.get(old_key) is None
+    assert cache.get(new_key) is None
+    assert cache.get(other_key) is not None  # 다른 그래프의 결과는 그대로
+    assert len(cache) == 1
+    assert cache.total_bytes == SearchResultCache.estimate_size(*cache.get(other_key))
@@ -0,0 +1,166 @@
+"""
+단계 기록 재생 테스트
+
+탐색 중에 만든 단계 딕셔너리와 SearchTrace/SearchTimeline에서 재구성한 trace[i]가
+모든 단계에서 같은지 확인합니다. (BFS, DFS, 양방향 BFS)
+"""
+
+import os
+
+import networkx as nx
+import pytest
+
+from algorithms.bfs import BFS
+from algorithms.dfs import DFS
+from algorithms.trace import SearchTimeline, StepAction
+from utils.graph_stream import stream_load_graph
+
+SAMPLE_GRAPH = os.path.join(os.path.dirname(__file__), '..', 'examples', 'sample_graph.json')
+
+
+# 'sample'이면 예제 그래프, 정수이면 그 시드의 무작위 그래프 (graph fixture 참고)
+GRAPHS = [
+    pytest.param('sample', id='sample'),
+    *(pytest.param(seed, id=f'random-{seed}') for seed in range(5)),
+]
+
+
+def small_random_graph(random_graph, seed: int) -> nx.Graph:
+    return random_graph(seed, 30, 45, prefix='', extra_component=False)
+
+
+@pytest.fixture
+def graph(request, random_graph) -> nx.Graph:
+    if request.param == 'sample':
+        return stream_load_graph(SAMPLE_GRAPH)
+    return small_random_graph(random_graph, request.param)
+
+
+def normalize(step: dict) -> dict:
+    """방문 집합 구현(set/비트셋)과 관계없이 비교할 수 있도록 변환"""
+    step = dict(step)
+    step['visited'] = set(step['visited'])
+    return step
+
+
+def assert_replay_matches(trace, live_steps):
+    assert len(trace) == len(live_steps)
+    for i, live in enumerate(live_steps):
+        assert normalize(trace[i].to_dict()) == normalize(live), f'단계 {i}'
+    # 순차 재생도 같은 결과
+    assert [normalize(snapshot.to_dict()) for snapshot in trace] == [normalize(s) for s in live_steps]
+
+
+def replay_as_timeline(trace, **kwargs) -> SearchTimeline:
+    """키프레임 간격을 작게 잡은 타임라인에 같은 델타를 다시 기록"""
+    timeline = SearchTimeline(trace.algorithm, trace.start_node, trace.target_node,
+                              trace.distinct_stack, keyframe_interval=3, max_keyframe_bytes=4096, **kwargs)
+    for delta in trace.deltas:
+        timeline.append(delta)
+    return timeline
+
+
+@pytest.mark.parametrize('graph', GRAPHS, indirect=True)
+def test_bfs_replay(graph):
+    nodes = list(graph.nodes())
+    bfs = BFS(graph)
+    live_steps = list(bfs.search(nodes[0], nodes[-1]))
+    assert_replay_matches(bfs.trace, live_steps)
+    assert_replay_matches(replay_as_timeline(bfs.trace), live_steps)
+
+
+@pytest.mark.parametrize('distinct_stack', [False, True])
+@pytest.mark.parametrize('graph', GRAPHS, indirect=True)
+def test_dfs_replay(graph, distinct_stack):
+    nodes = list(graph.nodes())
+    dfs = DFS(graph)
+    live_steps = list(dfs.search(nodes[0], nodes[-1], distinct_stack=distinct_stack))
+    assert_replay_matches(dfs.trace, live_steps)
+    assert_replay_matches(replay_as_timeline(dfs.trace), live_steps)
+
+
+def test_get_step_rebuilds_from_deltas(random_graph):
+    graph = small_random_graph(random_graph, 0)
+    bfs = BFS(graph)
+    deltas = list(bfs.search_deltas('0'))
+    assert bfs.steps == []
+    assert len(deltas) == len(bfs.trace)
+    assert bfs.get_step(len(deltas) - 1)['visit_order'] == bfs.visit_order
+    assert bfs.get_step(len(deltas)) is None
+
+
+def test_timeline_seeks_backwards_and_thins_keyframes(random_graph):
+    graph = small_random_graph(random_graph, 1)
+    bfs = BFS(graph)
+    live_steps = list(bfs.search('0'))
+    timeline = replay_as_timeline(bfs.trace)
+
+    assert timeline.keyframe_bytes <= timeline.max_keyframe_bytes
+    assert timeline.keyframe_interval > 3
+    for i in [len(live_steps) - 1, 0, len(live_steps) // 2, 1, len(live_steps) // 2 - 1]:
+        assert normalize(timeline[i].to_dict()) == normalize(live_steps[i])
+    with pytest.raises(IndexError):
+        timeline[len(live_steps)]
+
+
+@pytest.mark.parametrize('graph', GRAPHS, indirect=True)
+def test_bidirectional_bfs_replay(graph):
+    nodes = list(graph.nodes())
+    bfs = BFS(graph)
+    live_steps = list(bfs.bidirectional_search(nodes[0], nodes[-1]))
+    assert bfs.trace.algorithm == 'BiBFS'
+    assert_replay_matches(bfs.trace, live_steps)
+    assert_replay_matches(replay_as_timeline(bfs.trace), live_steps)
+
+    # 이어 붙인 경로의 레벨이 최단 거리와 같음
+    if nx.has_path(graph, nodes[0], nodes[-1]):
+        assert live_steps[-1]['level'][nodes[-1]] == nx.shortest_path_length(graph, nodes[0], nodes[-1])
+
+
+@pytest.mark.parametrize('graph', GRAPHS, indirect=True)
+def test_multi_source_bfs_replay(graph):
+    nodes = list(graph.nodes())
+    bfs = BFS(graph)
+    live_steps = list(bfs.search(node for node in nodes[:3]))
+    assert_replay_matches(bfs.trace, live_steps)
+    assert all(live_steps[-1]['level'][node] == 0 for node in nodes[:3])
+
+
+def test_tuple_node_ids():
+    graph = nx.grid_2d_graph(3, 3)
+    bfs = BFS(graph)
+    live_steps = list(bfs.search((0, 0), (2, 2)))
+    assert live_steps[-1]['found_target']
+    assert live_steps[-1]['level'][(2, 2)] == 4
+    assert_replay_matches(bfs.trace, live_steps)
+
+    result = BFS(graph).run([(0, 0), (2, 2)])
+    assert result['level'][(1, 1)] == 2
+
+
+def test_bidirectional_tuple_node_ids():
+    graph = nx.grid_2d_graph(3, 3)
+    bfs = BFS(graph)
+    live_steps = list(bfs.bidirectional_search((0, 0), (2, 2)))
+    assert live_steps[-1]['found_target']
+    assert bfs.get_shortest_distance((2, 2)) == 4
+    assert_replay_matches(bfs.trace, live_steps)
+
+
+@pytest.mark.parametrize('start', ['A', ('A',)])
+def test_bidirectional_same_start_and_target(start):
+    graph = nx.Graph([(start, 'B'), ('B', 'C')])
+    bfs = BFS(graph)
+    live_steps = list(bfs.bidirectional_search(start, start))
+    assert len(live_steps) == 1
+    assert_replay_matches(bfs.trace, live_steps)
+
+
+def test_bidirectional_missing_target_is_an_error():
+    bfs = BFS(nx.path_graph(['A', 'B', 'C']))
+    timeline = SearchTimeline('BiBFS', 'A', 'Z')
+    deltas = list(bfs.bidirectional_search_deltas('A', 'Z', trace=timeline))
+    assert [delta.action for delta in deltas] == [StepAction.ERROR]
+    assert deltas[0].backward and 'Z' in deltas[0].message
+    assert len(timeline) == 0
+    assert bfs.visit_order == []
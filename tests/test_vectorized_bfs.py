@@ -0,0 +1,69 @@
+"""
+벡터화 BFS 테스트
+
+run(vectorized=True)와 run(lazy=True)가 큐 기반 run()과 같은 방문 순서, 부모, 레벨,
+가장 가까운 시작 노드를 만드는지, lazy 결과 뷰에서도 조회 메서드가 그대로 동작하는지 확인합니다.
+"""
+
+import networkx as nx
+import pytest
+
+from algorithms.bfs import BFS
+from algorithms.csr import CSRGraph, IdArrayView
+
+RESULT_KEYS = ('visit_order', 'parent', 'level', 'source', 'found_target', 'targets')
+
+
+def snapshot(result):
+    """뷰를 딕셔너리로 바꾼 결과 사본 (이후 run()이 상태를 초기화해도 비교 가능)"""
+    return {key: dict(result[key]) if key in ('parent', 'level', 'source') else result[key]
+            for key in RESULT_KEYS}
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+@pytest.mark.parametrize('start', ['n0', ['n0', 'n7', 'x']])
+@pytest.mark.parametrize('mode', [{'vectorized': True}, {'lazy': True}])
+def test_matches_queue_run(random_graph, seed, start, mode):
+    graph = random_graph(seed, 80, 150)
+    bfs = BFS(graph)
+    expected = snapshot(bfs.run(start))
+    result = bfs.run(start, **mode)
+
+    for key in RESULT_KEYS:
+        assert result[key] == expected[key], key
+    assert list(result['parent']) == list(expected['parent'])
+    assert list(result['level'].items()) == list(expected['level'].items())
+
+
+@pytest.mark.parametrize('mode', [{'vectorized': True}, {'lazy': True}])
+def test_early_stop_matches_queue_run(random_graph, mode):
+    graph = random_graph(4, 80, 150)
+    bfs = BFS(CSRGraph.from_graph(graph))
+    full = bfs.run('n0')
+    targets = [full['visit_order'][10], full['visit_order'][30]]
+
+    expected = snapshot(bfs.run('n0', targets))
+    expected_queue = list(bfs.queue)
+    result = bfs.run('n0', targets, **mode)
+
+    for key in RESULT_KEYS:
+        assert result[key] == expected[key], key
+    assert list(bfs.queue) == expected_queue
+
+
+def test_lazy_result_queries():
+    graph = nx.Graph([('a', 'b'), ('b', 'c'), ('a', 'd'), ('x', 'y')])
+    bfs = BFS(graph)
+    result = bfs.run(['a', 'y'], lazy=True)
+
+    assert isinstance(result['parent'], IdArrayView)
+    assert bfs.get_path_to_node('c') == ['a', 'b', 'c']
+    assert bfs.get_parent('a') is None
+    assert bfs.get_shortest_distance('c') == 2
+    assert bfs.get_nearest_source('x') == 'y'
+    assert bfs.get_nearest_source('missing') is None
+    assert bfs.get_nodes_at_level(1) == ['b', 'd', 'x']
+    assert bfs.level_counts == {0: 2, 1: 3, 2: 1}
+    assert bfs.is_node_visited('c') and not bfs.is_node_visited('missing')
+    assert bfs.get_statistics()['visited_nodes'] == 6
+    assert sorted(bfs.get_tree_edges()) == [('a', 'b'), ('a', 'd'), ('b', 'c'), ('y', 'x')]
@@ -5,5 +5,8 @@
 
 from .graph_utils import GraphUtils
 from .font_utils import FontUtils
+from .graph_fingerprint import GraphFingerprint
+from .result_cache import SearchResultCache
+from .component_index import ComponentIndex
 
-__all__ = ['GraphUtils', 'FontUtils'] 
\ No newline at end of file
+__all__ = ['GraphUtils', 'FontUtils', 'GraphFingerprint', 'SearchResultCache', 'ComponentIndex'] 
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+증분 연결 요소 인덱스 (union-find)
+
+그래프에 분리 집합(disjoint-set) 구조를 붙여 두고 GraphUtils로 노드/간선을 추가할 때마다
+바로 합칩니다. 경로 압축과 크기 기준 합치기를 사용하므로 "두 노드가 연결되어 있는가",
+"연결 요소가 몇 개인가"는 거의 상수 시간 O(α(n))에 답합니다.
+
+간선/노드 제거는 연결 요소를 나눌 수 있지만 분리 집합은 나누기를 지원하지 않으므로,
+다음 질의 때 그래프 전체로 한 번 다시 만듭니다. (고립된 노드 제거는 바로 반영)
+
+인덱스는 지문이 있는 그래프(수정을 GraphUtils가 알려 주는 그래프)에만 보관합니다.
+지문이 없는 그래프는 직접 수정을 알 수 없으므로 질의할 때마다 새로 만듭니다.
+"""
+
+import weakref
+import networkx as nx
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+from .graph_fingerprint import GraphFingerprint
+
+
+class ComponentIndex:
+    """그래프별 연결 요소 분리 집합"""
+
+    # 그래프 -> 인덱스 (그래프가 사라지면 함께 정리됨)
+    _instances: 'weakref.WeakKeyDictionary[nx.Graph, ComponentIndex]' = weakref.WeakKeyDictionary()
+
+    def __init__(self, graph: nx.Graph):
+        """
+        ComponentIndex 초기화 (보통 for_graph()로 얻어서 사용)
+
+        Args:
+            graph: NetworkX 그래프
+        """
+        # 인덱스가 그래프를 붙잡지 않도록 약한 참조로 보관
+        self._graph = weakref.ref(graph)
+        self.parent: Dict[str, str] = {}
+        self.size: Dict[str, int] = {}  # 대표 노드 -> 요소 크기
+        self.count = 0
+        self.largest = 0
+        self.dirty = False
+
+        # 마지막으로 반영한 그래프 지문 버전 (GraphUtils 밖의 수정을 감지)
+        self.version = -1
+        self.rebuild()
+
+    @classmethod
+    def for_graph(cls, graph: nx.Graph) -> 'ComponentIndex':
+        """
+        그래프에 연결된 인덱스 반환 (없으면 생성, 제거나 외부 수정이 있었으면 다시 계산)
+
+        지문이 없는 그래프는 보관하지 않고 매번 새로 만든 인덱스를 반환합니다.
+
+        Args:
+            graph: NetworkX 그래프
+
+        Returns:
+            최신 상태의 ComponentIndex
+        """
+        if GraphFingerprint.get(graph) is None:
+            return cls(graph)
+
+        index = cls._instances.get(graph)
+        if index is None:
+            index = cls(graph)
+            cls._instances[graph] = index
+        elif index.is_stale(graph):
+            index.rebuild()
+        return index
+
+    @classmethod
+    def get(cls, graph: nx.Graph) -> Optional['ComponentIndex']:
+        """이미 연결된 인덱스만 반환 (없으면 None) - 수정 알림용"""
+        return cls._instances.get(graph)
+
+    def rebuild(self):
+        """그래프 전체 노드와 간선으로 다시 만들기"""
+        graph = self._graph()
+        adjacency = graph.adj
+
+        # 간선마다 union하는 대신 BFS로 요소를 한 번에 찾아 모든 노드를 대표 노드에 바로 연결
+        parent: Dict[str, str] = {}
+        size: Dict[str, int] = {}
+        for root in adjacency:
+            if root in parent:
+                continue
+            parent[root] = root
+            queue = deque([root])
+            while queue:
+                for neighbor in adjacency[queue.popleft()]:
+                    if neighbor not in parent:
+                        parent[neighbor] = root
+                        queue.append(neighbor)
+            size[root] = 0
+        for root in parent.values():
+            size[root] += 1
+
+        self.parent = parent
+        self.size = size
+        self.count = len(size)
+        self.largest = max(size.values(), default=0)
+        self.dirty = False
+        self.version = self._stored_version()
+
+    def _stored_version(self) -> int:
+        """그래프에 연결된 지문의 버전 (그래프를 다시 훑지 않음, 지문이 없으면 -1)"""
+        fingerprint = GraphFingerprint.get(self._graph())
+        return fingerprint.version if fingerprint is not None else -1
+
+    def is_stale(self, graph: nx.Graph) -> bool:
+        """
+        다시 만들어야 하는지 (모두 O(1) 확인)
+
+        제거로 요소가 나뉘었을 수 있거나, 지문 버전이 다르거나,
+        GraphUtils 밖에서 노드가 추가/제거되어 노드 수가 다르면 True
+        """
+        return (self.dirty or self.version != self._stored_version()
+                or len(self.parent) != graph.number_of_nodes())
+
+    def _advance(self):
+        """수정 하나를 반영한 뒤 지문 버전 기록 (그 사이 다른 수정이 있었으면 재계산 표시)"""
+        version = self._stored_version()
+        if version != self.version + 1:
+            self.dirty = True
+        self.version = version
+
+    def find(self, node: str) -> str:
+        """노드가 속한 요소의 대표 노드 반환 (경로 압축)"""
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def union(self, u: str, v: str):
+        """두 노드의 요소 합치기 (작은 요소를 큰 요소 아래에 붙임)"""
+        root_u, root_v = self.find(u), self.find(v)
+        if root_u == root_v:
+            return
+        if self.size[root_u] < self.size[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parent[root_v] = root_u
+        self.size[root_u] += self.size.pop(root_v)
+        self.count -= 1
+        self.largest = max(self.largest, self.size[root_u])
+
+    def connected(self, u: str, v: str) -> bool:
+        """두 노드가 같은 연결 요소에 속하는지"""
+        return self.find(u) == self.find(v)
+
+    @property
+    def is_connected(self) -> bool:
+        """그래프 전체가 하나의 연결 요소인지"""
+        return self.count == 1
+
+    def component_size(self, node: str) -> int:
+        """노드가 속한 연결 요소의 노드 수"""
+        return self.size[self.find(node)]
+
+    def add_node(self, node: str):
+        """노드 추가 반영"""
+        self.parent[node] = node
+        self.size[node] = 1
+        self.count += 1
+        self.largest = max(self.largest, 1)
+        self._advance()
+
+    def add_edge(self, u: str, v: str):
+        """간선 추가 반영"""
+        self.union(u, v)
+        self._advance()
+
+    def remove_node(self, node: str, neighbors: Iterable[str]):
+        """노드 제거 반영 (인접 노드가 없던 단독 요소만 바로 제거, 나머지는 다음 질의 때 재계산)"""
+        if any(True for _ in neighbors) or self.dirty or self.size.get(node) != 1:
+            self.dirty = True
+            return
+        del self.parent[node]
+        del self.size[node]
+        self.count -= 1
+        if not self.count:
+            self.largest = 0
+        self._advance()
+
+    def remove_edge(self, u: str, v: str):
+        """간선 제거 반영 (요소가 나뉠 수 있으므로 다음 질의 때 재계산)"""
+        self.dirty = True
@@ -0,0 +1,240 @@
+"""
+메모리 매핑 바이너리 그래프 형식 (.gbin)
+
+JSON 문서 대신 고정 폭 numpy 배열을 64바이트 경계에 맞춰 이어 붙인 파일입니다.
+numpy.memmap으로 열면 배열을 파싱하지 않고 바로 사용하므로 큰 그래프도 즉시 열리고,
+CSR 배열은 파일을 그대로 가리키므로 필요한 페이지만 메모리에 올라옵니다.
+
+파일 구조:
+    헤더    매직(8바이트) + 형식 버전(u32) + 섹션 수(u32)
+    섹션 표  섹션마다 이름(16바이트), dtype(8바이트), 오프셋, 행 수, 열 수(u64)
+    섹션    indptr, indices      CSR 인접 배열 (노드 ID는 노드 이름 정렬 순서, CSRGraph와 동일)
+            label_offsets, label_bytes  노드 ID -> 노드 이름 (UTF-8)
+            node_order           원래 그래프의 노드 순서 (노드 ID 배열)
+            edges                원래 간선 순서의 (source, target) 노드 ID 쌍
+            positions, node_flags  노드 좌표와 data 복원용 플래그
+            extra                위 배열로 표현하지 못한 노드 data (JSON, 대부분 비어 있음)
+
+JSON 형식(examples/sample_graph.json)과 같은 노드/간선/노드 data를 담으므로
+JSON <-> 바이너리 변환에서 내용이 바뀌지 않습니다.
+"""
+
+import json
+import struct
+import networkx as nx
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from algorithms.csr import CSRGraph
+from .graph_stream import stream_load_graph
+
+MAGIC = b'GSAGRAPH'
+BINARY_EXTENSION = '.gbin'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+_HEADER = struct.Struct('<8sII')
+_SECTION = struct.Struct('<16s8sQQQ')
+
+# node_flags 비트
+FLAG_HAS_POS = 1     # data['pos']가 positions에 있음
+FLAG_INT_POS = 2     # 좌표가 정수였음
+FLAG_ID_LABEL = 4    # data['label']이 노드 이름과 같음
+
+
+def _split_node_data(node: str, data: Dict) -> Tuple[int, Tuple[float, float], Optional[Dict]]:
+    """노드 data를 (플래그, 좌표, 배열로 표현하지 못한 나머지)로 분리"""
+    flags = 0
+    pos = (np.nan, np.nan)
+    rest = dict(data)
+
+    # 두 좌표가 모두 float이거나 모두 (float으로 정확히 표현되는) int인 경우만 배열에 저장
+    value = rest.get('pos')
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        if all(type(v) is float for v in value):
+            flags |= FLAG_HAS_POS
+        elif all(type(v) is int and abs(v) < 2 ** 53 for v in value):
+            flags |= FLAG_HAS_POS | FLAG_INT_POS
+        if flags:
+            pos = (float(value[0]), float(value[1]))
+            del rest['pos']
+
+    if rest.get('label') == node:
+        flags |= FLAG_ID_LABEL
+        del rest['label']
+
+    # 키 순서가 바뀌면 그대로 복원하기 위해 나머지로 보관
+    restored = _join_node_data(node, flags, pos, rest)
+    if list(restored) != list(data):
+        return 0, (np.nan, np.nan), dict(data)
+
+    return flags, pos, rest or None
+
+
+def _join_node_data(node: str, flags: int, pos, rest: Optional[Dict]) -> Dict:
+    """_split_node_data()의 역변환"""
+    data = {}
+    if flags & FLAG_HAS_POS:
+        if flags & FLAG_INT_POS:
+            data['pos'] = [int(pos[0]), int(pos[1])]
+        else:
+            data['pos'] = [float(pos[0]), float(pos[1])]
+    if flags & FLAG_ID_LABEL:
+        data['label'] = node
+    if rest:
+        data.update(rest)
+    return data
+
+
+def save_binary(graph: nx.Graph, filename: str):
+    """
+    그래프를 바이너리 형식으로 저장 (노드 이름은 JSON 저장과 같이 문자열로 변환)
+
+    Args:
+        graph: NetworkX 그래프
+        filename: 저장할 파일 경로
+    """
+    if not all(isinstance(node, str) for node in graph.nodes()):
+        graph = nx.relabel_nodes(graph, str)
+
+    csr = CSRGraph.from_graph(graph)
+    index = csr.index
+    num_nodes = csr.number_of_nodes()
+
+    encoded = [label.encode('utf-8') for label in csr.labels]
+    label_offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum([len(label) for label in encoded], out=label_offsets[1:])
+
+    positions = np.full((num_nodes, 2), np.nan, dtype=np.float64)
+    node_flags = np.zeros(num_nodes, dtype=np.uint8)
+    extra = {}
+    for node, data in graph.nodes(data=True):
+        node_id = index[node]
+        node_flags[node_id], positions[node_id], rest = _split_node_data(node, data)
+        if rest:
+            extra[str(node_id)] = rest
+
+    edges = np.fromiter((index[node] for edge in graph.edges() for node in edge),
+                        dtype=csr.indices.dtype, count=2 * graph.number_of_edges()).reshape(-1, 2)
+
+    sections = [
+        ('indptr', csr.indptr),
+        ('indices', csr.indices),
+        ('label_offsets', label_offsets),
+        ('label_bytes', np.frombuffer(b''.join(encoded), dtype=np.uint8)),
+        ('node_order', np.fromiter((index[node] for node in graph.nodes()), dtype=np.int64,
+                                   count=num_nodes)),
+        ('edges', edges),
+        ('positions', positions),
+        ('node_flags', node_flags),
+        ('extra', np.frombuffer(json.dumps(extra, ensure_ascii=False).encode('utf-8'), dtype=np.uint8)),
+    ]
+
+    offset = _align(_HEADER.size + _SECTION.size * len(sections))
+    table = []
+    for name, array in sections:
+        rows, cols = (array.shape + (0,))[:2]
+        table.append(_SECTION.pack(name.encode('ascii'), array.dtype.str.encode('ascii'),
+                                   offset, rows, cols))
+        offset = _align(offset + array.nbytes)
+
+    with open(filename, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        f.write(b''.join(table))
+        for _, array in sections:
+            f.write(b'\0' * (_align(f.tell()) - f.tell()))
+            f.write(np.ascontiguousarray(array).tobytes())
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def is_binary_graph(filename: str) -> bool:
+    """파일이 바이너리 그래프 형식인지 (매직 바이트로 확인)"""
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class BinaryGraph:
+    """numpy.memmap으로 연 바이너리 그래프 파일 (배열은 필요할 때 파일에서 읽힘)"""
+
+    def __init__(self, filename: str):
+        """
+        파일 열기 (헤더와 섹션 표만 읽음)
+
+        Args:
+            filename: 바이너리 그래프 파일 경로
+        """
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            magic, version, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError("바이너리 그래프 파일이 아닙니다.")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 형식 버전입니다: {version}")
+            table = f.read(_SECTION.size * count)
+
+        self.sections: Dict[str, np.ndarray] = {}
+        for i in range(count):
+            name, dtype, offset, rows, cols = _SECTION.unpack_from(table, i * _SECTION.size)
+            shape = (rows, cols) if cols else (rows,)
+            name = name.rstrip(b'\0').decode('ascii')
+            dtype = np.dtype(dtype.rstrip(b'\0').decode('ascii'))
+            if rows == 0:
+                self.sections[name] = np.empty(shape, dtype=dtype)
+            else:
+                self.sections[name] = np.memmap(filename, dtype=dtype, mode='r',
+                                                offset=offset, shape=shape)
+
+    def labels(self) -> List[str]:
+        """노드 ID -> 노드 이름 표"""
+        offsets = self.sections['label_offsets'].tolist()
+        data = self.sections['label_bytes'].tobytes()
+        return [data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+
+    def to_csr(self) -> CSRGraph:
+        """파일을 가리키는 CSR 스냅샷 반환 (인접 배열은 복사하지 않음)"""
+        return CSRGraph(self.sections['indptr'], self.sections['indices'], self.labels())
+
+    def to_networkx(self) -> nx.Graph:
+        """원래 노드/간선 순서와 노드 data를 복원한 NetworkX 그래프 반환"""
+        labels = self.labels()
+        positions = self.sections['positions'].tolist()
+        node_flags = self.sections['node_flags'].tolist()
+        extra = json.loads(self.sections['extra'].tobytes().decode('utf-8'))
+
+        G = nx.Graph()
+        G.add_nodes_from(
+            (labels[node_id], _join_node_data(labels[node_id], node_flags[node_id],
+                                              positions[node_id], extra.get(str(node_id))))
+            for node_id in self.sections['node_order'].tolist()
+        )
+        G.add_edges_from((labels[u], labels[v]) for u, v in self.sections['edges'].tolist())
+        return G
+
+
+def load_binary(filename: str) -> nx.Graph:
+    """바이너리 그래프 파일을 NetworkX 그래프로 로드"""
+    return BinaryGraph(filename).to_networkx()
+
+
+def load_binary_csr(filename: str) -> CSRGraph:
+    """바이너리 그래프 파일을 메모리 매핑된 CSR 스냅샷으로 로드 (탐색/통계 전용, 파싱 없음)"""
+    return BinaryGraph(filename).to_csr()
+
+
+def json_to_binary(json_filename: str, binary_filename: str):
+    """JSON 그래프 파일을 바이너리 형식으로 변환"""
+    save_binary(stream_load_graph(json_filename), binary_filename)
+
+
+def binary_to_json(binary_filename: str, json_filename: str):
+    """바이너리 그래프 파일을 JSON 형식으로 변환 (GraphUtils.save_graph와 같은 구조)"""
+    G = load_binary(binary_filename)
+    data = {
+        'nodes': [{'id': node, 'data': data} for node, data in G.nodes(data=True)],
+        'edges': [{'source': u, 'target': v} for u, v in G.edges()]
+    }
+    with open(json_filename, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,146 @@
+"""
+그래프 내용 지문 및 버전 카운터
+"""
+
+import hashlib
+import weakref
+import networkx as nx
+from typing import Iterable, Optional
+
+from algorithms.neighbor_index import NeighborIndex
+
+# 지문 값은 2^64를 법으로 더함
+_MASK = (1 << 64) - 1
+
+
+def _hash_item(text: str) -> int:
+    """문자열의 64비트 해시"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _node_hash(node) -> int:
+    return _hash_item(repr(node))
+
+
+def _edge_hash(u, v) -> int:
+    a, b = sorted((repr(u), repr(v)))
+    return _hash_item(a + '\0' + b)
+
+
+class GraphFingerprint:
+    """
+    그래프 구조의 지문과 버전 카운터
+
+    지문은 노드 해시의 합과 간선 해시의 합으로 이루어져 있어 순서와 무관하고,
+    노드/간선 하나를 추가하거나 제거할 때 O(1)로 갱신됩니다.
+    버전은 GraphUtils를 통한 수정이 있을 때마다 1씩 증가합니다.
+    """
+
+    # 그래프 -> 지문 (그래프가 사라지면 함께 정리됨)
+    _instances: 'weakref.WeakKeyDictionary[nx.Graph, GraphFingerprint]' = weakref.WeakKeyDictionary()
+
+    def __init__(self, graph: nx.Graph):
+        """
+        그래프 전체를 한 번 해시하여 지문 생성 (보통 for_graph()로 얻어서 사용)
+
+        Args:
+            graph: NetworkX 그래프
+        """
+        self.version = 0
+        self.num_nodes = 0
+        self.num_edges = 0
+        self.node_sum = 0
+        self.edge_sum = 0
+
+        for node in graph.nodes():
+            self.add_node(node)
+        for u, v in graph.edges():
+            self.add_edge(u, v)
+
+        self.version = 0
+
+    @classmethod
+    def for_graph(cls, graph: nx.Graph) -> 'GraphFingerprint':
+        """
+        그래프에 연결된 지문 반환 (없거나 GraphUtils 밖에서 노드 수가 바뀌었으면 다시 계산)
+
+        NetworkX의 number_of_edges()는 O(V)이므로 여기서는 O(1)인 노드 수만 확인합니다.
+        GraphUtils 밖에서 간선만 바꾼 경우는 verify()로 확인합니다.
+
+        Args:
+            graph: NetworkX 그래프
+
+        Returns:
+            GraphFingerprint
+        """
+        fingerprint = cls._instances.get(graph)
+
+        if fingerprint is None:
+            fingerprint = cls(graph)
+            cls._instances[graph] = fingerprint
+            NeighborIndex.track(graph)
+        elif fingerprint.num_nodes != graph.number_of_nodes():
+            fingerprint = cls._recompute(graph, fingerprint)
+
+        return fingerprint
+
+    @classmethod
+    def verify(cls, graph: nx.Graph) -> 'GraphFingerprint':
+        """
+        간선 수까지 확인한 지문 반환 (O(V), 디버그용 또는 GraphUtils 밖에서 간선을 수정한 뒤 호출)
+
+        Args:
+            graph: NetworkX 그래프
+
+        Returns:
+            GraphFingerprint
+        """
+        fingerprint = cls.for_graph(graph)
+        if fingerprint.num_edges != graph.number_of_edges():
+            fingerprint = cls._recompute(graph, fingerprint)
+        return fingerprint
+
+    @classmethod
+    def _recompute(cls, graph: nx.Graph, previous: 'GraphFingerprint') -> 'GraphFingerprint':
+        """그래프 전체를 다시 해시하고 버전은 이어서 증가"""
+        fingerprint = cls(graph)
+        fingerprint.version = previous.version + 1
+        cls._instances[graph] = fingerprint
+        NeighborIndex.track(graph)
+        return fingerprint
+
+    @classmethod
+    def get(cls, graph: nx.Graph) -> Optional['GraphFingerprint']:
+        """이미 연결된 지문만 반환 (없으면 None) - 수정 알림용"""
+        return cls._instances.get(graph)
+
+    @property
+    def digest(self) -> str:
+        """지문 문자열"""
+        return f"{self.num_nodes:x}-{self.num_edges:x}-{self.node_sum:016x}{self.edge_sum:016x}"
+
+    def add_node(self, node):
+        """노드 추가 반영"""
+        self.num_nodes += 1
+        self.node_sum = (self.node_sum + _node_hash(node)) & _MASK
+        self.version += 1
+
+    def remove_node(self, node, neighbors: Iterable):
+        """노드 제거 반영 (함께 제거된 간선 포함)"""
+        for neighbor in neighbors:
+            self.remove_edge(node, neighbor)
+        self.num_nodes -= 1
+        self.node_sum = (self.node_sum - _node_hash(node)) & _MASK
+        self.version += 1
+
+    def add_edge(self, u, v):
+        """간선 추가 반영"""
+        self.num_edges += 1
+        self.edge_sum = (self.edge_sum + _edge_hash(u, v)) & _MASK
+        self.version += 1
+
+    def remove_edge(self, u, v):
+        """간선 제거 반영"""
+        self.num_edges -= 1
+        self.edge_sum = (self.edge_sum - _edge_hash(u, v)) & _MASK
+        self.version += 1
@@ -0,0 +1,179 @@
+"""
+스트리밍 JSON 그래프 로더
+
+json.load는 문서 전체를 파이썬 객체 트리로 만든 뒤에야 그래프를 만들 수 있어
+큰 파일에서는 최종 그래프보다 몇 배 많은 메모리를 사용합니다.
+이 로더는 파일을 일정 크기씩 읽으며 JSONDecoder.raw_decode로 nodes/edges 배열의 항목을
+하나씩 해석하고, chunk_size개씩 모아 add_nodes_from/add_edges_from으로 그래프에 넣습니다.
+메모리 사용량은 최종 그래프 + 읽기 버퍼 + 한 묶음 분량으로 제한됩니다.
+
+문서 구조는 GraphUtils.save_graph와 같습니다. (examples/sample_graph.json 참고)
+nodes가 edges보다 앞에 있어야 노드 순서가 json.load 기반 로드와 같아집니다.
+"""
+
+import codecs
+import json
+import os
+import re
+import networkx as nx
+from typing import Any, Callable, List, Optional, Tuple
+
+# 진행률 콜백: (읽은 바이트 수, 전체 바이트 수)
+ProgressCallback = Callable[[int, int], None]
+
+READ_SIZE = 1 << 20
+CHUNK_SIZE = 10000
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_SEPARATOR = re.compile(r'[ \t\n\r]*,[ \t\n\r]*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+class _JSONStream:
+    """파일을 READ_SIZE씩 읽으며 JSON 토큰과 값을 차례로 해석하는 읽기 도구"""
+
+    def __init__(self, f, total_bytes: int):
+        self._file = f
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._json = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.bytes_read = 0
+        self.total_bytes = total_bytes
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """버퍼에 다음 조각 추가 (이미 해석한 앞부분은 버림, 파일 끝이면 False)"""
+        if self.eof:
+            return False
+        data = self._file.read(READ_SIZE)
+        self.bytes_read += len(data)
+        self.eof = not data
+        self.buffer = self.buffer[self.pos:] + self._decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return not self.eof
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 반환 (파일 끝이면 빈 문자열)"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str):
+        """다음 문자가 char인지 확인하고 건너뜀"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"'{char}'가 필요하지만 '{found}'를 만났습니다. (위치 {self.bytes_read})")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나를 해석하여 반환 (버퍼 끝에서 잘린 값은 더 읽은 뒤 다시 해석)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # 숫자는 끝 표시가 없으므로 버퍼 끝에서 잘렸다면 ('1' + '.5e3') 더 읽은 뒤 다시 해석
+            truncated = end == len(self.buffer) or (isinstance(value, (int, float))
+                                                    and self.buffer[end] in _NUMBER_CHARS)
+            if truncated and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self):
+        """'['부터 ']'까지 배열 항목을 하나씩 반환"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        decode = self._json.raw_decode
+        separator = _SEPARATOR.match
+        while True:
+            # 빠른 경로: 버퍼 안에서 끝나는 항목과 구분자는 공백 확인/재시도 없이 바로 처리
+            try:
+                value, end = decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                value = self.value()
+            else:
+                if end < len(self.buffer) and isinstance(value, (dict, list, str)):
+                    self.pos = end
+                else:
+                    value = self.value()
+            yield value
+
+            match = separator(self.buffer, self.pos)
+            if match and match.end() < len(self.buffer):
+                self.pos = match.end()
+            elif self.peek() == ',':
+                self.pos += 1
+                self.peek()
+            else:
+                self.expect(']')
+                return
+
+
+def stream_load_graph(filename: str, chunk_size: int = CHUNK_SIZE,
+                      progress: Optional[ProgressCallback] = None) -> nx.Graph:
+    """
+    JSON 그래프 파일을 스트리밍 방식으로 로드
+
+    Args:
+        filename: JSON 그래프 파일 경로
+        chunk_size: 그래프에 한 번에 추가할 노드/간선 수
+        progress: 묶음을 추가할 때마다 (읽은 바이트 수, 전체 바이트 수)로 호출되는 콜백
+
+    Returns:
+        NetworkX 그래프 (문서 형식이 잘못되면 ValueError 또는 JSONDecodeError 발생)
+    """
+    G = nx.Graph()
+
+    with open(filename, 'rb') as f:
+        stream = _JSONStream(f, os.path.getsize(filename))
+
+        def report():
+            if progress is not None:
+                progress(stream.bytes_read, stream.total_bytes)
+
+        stream.expect('{')
+        if stream.peek() == '}':
+            return G
+
+        while True:
+            key = stream.value()
+            stream.expect(':')
+
+            if key == 'nodes':
+                batch: List[Tuple[str, dict]] = []
+                for node_data in stream.array_items():
+                    batch.append((node_data['id'], node_data['data']))
+                    if len(batch) >= chunk_size:
+                        G.add_nodes_from(batch)
+                        batch.clear()
+                        report()
+                G.add_nodes_from(batch)
+            elif key == 'edges':
+                batch: List[Tuple[str, str]] = []
+                for edge_data in stream.array_items():
+                    batch.append((edge_data['source'], edge_data['target']))
+                    if len(batch) >= chunk_size:
+                        G.add_edges_from(batch)
+                        batch.clear()
+                        report()
+                G.add_edges_from(batch)
+            else:
+                stream.value()  # 알 수 없는 키는 건너뜀
+
+            if stream.peek() == ',':
+                stream.pos += 1
+            else:
+                stream.expect('}')
+                break
+
+        report()
+
+    return G
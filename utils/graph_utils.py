@@ -5,7 +5,15 @@
 import networkx as nx
 import json
 import os
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
+
+from algorithms.csr import CSRGraph
+from algorithms.neighbor_index import NeighborIndex
+from .graph_fingerprint import GraphFingerprint
+from .component_index import ComponentIndex
+from .graph_stats import graph_stats
+from .graph_binary import BINARY_EXTENSION, save_binary, load_binary, is_binary_graph
+from .graph_stream import ProgressCallback, stream_load_graph
 
 
 class GraphUtils:
@@ -120,6 +128,15 @@ class GraphUtils:
                 return False  # 이미 존재하는 노드
             
             graph.add_node(node_id, pos=pos, label=label or node_id)
+            NeighborIndex.invalidate_nodes(graph, node_id)
+            
+            fingerprint = GraphFingerprint.get(graph)
+            if fingerprint is not None:
+                fingerprint.add_node(node_id)
+            
+            components = ComponentIndex.get(graph)
+            if components is not None:
+                components.add_node(node_id)
             return True
         except Exception:
             return False
@@ -135,6 +152,15 @@ class GraphUtils:
                 return False  # 이미 존재하는 간선
             
             graph.add_edge(node1, node2)
+            NeighborIndex.invalidate_nodes(graph, node1, node2)
+            
+            fingerprint = GraphFingerprint.get(graph)
+            if fingerprint is not None:
+                fingerprint.add_edge(node1, node2)
+            
+            components = ComponentIndex.get(graph)
+            if components is not None:
+                components.add_edge(node1, node2)
             return True
         except Exception:
             return False
@@ -146,7 +172,17 @@ class GraphUtils:
             if node_id not in graph:
                 return False
             
+            neighbors = list(graph.neighbors(node_id))
             graph.remove_node(node_id)
+            NeighborIndex.invalidate_nodes(graph, node_id, *neighbors)
+            
+            fingerprint = GraphFingerprint.get(graph)
+            if fingerprint is not None:
+                fingerprint.remove_node(node_id, neighbors)
+            
+            components = ComponentIndex.get(graph)
+            if components is not None:
+                components.remove_node(node_id, neighbors)
             return True
         except Exception:
             return False
@@ -159,6 +195,15 @@ class GraphUtils:
                 return False
             
             graph.remove_edge(node1, node2)
+            NeighborIndex.invalidate_nodes(graph, node1, node2)
+            
+            fingerprint = GraphFingerprint.get(graph)
+            if fingerprint is not None:
+                fingerprint.remove_edge(node1, node2)
+            
+            components = ComponentIndex.get(graph)
+            if components is not None:
+                components.remove_edge(node1, node2)
             return True
         except Exception:
             return False
@@ -179,8 +224,12 @@ class GraphUtils:
     
     @staticmethod
     def save_graph(graph: nx.Graph, filename: str) -> bool:
-        """그래프를 JSON 파일로 저장"""
+        """그래프를 JSON 파일로 저장 (확장자가 .gbin이면 메모리 매핑 바이너리 형식)"""
         try:
+            if filename.lower().endswith(BINARY_EXTENSION):
+                save_binary(graph, filename)
+                return True
+            
             # NetworkX 그래프를 JSON 형태로 변환
             data = {
                 'nodes': [
@@ -208,39 +257,83 @@ class GraphUtils:
             return False
     
     @staticmethod
-    def load_graph(filename: str) -> Optional[nx.Graph]:
-        """JSON 파일에서 그래프 로드"""
+    def load_graph(filename: str, progress: Optional[ProgressCallback] = None) -> Optional[nx.Graph]:
+        """
+        JSON 파일에서 그래프 로드 (바이너리 형식 파일은 자동으로 인식)
+        
+        JSON 문서 전체를 메모리에 올리지 않고 노드/간선을 묶음 단위로 읽어 추가합니다.
+        
+        Args:
+            filename: 그래프 파일 경로
+            progress: JSON 로드 중 (읽은 바이트 수, 전체 바이트 수)로 호출되는 콜백
+            
+        Returns:
+            NetworkX 그래프 또는 None
+        """
         try:
             if not os.path.exists(filename):
                 return None
             
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            G = nx.Graph()
-            
-            # 노드 추가
-            for node_data in data['nodes']:
-                G.add_node(node_data['id'], **node_data['data'])
+            if is_binary_graph(filename):
+                return load_binary(filename)
             
-            # 간선 추가
-            for edge_data in data['edges']:
-                G.add_edge(edge_data['source'], edge_data['target'])
-            
-            return G
+            return stream_load_graph(filename, progress=progress)
         except Exception as e:
             print(f"그래프 로드 실패: {e}")
             return None
     
     @staticmethod
-    def get_graph_stats(graph: nx.Graph) -> Dict[str, int]:
-        """그래프 통계 정보 반환"""
-        return {
-            'nodes': graph.number_of_nodes(),
-            'edges': graph.number_of_edges(),
-            'components': nx.number_connected_components(graph),
-            'max_degree': max(dict(graph.degree()).values()) if graph.nodes() else 0
-        }
+    def get_graph_stats(graph: Union[nx.Graph, CSRGraph]) -> Dict:
+        """
+        그래프 통계 정보 반환 (희소 인접 행렬 기반 벡터화 계산, 바뀌지 않은 그래프는 캐시 사용)
+        
+        Args:
+            graph: NetworkX 그래프 또는 CSR 스냅샷
+            
+        Returns:
+            nodes, edges, components, max_degree와 차수 분포, 연결 요소 크기,
+            고립 노드 수, 밀도를 담은 딕셔너리 (graph_stats.compute_stats() 참고)
+        """
+        return graph_stats(graph)
+    
+    @staticmethod
+    def compute_fingerprint(graph: nx.Graph) -> str:
+        """
+        그래프 구조(노드, 간선)의 내용 지문을 처음부터 계산
+        
+        같은 노드와 간선을 가진 그래프는 생성 순서와 관계없이 같은 지문을 가집니다.
+        
+        Args:
+            graph: NetworkX 그래프
+            
+        Returns:
+            지문 문자열
+        """
+        return GraphFingerprint(graph).digest
+    
+    @staticmethod
+    def get_fingerprint(graph: nx.Graph) -> str:
+        """
+        그래프 지문 반환 (처음 호출할 때 그래프 전체를 한 번 해시, 이후 GraphUtils로 수정하면 O(1))
+        
+        지문을 만든 뒤에는 그래프를 GraphUtils의 add_node/add_edge/remove_node/remove_edge로만
+        수정해야 합니다. 직접 수정한 경우 노드 수가 바뀌면 다시 계산하지만, 간선만 바뀐 경우는
+        감지하지 못해 지문 기준 캐시(SearchResultCache, 통계, 인접 노드 인덱스)가 이전 결과를
+        돌려줄 수 있습니다. 간선 수가 바뀐 경우는 GraphFingerprint.verify()로 다시 계산되지만,
+        간선 수가 같은 교체는 compute_fingerprint()로만 확인할 수 있습니다.
+        
+        Args:
+            graph: NetworkX 그래프
+            
+        Returns:
+            compute_fingerprint()와 같은 값의 지문 문자열
+        """
+        return GraphFingerprint.for_graph(graph).digest
+    
+    @staticmethod
+    def get_graph_version(graph: nx.Graph) -> int:
+        """그래프 버전 반환 (GraphUtils로 수정할 때마다 증가)"""
+        return GraphFingerprint.for_graph(graph).version
     
     @staticmethod
     def check_connectivity(graph: nx.Graph, start_node: str, target_node: str) -> Dict:
@@ -265,26 +358,32 @@ class GraphUtils:
                     'error': '노드가 그래프에 존재하지 않습니다.'
                 }
             
-            # 연결성 확인
-            is_connected = nx.is_connected(graph)
+            # 연결성, 요소 수, 가장 큰 요소 크기는 증분 연결 요소 인덱스에서 바로 읽음
+            components = ComponentIndex.for_graph(graph)
+            
+            # 같은 요소일 때만 양방향 탐색 (두 탐색이 만나면 종료하므로 요소 전체를 훑지 않음)
+            shortest_path = None
+            if components.connected(start_node, target_node):
+                try:
+                    shortest_path = nx.bidirectional_shortest_path(graph, start_node, target_node)
+                except nx.NetworkXNoPath:
+                    # GraphUtils 밖에서 간선이 제거된 경우 - 인덱스를 다시 만들어 요소 정보 갱신
+                    components.rebuild()
             
-            # 경로 존재 여부 확인
-            try:
-                shortest_path = nx.shortest_path(graph, start_node, target_node)
+            if shortest_path is not None:
                 distance = len(shortest_path) - 1
                 path_exists = True
-            except nx.NetworkXNoPath:
-                shortest_path = None
+            else:
                 distance = float('inf')
                 path_exists = False
             
             return {
-                'connected': is_connected,
+                'connected': components.is_connected,
                 'path_exists': path_exists,
                 'shortest_path': shortest_path,
                 'distance': distance,
-                'total_components': nx.number_connected_components(graph),
-                'nodes_in_largest_component': len(max(nx.connected_components(graph), key=len)) if graph.nodes() else 0
+                'total_components': components.count,
+                'nodes_in_largest_component': components.largest
             }
             
         except Exception as e:
@@ -0,0 +1,124 @@
+"""
+탐색 결과 LRU 캐시
+"""
+
+import sys
+import weakref
+import networkx as nx
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from algorithms.trace import SearchTimeline
+from .graph_utils import GraphUtils
+
+
+class SearchResultCache:
+    """
+    (그래프 지문, 알고리즘, 시작 노드, 목표 노드) -> 완료된 탐색 결과를 보관하는 LRU 캐시
+
+    탐색 통계와 단계 타임라인만 보관하고 BFS/DFS 객체는 보관하지 않으므로
+    캐시된 결과가 그래프를 붙잡아 두지 않습니다.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        캐시 초기화
+
+        Args:
+            max_bytes: 캐시가 사용할 최대 메모리 (추정치, 바이트)
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: 'OrderedDict[Tuple, Tuple[Dict, SearchTimeline, int]]' = OrderedDict()
+
+        # 그래프 -> 마지막으로 본 지문 (그래프가 바뀌면 이전 지문의 결과를 제거)
+        self._graph_fingerprints: 'weakref.WeakKeyDictionary[nx.Graph, str]' = weakref.WeakKeyDictionary()
+
+    def make_key(self, graph: nx.Graph, algorithm: str, start_node: str,
+                 target_node: Optional[str]) -> Tuple:
+        """
+        캐시 키 생성 (그래프 내용이 바뀌었으면 이전 결과를 무효화)
+
+        Args:
+            graph: NetworkX 그래프
+            algorithm: 'BFS' 또는 'DFS'
+            start_node: 시작 노드
+            target_node: 목표 노드
+
+        Returns:
+            캐시 키
+        """
+        fingerprint = GraphUtils.get_fingerprint(graph)
+
+        previous = self._graph_fingerprints.get(graph)
+        if previous is not None and previous != fingerprint:
+            self.invalidate(previous)
+        self._graph_fingerprints[graph] = fingerprint
+
+        return (fingerprint, algorithm, start_node, target_node)
+
+    def get(self, key: Tuple) -> Optional[Tuple[Dict, SearchTimeline]]:
+        """
+        캐시된 결과 반환
+
+        Returns:
+            (탐색 통계, 단계 타임라인) 또는 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    def put(self, key: Tuple, statistics: Dict, timeline: SearchTimeline):
+        """
+        완료된 탐색 결과 저장 (용량을 넘으면 오래된 결과부터 제거)
+
+        Args:
+            key: make_key()로 만든 키
+            statistics: 탐색이 끝난 BFS/DFS 객체의 get_statistics() 결과
+            timeline: 탐색 단계 타임라인
+        """
+        size = self.estimate_size(statistics, timeline)
+        if size > self.max_bytes:
+            return  # 캐시 전체보다 큰 결과는 보관하지 않음
+
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key)[2]
+
+        self._entries[key] = (statistics, timeline, size)
+        self.total_bytes += size
+
+        while self.total_bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def invalidate(self, fingerprint: str):
+        """특정 그래프 지문의 결과 모두 제거"""
+        for key in [key for key in self._entries if key[0] == fingerprint]:
+            self.total_bytes -= self._entries.pop(key)[2]
+
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def estimate_size(statistics: Dict, timeline: SearchTimeline) -> int:
+        """
+        결과가 차지하는 메모리 추정 (노드 문자열은 타임라인에서 한 번만 셈)
+
+        Args:
+            statistics: 탐색 통계
+            timeline: 탐색 단계 타임라인
+
+        Returns:
+            추정 바이트 수
+        """
+        size = timeline.estimate_size() + sys.getsizeof(statistics)
+        size += sum(sys.getsizeof(value) for value in statistics.values())
+        return size